@@ -0,0 +1,122 @@
+# benchmarks/session_model.py
+"""Compare session dicts with the Session model.
+
+Measures per-session memory and encode/decode throughput (json dicts versus
+Session.encode/decode). Run from the repository root:
+
+    python benchmarks/session_model.py [--sessions N]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cogs.session_model import Session  # noqa: E402
+
+SNOWFLAKE_BASE = 1_100_000_000_000_000_000
+
+
+def snowflake(rng):
+    return SNOWFLAKE_BASE + rng.randrange(10 ** 17)
+
+
+def sample_document(rng, index):
+    """A session document shaped like the ones /recruit stores."""
+    player_count = rng.randint(2, 10)
+    joined = {snowflake(rng) for _ in range(rng.randint(1, player_count))}
+    return {
+        "guild_id": snowflake(rng),
+        "creator_id": snowflake(rng),
+        "game_name": rng.choice(["Valorant", "Apex Legends", "Minecraft", "Helldivers 2", "Rocket League"]),
+        "player_count": player_count,
+        "game_time": rng.choice(["now", "9pm", "in 2 hours", "tomorrow 8:15 pm PST"]),
+        "vc_id": snowflake(rng),
+        "text_channel_id": snowflake(rng),
+        "joined_users": sorted(joined),
+        "remaining_spots": player_count - len(joined),
+        "allowed_channel_id": snowflake(rng),
+        "notify_channel_id": snowflake(rng),
+        "embed": {
+            "title": f"Session #{index}",
+            "description": "Looking for players!",
+            "color": 5814783,
+            "fields": [{"name": "Players", "value": "", "inline": False}],
+        },
+        "notify_message_id": snowflake(rng),
+        "recruitment_message_id": snowflake(rng),
+        "followup_message_id": snowflake(rng),
+        "followup_channel_id": snowflake(rng),
+        "start_time": time.time(),
+        "scheduled_start": None,
+        "hours_playing": rng.randint(1, 6),
+    }
+
+
+def measure_memory(build, count):
+    """Bytes allocated per object by `build(i)`, kept alive until measured."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = [build(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+    return total / count
+
+
+def measure_rate(func, items, rounds=3):
+    """Best items-per-second of `func` over `items`."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for item in items:
+            func(item)
+        best = min(best, time.perf_counter() - started)
+    return len(items) / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20000, help="Number of sample sessions")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    documents = [sample_document(rng, i) for i in range(args.sessions)]
+    sessions = [Session.from_document(f"s{i}", doc) for i, doc in enumerate(documents)]
+
+    def as_dict(i):
+        # The in-memory dicts kept the roster as a set
+        entry = dict(documents[i])
+        entry["joined_users"] = set(entry["joined_users"])
+        return entry
+
+    dict_bytes = measure_memory(as_dict, args.sessions)
+    session_bytes = measure_memory(lambda i: Session.from_document(f"s{i}", documents[i]), args.sessions)
+
+    json_blobs = [json.dumps(doc).encode("utf-8") for doc in documents]
+    binary_blobs = [session.encode() for session in sessions]
+
+    rows = [
+        ("memory / session (bytes)", f"{dict_bytes:,.0f}", f"{session_bytes:,.0f}"),
+        ("encoded size (bytes)",
+         f"{sum(map(len, json_blobs)) / len(json_blobs):,.0f}",
+         f"{sum(map(len, binary_blobs)) / len(binary_blobs):,.0f}"),
+        ("encode (sessions/s)",
+         f"{measure_rate(lambda doc: json.dumps(doc).encode('utf-8'), documents):,.0f}",
+         f"{measure_rate(Session.encode, sessions):,.0f}"),
+        ("decode (sessions/s)",
+         f"{measure_rate(json.loads, json_blobs):,.0f}",
+         f"{measure_rate(Session.decode, binary_blobs):,.0f}"),
+    ]
+    print(f"{args.sessions} sessions")
+    print(f"{'':28}{'dict + json':>16}{'Session':>16}")
+    for label, dict_value, session_value in rows:
+        print(f"{label:28}{dict_value:>16}{session_value:>16}")
+
+
+if __name__ == "__main__":
+    main()
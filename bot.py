@@ -1,10 +1,15 @@
 # bot.py (Updated)
+import time
+BOOT_STARTED = time.perf_counter()  # Boot phases are measured from here
+
 import os
+import sys
 from discord.ext import commands
 from dotenv import load_dotenv
 import asyncio
 from enum import IntEnum
 from discord import Intents, Game
+from cogs.command_sync import repair_command_tree, sync_command_tree
 
 class InteractionContextType(IntEnum):
     GUILD = 0
@@ -12,15 +17,76 @@ class InteractionContextType(IntEnum):
     PRIVATE_CHANNEL = 2
 
 
-# Import the reset_usage function
-from cogs.reset_manager import reset_usage
+# Cog extensions are imported by load_cogs, not here. py-cord executes an
+# extension's module afresh when loading it, so a cog imported before it is
+# loaded would end up as two copies with separate state.
+
+# Storage client first; everything else reads through it
+STORAGE_EXTENSIONS = [
+    'cogs.firestore',
+    'cogs.storage',            # Circuit breaker in front of Firestore
+]
+# Ordered so every cog is loaded before any other cog imports it
+EXTENSIONS = [
+    'cogs.fair_scheduler',     # Per-guild fair share of handler slots
+    'cogs.session_archive',    # Day-partitioned archive of finished sessions
+    'cogs.game_index',         # In-memory game name autocomplete
+    'cogs.vc_pool',            # Warm voice channel pool
+    'cogs.session_scheduler',  # Deferred channels for scheduled sessions
+    'cogs.usage_stats',        # Rolling per-guild usage stats and /scout_stats
+    'cogs.recruitment',
+    'cogs.voice_monitor',      # Auto-end sessions with empty voice channels
+    'cogs.notify_digest',      # Optional pinned "Active sessions" digest
+    'cogs.session_list',       # /sessions listing from the in-memory index
+    'cogs.orphan_reaper',      # Deletes channels and messages no live session owns
+    'cogs.warm_start',         # Periodic cache snapshot for fast restarts
+    'cogs.reloader',           # /reload with live state handoff
+    'cogs.setup',
+    'cogs.upgrade',            # The new upgrade cog
+    'cogs.image_upload',       # The custom image cog
+    'cogs.entitlement_sync',
+    'cogs.role_restrictions',
+    'cogs.help',               # Add the Help cog here
+    'cogs.broadcast',          # Load the new broadcast cog
+    'cogs.check_entitle',
+]
+# No slash commands and nothing to do before ready, so loaded after it
+DEFERRED_EXTENSIONS = [
+    'cogs.welcome',
+]
+
+boot_phases = []      # (phase, seconds) in the order they finished
+extension_times = {}  # extension -> seconds spent loading it
+failed_extensions = {}  # extension -> error
+_phase_started = BOOT_STARTED
+_boot_reported = False
+
+
+def end_phase(name: str):
+    """Close the current boot phase and start timing the next one."""
+    global _phase_started
+    now = time.perf_counter()
+    boot_phases.append((name, now - _phase_started))
+    _phase_started = now
+
+
+def boot_report() -> str:
+    total = sum(seconds for _, seconds in boot_phases)
+    lines = [f"Boot took {total:.2f}s from start to ready:"]
+    lines += [f"  {name}: {seconds:.2f}s" for name, seconds in boot_phases]
+    slowest = sorted(extension_times.items(), key=lambda item: item[1], reverse=True)[:3]
+    if slowest:
+        lines.append("  slowest cogs: " + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in slowest))
+    if failed_extensions:
+        lines.append("  failed to load: " + ", ".join(sorted(failed_extensions)))
+    return "\n".join(lines)
+
 
 # Load environment variables
 load_dotenv()
 TOKEN = os.getenv('DISCORD_RECRUITMENT_BOT_TOKEN')  # Your bot's token
 
 # Define intents
-from discord import Intents
 intents = Intents.default()
 intents.messages = True
 intents.message_content = True
@@ -29,33 +95,73 @@ intents.guilds = True
 intents.members = True
 
 # Initialize the bot
-bot = commands.Bot(command_prefix='/', intents=intents)
+# Commands are synced by on_connect_sync, and only when the command tree changed
+bot = commands.Bot(command_prefix='/', intents=intents, auto_sync_commands=False)
+end_phase("imports")
+
+
+def load_extensions(names) -> int:
+    """Load each extension on its own so one failing cog doesn't stop the rest."""
+    loaded = 0
+    for name in names:
+        if name in sys.modules:
+            # Whoever imported it first keeps a separate copy of its module state
+            print(f"Warning: {name} was imported before its extension loaded; check EXTENSIONS order.")
+        started = time.perf_counter()
+        try:
+            bot.load_extension(name)
+            loaded += 1
+        except Exception as e:
+            failed_extensions[name] = e
+            print(f"Failed to load {name}: {e}")
+        extension_times[name] = time.perf_counter() - started
+    return loaded
+
 
 def load_cogs():
-    try:
-        bot.load_extension('cogs.firestore')
-        bot.load_extension('cogs.recruitment')
-        bot.load_extension('cogs.setup')
-        bot.load_extension('cogs.upgrade')        # The new upgrade cog
-        bot.load_extension('cogs.image_upload')   # The custom image cog
-        bot.load_extension('cogs.entitlement_sync')
-        bot.load_extension("cogs.role_restrictions")
-        bot.load_extension('cogs.welcome')
-        bot.load_extension("cogs.help")  # Add the Help cog here
-        bot.load_extension('cogs.broadcast')  # Load the new broadcast cog
-        bot.load_extension("cogs.check_entitle")
+    load_extensions(STORAGE_EXTENSIONS)
+    end_phase("storage client init")
+    load_extensions(EXTENSIONS)
+    end_phase("cog setup")
+    if failed_extensions:
+        print(f"Cogs loaded with {len(failed_extensions)} failure(s).")
+    else:
         print("Cogs loaded successfully.")
+
+
+@bot.listen('on_connect')
+async def on_connect_sync():
+    if not any(name == "gateway connect" for name, _ in boot_phases):
+        end_phase("gateway connect")
+    try:
+        await sync_command_tree(bot)
     except Exception as e:
-        print(f"Failed to load cogs: {e}")
+        print(f"Failed to sync commands: {e}")
+
+
+@bot.listen('on_unknown_application_command')
+async def on_unknown_command(interaction):
+    # A command Discord knows but we have no ID for: the cached tree is stale
+    await repair_command_tree(bot)
+
 
 @bot.event
 async def on_ready():
+    global _boot_reported
     print(f"Bot is online as {bot.user}")
+    if not _boot_reported:
+        _boot_reported = True
+        end_phase("ready")
+        print(boot_report())
+        load_extensions(name for name in DEFERRED_EXTENSIONS if name not in bot.extensions)
+
     # Set the bot's status to "Beta V 0.1.0"
     await bot.change_presence(activity=Game(name="Beta V 0.1.0"))
 
     # Start the reset_usage task
-    firestore_cog = bot.get_cog('FirestoreCog')
+    from cogs.reset_manager import reset_usage
+    from cogs.storage import get_storage
+    firestore_cog = get_storage(bot)
     if firestore_cog:
         bot.loop.create_task(reset_usage(firestore_cog))
         print("Reset usage task started.")
@@ -64,7 +170,17 @@ async def on_ready():
 
 def main():
     load_cogs()  # Load cogs (including entitlement_sync) synchronously
+    # Imported once its extension is loaded, so this is the module the cog uses
+    from cogs.warm_start import load_snapshot, save_snapshot
+    from cogs.usage_stats import flush_usage_now
+    from cogs.storage import get_storage
+    load_snapshot()  # Warm the caches before the gateway connects
+    end_phase("snapshot load")
     bot.run(TOKEN)  # Run the bot
+    save_snapshot()  # Snapshot once more on a clean shutdown
+    firestore_cog = get_storage(bot)
+    if firestore_cog:
+        flush_usage_now(firestore_cog)  # Usage counters since the last flush
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,105 @@
+# cogs/channel_ledger.py
+import json
+import os
+import time
+import uuid
+
+CHANNEL_LEDGER_PATH = os.getenv("SCOUT_CHANNEL_LEDGER_PATH", "cache/session_channels.json")
+NAME_MATCH_SECONDS = 300        # A claimed name matches a channel created this close to the claim
+CLAIM_MAX_AGE_SECONDS = 7 * 86400  # Claims nothing has released are forgotten after this
+
+
+class ChannelLedger:
+    """Crash-safe record of the session voice channels the bot is setting up or tearing down.
+
+    A claim is written before a session's channel is created (by name, as
+    the ID isn't known yet, then bound to the ID) and released once the
+    session owning it is stored. Teardown claims the channel again before
+    the session is removed and releases it once the channel is gone. A
+    claim that survives a restart marks a channel as the bot's own, so the
+    orphan reaper can delete it without touching channels admins made.
+    """
+
+    def __init__(self, path: str = CHANNEL_LEDGER_PATH):
+        self.path = path
+        self._claims = None  # token -> {"guild_id", "name", "channel_id", "at"}, read on first use
+
+    @property
+    def claims(self) -> dict:
+        if self._claims is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as ledger_file:
+                    self._claims = json.load(ledger_file)
+            except FileNotFoundError:
+                self._claims = {}
+            except (OSError, ValueError) as e:
+                print(f"Error reading channel ledger: {e}")
+                self._claims = {}
+        return self._claims
+
+    def _write(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as ledger_file:
+                json.dump(self.claims, ledger_file)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"Error writing channel ledger: {e}")
+
+    def claim(self, guild_id, name: str = None, channel_id: int = None) -> str:
+        """Record a channel the bot is about to create (by name) or tear down (by ID)."""
+        token = uuid.uuid4().hex
+        self.claims[token] = {"guild_id": int(guild_id), "name": name, "channel_id": channel_id, "at": time.time()}
+        self._write()
+        return token
+
+    def bind(self, token: str, channel_id: int):
+        """Attach the ID of the channel a name claim was made for."""
+        claim = self.claims.get(token)
+        if claim is not None:
+            claim["channel_id"] = channel_id
+            self._write()
+
+    def release(self, token: str):
+        if self.claims.pop(token, None) is not None:
+            self._write()
+
+    def release_channel(self, channel_id: int):
+        """Drop every claim on a channel (its session is stored, or the channel is gone)."""
+        tokens = [token for token, claim in self.claims.items() if claim["channel_id"] == channel_id]
+        for token in tokens:
+            del self.claims[token]
+        if tokens:
+            self._write()
+
+    def owns(self, guild_id: int, channel) -> bool:
+        """Whether a claim marks `channel` as a session channel the bot made."""
+        created_at = channel.created_at.timestamp()
+        for claim in self.claims.values():
+            if claim["guild_id"] != guild_id:
+                continue
+            if claim["channel_id"] == channel.id:
+                return True
+            # Crashed between creating the channel and binding its ID
+            if (
+                claim["channel_id"] is None and claim["name"] == channel.name
+                and abs(created_at - claim["at"]) <= NAME_MATCH_SECONDS
+            ):
+                return True
+        return False
+
+    def prune(self, now: float = None) -> int:
+        """Forget claims older than CLAIM_MAX_AGE_SECONDS. Returns how many were dropped."""
+        cutoff = (time.time() if now is None else now) - CLAIM_MAX_AGE_SECONDS
+        stale = [token for token, claim in self.claims.items() if claim["at"] < cutoff]
+        for token in stale:
+            del self.claims[token]
+        if stale:
+            self._write()
+        return len(stale)
+
+
+channel_ledger = ChannelLedger()
@@ -0,0 +1,114 @@
+# cogs/command_sync.py
+import hashlib
+import json
+import os
+import time
+
+COMMAND_CACHE_PATH = os.getenv("SCOUT_COMMAND_CACHE_PATH", "cache/command_tree.json")
+RESYNC_COOLDOWN_SECONDS = 300  # At most one repair sync per window for unknown commands
+
+# top-level command name -> command ID (as a string, like Discord sends it)
+_command_ids = {}
+_last_repair = 0.0
+
+
+def command_tree_hash(bot) -> str:
+    """Hash of the application command payloads the bot would register."""
+    payloads = sorted(
+        (json.dumps(command.to_dict(), sort_keys=True, default=str) for command in bot.pending_application_commands)
+    )
+    return hashlib.sha256("\n".join(payloads).encode("utf-8")).hexdigest()
+
+
+def _read_cache(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        print(f"Error reading command cache: {e}")
+        return {}
+
+
+def _write_cache(path: str, cache: dict):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as cache_file:
+        json.dump(cache, cache_file)
+    os.replace(temp_path, path)
+
+
+def apply_command_ids(bot, ids: dict) -> int:
+    """Attach known IDs to the bot's commands so interactions route without a sync.
+
+    py-cord routes interactions by command ID and only learns the IDs while
+    syncing, so a skipped sync has to fill them in itself.
+    """
+    applied = 0
+    for command in bot.pending_application_commands:
+        command_id = ids.get(command.name)
+        if command_id:
+            command.id = command_id
+            bot._application_commands[command_id] = command
+            applied += 1
+    _command_ids.clear()
+    _command_ids.update(ids)
+    return applied
+
+
+def _registered_ids(bot) -> dict:
+    return {
+        command.name: str(command.id)
+        for command in bot.pending_application_commands
+        if getattr(command, "id", None)
+    }
+
+
+async def sync_command_tree(bot, force: bool = False, path: str = COMMAND_CACHE_PATH) -> bool:
+    """Sync slash commands with Discord only when the command tree changed.
+
+    The tree's hash and the resulting command IDs are cached per
+    application. When the hash matches, the cached IDs are attached and no
+    REST calls are made. Returns True if a sync was performed.
+    """
+    tree_hash = command_tree_hash(bot)
+    application_id = str(getattr(bot, "application_id", None) or bot.user.id)
+    cache = _read_cache(path)
+    if not force and cache.get("application_id") == application_id and cache.get("hash") == tree_hash:
+        ids = cache.get("ids", {})
+        if apply_command_ids(bot, ids) == len(bot.pending_application_commands):
+            print(f"Command tree unchanged; skipped sync ({len(ids)} commands).")
+            return False
+
+    started = time.perf_counter()
+    await bot.sync_commands()
+    ids = _registered_ids(bot)
+    _command_ids.clear()
+    _command_ids.update(ids)
+    try:
+        _write_cache(path, {"application_id": application_id, "hash": tree_hash, "ids": ids})
+    except OSError as e:
+        print(f"Error writing command cache: {e}")
+    print(f"Synced {len(ids)} commands in {time.perf_counter() - started:.2f}s.")
+    return True
+
+
+async def repair_command_tree(bot):
+    """Force a sync after Discord sent a command the bot didn't recognize (stale cache)."""
+    global _last_repair
+    if time.time() - _last_repair < RESYNC_COOLDOWN_SECONDS:
+        return
+    _last_repair = time.time()
+    try:
+        await sync_command_tree(bot, force=True)
+    except Exception as e:
+        print(f"Error re-syncing commands: {e}")
+
+
+def command_mention(name: str) -> str:
+    """Clickable mention for a slash command ("</name:id>"), or "/name" until its ID is known."""
+    command_id = _command_ids.get(name.split()[0])
+    return f"</{name}:{command_id}>" if command_id else f"/{name}"
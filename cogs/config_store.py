@@ -0,0 +1,86 @@
+# cogs/config_store.py
+import asyncio
+
+# guild_id -> last known configuration dict
+_configs = {}
+# guild_id -> lock serializing read-merge-write updates for that guild
+_locks = {}
+# Guilds whose cached config came from the warm-start snapshot and hasn't been re-read yet
+_unverified = set()
+
+
+def _lock_for(guild_id: int) -> asyncio.Lock:
+    lock = _locks.get(guild_id)
+    if lock is None:
+        lock = _locks[guild_id] = asyncio.Lock()
+    return lock
+
+
+def cached_config(guild_id) -> dict:
+    """Return the cached configuration for a guild without touching storage (or None)."""
+    return _configs.get(int(guild_id))
+
+
+async def load_config(firestore_cog, guild_id, refresh: bool = False) -> dict:
+    """Load a guild's configuration, serving it from memory when cached."""
+    guild_id = int(guild_id)
+    if not refresh and guild_id in _configs:
+        if guild_id in _unverified:
+            # Serve the snapshot now and re-read it in the background
+            _unverified.discard(guild_id)
+            asyncio.create_task(_revalidate(firestore_cog, guild_id))
+        return _configs[guild_id]
+
+    config = await firestore_cog.load_config(guild_id)
+    if config:
+        _configs[guild_id] = config
+    return config
+
+
+async def _revalidate(firestore_cog, guild_id: int):
+    try:
+        async with _lock_for(guild_id):
+            config = await firestore_cog.load_config(guild_id)
+            if config:
+                _configs[guild_id] = config
+    except Exception as e:
+        _unverified.add(guild_id)
+        print(f"Error revalidating config for guild {guild_id}: {e}")
+
+
+def export_configs() -> dict:
+    """Copy of the cached configs for the warm-start snapshot."""
+    return dict(_configs)
+
+
+def import_configs(configs: dict):
+    """Seed the cache from a snapshot; each guild is re-read in the background on first use."""
+    for guild_id, config in configs.items():
+        guild_id = int(guild_id)
+        if guild_id not in _configs:
+            _configs[guild_id] = config
+            _unverified.add(guild_id)
+
+
+async def update_config(firestore_cog, guild_id, fields: dict) -> dict:
+    """Merge `fields` into a guild's stored configuration with one partial write.
+
+    Fields that are not mentioned are preserved, so the setup wizard and
+    /set_role_restrictions no longer overwrite each other's settings.
+    FirestoreCog.update_config merges the fields into the same document
+    load_config reads, so no read is needed first. Returns
+    the cached configuration with the fields applied, or just the fields
+    when the guild's config isn't cached.
+    """
+    guild_id = int(guild_id)
+    async with _lock_for(guild_id):
+        await firestore_cog.update_config(guild_id, fields)
+        if guild_id in _configs and guild_id not in _unverified:
+            merged = _configs[guild_id] = {**_configs[guild_id], **fields}
+        else:
+            # Whatever is cached may be stale; the next load reads the merged document
+            _configs.pop(guild_id, None)
+            _unverified.discard(guild_id)
+            merged = dict(fields)
+        print(f"Updated config fields {sorted(fields)} for guild {guild_id}.")
+        return merged
@@ -0,0 +1,81 @@
+# cogs/custom_images.py
+import hashlib
+from cogs.discord_plans import get_guild_custom_image
+from cogs.storage import guarded_call
+
+CUSTOM_IMAGES_COLLECTION = "guild_custom_images"  # One document per guild holding all of its mappings
+
+
+def image_key(game_name: str) -> str:
+    """Map key for a game; hashed so names with dots or slashes are safe field names."""
+    return hashlib.sha1(game_name.strip().casefold().encode("utf-8")).hexdigest()[:16]
+
+
+def _images_document(firestore_cog, guild_id):
+    return firestore_cog.db.collection(CUSTOM_IMAGES_COLLECTION).document(str(guild_id))
+
+
+async def save_custom_images(firestore_cog, guild_id, mappings: dict):
+    """Store game -> image URL mappings for a guild in a single merged write."""
+    images = {
+        image_key(game_name): {"game_name": game_name, "image_url": image_url}
+        for game_name, image_url in mappings.items()
+    }
+    await firestore_cog.run_blocking(
+        "set_custom_images",
+        lambda gid: _images_document(firestore_cog, gid).set({"images": images}, merge=True),
+        str(guild_id)
+    )
+
+
+async def load_custom_images_document(firestore_cog, guild_id) -> tuple:
+    """Read a guild's mappings document: ({game name: image URL}, whether legacy mappings were migrated)."""
+    data = await firestore_cog.run_blocking(
+        "load_custom_images", lambda gid: _images_document(firestore_cog, gid).get().to_dict(), str(guild_id)
+    )
+    data = data or {}
+    images = data.get("images", {})
+    mappings = {image["game_name"]: image["image_url"] for image in images.values() if image.get("image_url")}
+    return mappings, bool(data.get("legacy_migrated"))
+
+
+async def load_custom_images(firestore_cog, guild_id) -> dict:
+    """Read every stored game -> image URL mapping for a guild in one document read."""
+    mappings, _ = await load_custom_images_document(firestore_cog, guild_id)
+    return mappings
+
+
+async def migrate_legacy_images(firestore_cog, guild_id, game_names) -> dict:
+    """Move a guild's mappings set through discord_plans into its document, once.
+
+    The old per-game store can't be listed, so each of `game_names` (the
+    games the guild is known to play) not already in the document is looked
+    up there. What is found is written with the legacy_migrated flag in one
+    merged write; from then on the document is the only source. Returns the
+    guild's full mappings.
+    """
+    mappings, migrated = await load_custom_images_document(firestore_cog, guild_id)
+    if migrated:
+        return mappings
+    mapped = {game_name.strip().casefold() for game_name in mappings}
+    found = {}
+    for game_name in game_names:
+        if game_name.strip().casefold() in mapped:
+            continue
+        image_url = await guarded_call(
+            firestore_cog, "get_guild_custom_image", get_guild_custom_image, str(guild_id), game_name
+        )
+        if image_url:
+            found[game_name] = image_url
+    images = {
+        image_key(game_name): {"game_name": game_name, "image_url": image_url}
+        for game_name, image_url in found.items()
+    }
+    await firestore_cog.run_blocking(
+        "set_custom_images",
+        lambda gid: _images_document(firestore_cog, gid).set({"images": images, "legacy_migrated": True}, merge=True),
+        str(guild_id)
+    )
+    if found:
+        print(f"Migrated {len(found)} legacy custom images for guild {guild_id}.")
+    return {**mappings, **found}
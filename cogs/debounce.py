@@ -0,0 +1,53 @@
+# cogs/debounce.py
+import asyncio
+import time
+
+
+class Debouncer:
+    """Collapse bursts of updates for the same key into as few calls as possible.
+
+    The first update after an idle period runs right away. Updates arriving
+    within `window` seconds of a run are coalesced: only the most recent
+    action runs, once, when the window ends.
+    """
+
+    def __init__(self, window: float):
+        self.window = window
+        self._pending = {}   # key -> latest action (an async callable)
+        self._tasks = {}     # key -> task running/awaiting the pending action
+        self._last_run = {}  # key -> time the last action started
+
+    def trigger(self, key, action):
+        """Queue `action` for `key`, replacing any action not yet run."""
+        self._pending[key] = action
+        task = self._tasks.get(key)
+        if task is None or task.done():
+            self._tasks[key] = asyncio.create_task(self._drain(key))
+
+    def cancel(self, key):
+        """Drop the pending action for `key` (e.g. when its message is deleted)."""
+        self._pending.pop(key, None)
+        self._last_run.pop(key, None)
+        task = self._tasks.pop(key, None)
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _drain(self, key):
+        try:
+            while key in self._pending:
+                delay = self._last_run.get(key, 0) + self.window - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                action = self._pending.pop(key, None)
+                if action is None:
+                    break
+                self._last_run[key] = time.monotonic()
+                try:
+                    await action()
+                except Exception as e:
+                    print(f"Error in debounced update for {key}: {e}")
+        except asyncio.CancelledError:
+            pass
+        finally:
+            if self._tasks.get(key) is asyncio.current_task():
+                del self._tasks[key]
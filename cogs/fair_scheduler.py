@@ -0,0 +1,208 @@
+# cogs/fair_scheduler.py
+import asyncio
+import functools
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager, nullcontext
+import discord
+from discord.ext import commands
+from cogs.storage import tag_operations, track_response
+from cogs.throttle import USER_LIMITS, reject_if_throttled, throttled_counts
+
+MAX_IN_FLIGHT = int(os.getenv("SCOUT_MAX_IN_FLIGHT", 32))        # Handlers doing storage/REST work at once
+MAX_GUILD_SHARE = float(os.getenv("SCOUT_MAX_GUILD_SHARE", 0.25))  # Largest share of those one guild may hold
+SLOW_QUEUE_SECONDS = 1.0  # Waits longer than this are logged
+STATS_LINES = 15          # Guilds listed by /scout_queue_stats
+
+
+class FairScheduler:
+    """Per-guild concurrency budget with round-robin hand-off between waiting guilds.
+
+    A guild may hold at most `per_guild` of the `max_in_flight` slots. When a
+    slot frees up it goes to the next guild in rotation that has work queued
+    and is under its budget, so one busy guild cannot starve the others.
+    """
+
+    def __init__(self, max_in_flight: int, per_guild: int):
+        self.max_in_flight = max_in_flight
+        self.per_guild = per_guild
+        self.in_flight = 0
+        self.guild_in_flight = {}  # guild_id -> slots held
+        self.waiting = {}          # guild_id -> deque of futures
+        self.rotation = deque()    # guild_ids with queued work, in serve order
+        self.delays = {}           # guild_id -> [count, total_wait, max_wait]
+
+    def _has_room(self, guild_id) -> bool:
+        return self.in_flight < self.max_in_flight and self.guild_in_flight.get(guild_id, 0) < self.per_guild
+
+    def would_wait(self, guild_id) -> bool:
+        """Whether slot() would have to queue for this guild right now."""
+        return not self._has_room(guild_id) or guild_id in self.waiting
+
+    def _take(self, guild_id):
+        self.in_flight += 1
+        self.guild_in_flight[guild_id] = self.guild_in_flight.get(guild_id, 0) + 1
+
+    def _give_back(self, guild_id):
+        self.in_flight -= 1
+        held = self.guild_in_flight.get(guild_id, 0) - 1
+        if held > 0:
+            self.guild_in_flight[guild_id] = held
+        else:
+            self.guild_in_flight.pop(guild_id, None)
+
+    def _dispatch(self):
+        # Walk the rotation at most once, handing free slots to guilds under budget
+        for _ in range(len(self.rotation)):
+            if self.in_flight >= self.max_in_flight:
+                return
+            guild_id = self.rotation.popleft()
+            queue = self.waiting.get(guild_id)
+            while queue and queue[0].done():
+                queue.popleft()  # Cancelled waiters
+            if not queue:
+                self.waiting.pop(guild_id, None)
+                continue
+            if self._has_room(guild_id):
+                self._take(guild_id)
+                queue.popleft().set_result(None)
+            if queue:
+                self.rotation.append(guild_id)
+            else:
+                self.waiting.pop(guild_id, None)
+
+    def _record_delay(self, guild_id, waited: float):
+        stats = self.delays.setdefault(guild_id, [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += waited
+        stats[2] = max(stats[2], waited)
+        if waited >= SLOW_QUEUE_SECONDS:
+            print(f"Guild {guild_id} waited {waited:.2f}s for a handler slot ({self.in_flight} in flight).")
+
+    @asynccontextmanager
+    async def slot(self, guild_id):
+        """Hold one of the guild's slots for the duration of the block."""
+        queued_at = time.monotonic()
+        if not self.would_wait(guild_id):
+            self._take(guild_id)
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            if guild_id not in self.waiting:
+                self.waiting[guild_id] = deque()
+                self.rotation.append(guild_id)
+            self.waiting[guild_id].append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was handed over just as we were cancelled
+                    self._give_back(guild_id)
+                    self._dispatch()
+                raise
+        self._record_delay(guild_id, time.monotonic() - queued_at)
+        try:
+            yield
+        finally:
+            self._give_back(guild_id)
+            self._dispatch()
+
+
+guild_scheduler = FairScheduler(MAX_IN_FLIGHT, max(1, int(MAX_IN_FLIGHT * MAX_GUILD_SHARE)))
+
+
+async def respond(interaction, content=None, **kwargs):
+    """Reply to an interaction, as a followup if it was already deferred (e.g. while queued)."""
+    if interaction.response.is_done():
+        return await interaction.followup.send(content, **kwargs)
+    return await interaction.response.send_message(content, **kwargs)
+
+
+def fair_share(action: str):
+    """Decorate a command or button callback to throttle it and run it in its guild's slot.
+
+    The interaction must be the callback's last positional argument, which
+    holds for both view button callbacks and slash commands. If the guild
+    has to queue, the interaction is deferred first so it can't expire
+    while waiting; callbacks reply with respond(). The defer is ephemeral,
+    so rejections sent after it stay private; a public reply has to be a
+    second followup.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = args[-1]
+            # Spam is rejected from memory before it can take a slot
+            if await reject_if_throttled(interaction, action):
+                return
+            # Slash commands are already tagged for the storage ledger by StorageGuard
+            if isinstance(interaction, discord.Interaction):
+                tag = tag_operations(f"{action} button", interaction.guild_id)
+            else:
+                tag = nullcontext()
+            with tag:
+                track_response(interaction)
+                if guild_scheduler.would_wait(interaction.guild_id) and not interaction.response.is_done():
+                    # Discord drops interactions not acknowledged within 3 seconds
+                    await interaction.response.defer(ephemeral=True)
+                async with guild_scheduler.slot(interaction.guild_id):
+                    return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class FairScheduling(commands.Cog):
+    """Cog that reports per-guild queueing delay for recruitment work."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        print("FairScheduling cog initialized.")
+
+    def export_state(self) -> dict:
+        return {"guild_scheduler": guild_scheduler}
+
+    def import_state(self, state: dict):
+        # Decorated callbacks from before the reload still use the old scheduler
+        global guild_scheduler
+        guild_scheduler = state["guild_scheduler"]
+
+    @commands.slash_command(
+        name="scout_queue_stats",
+        description="(bot owner) Show per-guild queueing delay and throttled calls for recruitment work."
+    )
+    @commands.is_owner()
+    async def scout_queue_stats(self, interaction: discord.Interaction):
+        """Lists the guilds that have waited longest for handler slots, then the throttle counters."""
+        scheduler = guild_scheduler
+        lines = [
+            f"**In flight:** {scheduler.in_flight}/{scheduler.max_in_flight} "
+            f"(max {scheduler.per_guild} per guild), **guilds waiting:** {len(scheduler.waiting)}"
+        ]
+        busiest = sorted(scheduler.delays.items(), key=lambda item: item[1][1], reverse=True)[:STATS_LINES]
+        for guild_id, (count, total_wait, max_wait) in busiest:
+            guild = self.bot.get_guild(guild_id)
+            name = guild.name if guild else guild_id
+            lines.append(f"• {name}: {count} run(s), avg wait {total_wait / count:.3f}s, max {max_wait:.2f}s")
+        lines.append(f"**Throttled since start:** {sum(throttled_counts.values())}")
+        for action in USER_LIMITS:
+            user_count = throttled_counts[(action, "user")]
+            guild_count = throttled_counts[(action, "guild")]
+            if user_count or guild_count:
+                lines.append(f"• {action}: {user_count} by user limit, {guild_count} by guild limit")
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    @scout_queue_stats.error
+    async def scout_queue_stats_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the scout_queue_stats command."""
+        if isinstance(error, commands.NotOwner):
+            await interaction.response.send_message("Only the bot owner can use this command.", ephemeral=True)
+        else:
+            await interaction.response.send_message(
+                "An unexpected error occurred while executing the command. Please try again later.",
+                ephemeral=True
+            )
+            print(f"Unexpected error in /scout_queue_stats: {error}")
+
+
+def setup(bot):
+    bot.add_cog(FairScheduling(bot))
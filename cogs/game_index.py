@@ -0,0 +1,219 @@
+# cogs/game_index.py
+import asyncio
+import bisect
+import time
+import discord
+from discord.ext import commands
+from cogs.custom_images import load_custom_images
+from cogs.session_archive import session_archive
+from cogs.storage import get_storage
+
+MAX_GAMES_PER_GUILD = 500  # Oldest non-pinned games are evicted beyond this
+MAX_SUGGESTIONS = 25       # Discord's limit for autocomplete choices
+COLD_HISTORY_DAYS = 30     # Archive days read when there's no snapshot to start from
+
+
+class GameNameIndex:
+    """Sorted-array prefix index of the game names used in one guild."""
+
+    def __init__(self):
+        self._keys = []        # Sorted casefolded names, searched with bisect
+        self._names = {}       # casefolded name -> display name
+        self._last_used = {}   # casefolded name -> last time the game was used
+        self._pinned = set()   # Custom-image games, never evicted
+
+    def __len__(self):
+        return len(self._keys)
+
+    def add(self, game_name: str, used_at: float = None, pinned: bool = False):
+        """Insert or refresh a game name."""
+        name = game_name.strip()
+        if not name:
+            return
+        key = name.casefold()
+        used_at = used_at if used_at is not None else time.time()
+
+        if key not in self._names:
+            bisect.insort(self._keys, key)
+        self._names[key] = name
+        self._last_used[key] = max(used_at, self._last_used.get(key, 0))
+        if pinned:
+            self._pinned.add(key)
+
+        if len(self._keys) > MAX_GAMES_PER_GUILD:
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        candidates = [key for key in self._keys if key not in self._pinned]
+        if not candidates:
+            return
+        oldest = min(candidates, key=self._last_used.__getitem__)
+        self._keys.pop(bisect.bisect_left(self._keys, oldest))
+        del self._names[oldest]
+        del self._last_used[oldest]
+
+    def names(self) -> list:
+        """Return the display names of every game in the index."""
+        return [self._names[key] for key in self._keys]
+
+    def entries(self) -> list:
+        """Return [display name, last used, pinned] for every game, for the warm-start snapshot."""
+        return [[self._names[key], self._last_used[key], key in self._pinned] for key in self._keys]
+
+    def pinned(self) -> list:
+        """Return the display names of all pinned (custom-image) games."""
+        return sorted(self._names[key] for key in self._pinned)
+
+    def suggest(self, text: str, limit: int = MAX_SUGGESTIONS) -> list:
+        """Return display names starting with `text`, most recently used first.
+
+        When there are fewer prefix matches than `limit`, names containing
+        `text` elsewhere are appended so typo-adjacent entries still show up.
+        """
+        key = text.strip().casefold()
+        start = bisect.bisect_left(self._keys, key)
+        end = bisect.bisect_left(self._keys, key + "\uffff")
+        matches = sorted(self._keys[start:end], key=self._last_used.__getitem__, reverse=True)
+
+        if key and len(matches) < limit:
+            prefixed = set(matches)
+            contained = [k for k in self._keys if key in k and k not in prefixed]
+            contained.sort(key=self._last_used.__getitem__, reverse=True)
+            matches.extend(contained)
+
+        return [self._names[k] for k in matches[:limit]]
+
+
+# guild_id -> GameNameIndex, kept entirely in memory
+_indexes = {}
+# When the indexes were saved, if they were seeded from a warm-start snapshot
+_seeded_at = None
+# Guilds whose custom-image games have been pinned from storage in this process
+_pinned_loaded = set()
+
+
+def record_game(guild_id, game_name: str, used_at: float = None, pinned: bool = False):
+    """Add a game to a guild's index (called on recruit and custom image updates)."""
+    index = _indexes.get(int(guild_id))
+    if index is None:
+        index = _indexes[int(guild_id)] = GameNameIndex()
+    index.add(game_name, used_at=used_at, pinned=pinned)
+
+
+def export_games() -> dict:
+    """Copy of every guild's index for the warm-start snapshot."""
+    return {str(guild_id): index.entries() for guild_id, index in _indexes.items()}
+
+
+def import_games(games: dict, saved_at: float):
+    """Seed the indexes from a snapshot taken at `saved_at`; only later archive days are read on ready."""
+    global _seeded_at
+    for guild_id, entries in games.items():
+        for game_name, used_at, pinned in entries:
+            record_game(guild_id, game_name, used_at=used_at, pinned=pinned)
+    _seeded_at = saved_at
+
+
+def known_games(guild_id) -> list:
+    """Return every game name recorded for a guild."""
+    index = _indexes.get(int(guild_id))
+    return index.names() if index else []
+
+
+def pinned_games(guild_id) -> list:
+    """Return the custom-image games recorded for a guild."""
+    index = _indexes.get(int(guild_id))
+    return index.pinned() if index else []
+
+
+def suggest_games(guild_id, text: str) -> list:
+    """Return autocomplete suggestions for a guild without touching storage."""
+    index = _indexes.get(int(guild_id)) if guild_id else None
+    if index is None:
+        return []
+    return index.suggest(text or "")
+
+
+async def _pin_custom_images(firestore_cog, guild_id: int):
+    try:
+        mappings = await load_custom_images(firestore_cog, guild_id)
+    except Exception as e:
+        _pinned_loaded.discard(guild_id)  # Tried again on a later autocomplete
+        print(f"Error loading custom image games for guild {guild_id}: {e}")
+        return
+    for game_name in mappings:
+        # used_at=0 keeps each game's real last use for ordering
+        record_game(guild_id, game_name, used_at=0, pinned=True)
+
+
+async def game_name_autocomplete(ctx: discord.AutocompleteContext):
+    """Autocomplete provider for `game_name` options, answered from memory.
+
+    A guild's first autocomplete also pins its custom-image games in the
+    background (one document read), so they show up after a cold start.
+    """
+    guild_id = ctx.interaction.guild_id
+    if guild_id and guild_id not in _pinned_loaded:
+        firestore_cog = get_storage(ctx.bot)
+        if firestore_cog:
+            _pinned_loaded.add(guild_id)
+            asyncio.create_task(_pin_custom_images(firestore_cog, guild_id))
+    return suggest_games(guild_id, ctx.value)
+
+
+class GameIndex(commands.Cog):
+    """Cog that brings the in-memory game name indexes up to date at startup.
+
+    The indexes come from the warm-start snapshot plus the archive days since
+    it was taken (or the last COLD_HISTORY_DAYS without one). Live sessions
+    are recorded as they are restored, and custom-image games are pinned on
+    a guild's first autocomplete, so nothing is read from storage at ready.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.rebuilt = False
+        print("GameIndex cog initialized.")
+
+    def export_state(self) -> dict:
+        return {
+            "indexes": _indexes, "seeded_at": _seeded_at, "pinned_loaded": _pinned_loaded, "rebuilt": self.rebuilt
+        }
+
+    def import_state(self, state: dict):
+        # Modules that imported record_game before the reload still write to the old dict
+        global _indexes, _seeded_at, _pinned_loaded
+        _indexes = state["indexes"]
+        _seeded_at = state["seeded_at"]
+        _pinned_loaded = state.get("pinned_loaded", set())
+        self.rebuilt = state["rebuilt"]
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # on_ready fires again after reconnects; only rebuild once per process
+        if self.rebuilt:
+            return
+        self.rebuilt = True
+
+        if _seeded_at is not None:
+            days = int((time.time() - _seeded_at) // 86400) + 1
+            since = _seeded_at
+        else:
+            days, since = COLD_HISTORY_DAYS, 0
+        try:
+            history = await asyncio.to_thread(lambda: list(session_archive.read(days=days)))
+        except Exception as e:
+            print(f"Error rebuilding game index from session history: {e}")
+            return
+
+        count = 0
+        for data in history:
+            guild_id = data.get("guild_id")
+            game_name = data.get("game_name")
+            if guild_id and game_name and (data.get("ended_at") or 0) >= since:
+                record_game(guild_id, game_name, used_at=data.get("start_time"))
+                count += 1
+        print(f"Game index updated from {count} archived sessions ({days} days) across {len(_indexes)} guilds.")
+
+def setup(bot):
+    bot.add_cog(GameIndex(bot))
@@ -1,13 +1,21 @@
+import csv
+import io
+import json
 import discord
 from discord.ext import commands
 from discord.ext.commands import MissingPermissions
-from cogs.discord_plans import (
-    get_guild_session_limit,
-    set_guild_custom_image,
-    update_entitlements_from_api,
-)
+from cogs.discord_plans import get_guild_session_limit, update_entitlements_from_api
+from cogs.game_index import game_name_autocomplete, known_games, record_game
+from cogs.command_sync import command_mention
+from cogs.custom_images import migrate_legacy_images, save_custom_images
+from cogs.plan_cache import forget_guild
+from cogs.storage import get_storage, guarded_call
 from enum import IntEnum
 
+MAX_IMPORT_BYTES = 256 * 1024  # Largest attachment accepted by /import_custom_images
+MAX_IMPORT_ROWS = 500          # Largest number of mappings in a single import
+MAX_GAME_NAME_LENGTH = 100     # Discord's limit for a string option value
+
 class InteractionContextType(IntEnum):
     GUILD = 0
     BOT_DM = 1
@@ -29,43 +37,176 @@ class ImageUpload(commands.Cog):
     async def set_custom_image(
         self,
         interaction: discord.Interaction,
-        game_name: str,
+        game_name: discord.Option(str, "The game to set an image for", autocomplete=game_name_autocomplete),
         image_url: str,
     ):
         """Allows premium guilds to set a custom image for a given game."""
         guild_id = str(interaction.guild.id)
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
 
         # Perform an on-demand entitlement check
-        await update_entitlements_from_api()
+        await guarded_call(firestore_cog, "update_entitlements_from_api", update_entitlements_from_api)
 
         # Check if this guild is premium
-        session_limit = await get_guild_session_limit(guild_id)
+        session_limit = await guarded_call(firestore_cog, "get_guild_session_limit", get_guild_session_limit, guild_id)
         if session_limit <= 3:
             await interaction.response.send_message(
-                "Custom images are only available for premium servers. Use </upgrade_scoutmaster:1330785705542287434> to access this feature.",
+                f"Custom images are only available for premium servers. Use {command_mention('upgrade_scoutmaster')} to access this feature.",
                 ephemeral=True,
             )
             return
 
         # Validate the image URL
-        if not (image_url.startswith("http://") or image_url.startswith("https://")):
+        if not is_valid_image_url(image_url):
             await interaction.response.send_message(
                 "Please provide a valid URL (http:// or https://).", ephemeral=True
             )
             return
 
         # Save the custom image in Firestore
-        await set_guild_custom_image(guild_id, game_name, image_url)
+        await save_custom_images(firestore_cog, guild_id, {game_name: image_url})
+        forget_guild(guild_id)
+        record_game(guild_id, game_name, pinned=True)
         await interaction.response.send_message(
             f"Successfully set a custom image for **{game_name}**!", ephemeral=True
         )
 
+    @commands.slash_command(
+        name="import_custom_images",
+        description="(premium only) Set custom images for many games from a CSV or JSON file",
+        contexts=[InteractionContextType.GUILD],
+    )
+    @commands.has_permissions(administrator=True)
+    async def import_custom_images(
+        self,
+        interaction: discord.Interaction,
+        mappings_file: discord.Option(discord.Attachment, "CSV (game_name,image_url) or JSON ({game: url}) file"),
+    ):
+        """Imports game -> image URL mappings with a single entitlement check and write."""
+        guild_id = str(interaction.guild.id)
+
+        if mappings_file.size > MAX_IMPORT_BYTES:
+            await interaction.response.send_message(
+                f"That file is too large. Please keep imports under {MAX_IMPORT_BYTES // 1024} KB.",
+                ephemeral=True,
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.followup.send("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
+
+        # One entitlement check for the whole import
+        await guarded_call(firestore_cog, "update_entitlements_from_api", update_entitlements_from_api)
+        session_limit = await guarded_call(firestore_cog, "get_guild_session_limit", get_guild_session_limit, guild_id)
+        if session_limit <= 3:
+            await interaction.followup.send(
+                f"Custom images are only available for premium servers. Use {command_mention('upgrade_scoutmaster')} to access this feature.",
+                ephemeral=True,
+            )
+            return
+
+        try:
+            raw = await mappings_file.read()
+            mappings, errors = parse_image_mappings(raw, mappings_file.filename)
+        except (UnicodeDecodeError, ValueError) as e:
+            await interaction.followup.send(
+                f"Could not read that file. Please upload a UTF-8 CSV or JSON file. ({e})",
+                ephemeral=True,
+            )
+            return
+
+        if not mappings:
+            await interaction.followup.send(
+                "No valid game/image pairs were found in that file.\n" + "\n".join(errors[:10]),
+                ephemeral=True,
+            )
+            return
+
+        if len(mappings) > MAX_IMPORT_ROWS:
+            await interaction.followup.send(
+                f"That file has {len(mappings)} games. Please import at most {MAX_IMPORT_ROWS} at a time.",
+                ephemeral=True,
+            )
+            return
+
+        await save_custom_images(firestore_cog, guild_id, mappings)
+        forget_guild(guild_id)
+        for game_name in mappings:
+            record_game(guild_id, game_name, pinned=True)
+        print(f"Imported {len(mappings)} custom images for guild {guild_id}.")
+
+        summary = f"Successfully set custom images for **{len(mappings)}** game(s)!"
+        if errors:
+            summary += f"\n\nSkipped {len(errors)} entr{'y' if len(errors) == 1 else 'ies'}:\n" + "\n".join(errors[:10])
+            if len(errors) > 10:
+                summary += f"\n...and {len(errors) - 10} more."
+        await interaction.followup.send(summary, ephemeral=True)
+
+    @commands.slash_command(
+        name="export_custom_images",
+        description="(premium only) Download this server's custom game images as a file",
+        contexts=[InteractionContextType.GUILD],
+    )
+    @commands.has_permissions(administrator=True)
+    async def export_custom_images(
+        self,
+        interaction: discord.Interaction,
+        file_format: discord.Option(str, "File format", choices=["csv", "json"], default="csv"),
+    ):
+        """Sends the current game -> image URL mappings back as an attachment."""
+        guild_id = str(interaction.guild.id)
+        await interaction.response.defer(ephemeral=True)
+
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.followup.send("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
+        # Mappings set before the guild document existed are moved into it on the first export
+        mappings = await migrate_legacy_images(firestore_cog, guild_id, known_games(guild_id))
+        forget_guild(guild_id)
+        if not mappings:
+            await interaction.followup.send("This server has no custom images to export.", ephemeral=True)
+            return
+
+        buffer = io.StringIO()
+        if file_format == "json":
+            json.dump(mappings, buffer, indent=2, ensure_ascii=False)
+        else:
+            writer = csv.writer(buffer)
+            writer.writerow(["game_name", "image_url"])
+            writer.writerows(sorted(mappings.items()))
+
+        export_file = discord.File(
+            io.BytesIO(buffer.getvalue().encode("utf-8")),
+            filename=f"custom_images.{file_format}",
+        )
+        await interaction.followup.send(
+            f"Here are the custom images for **{len(mappings)}** game(s).",
+            file=export_file,
+            ephemeral=True,
+        )
+
+    @import_custom_images.error
+    @export_custom_images.error
     @set_custom_image.error
     async def set_custom_image_error(
         self, interaction: discord.Interaction, error: commands.CommandError
     ):
-        """Error handler for the set_custom_image command."""
-        if isinstance(error, MissingPermissions):
+        """Error handler for the custom image commands."""
+        if interaction.response.is_done():
+            # Import/export defer before doing any work
+            await interaction.followup.send(
+                "An unexpected error occurred. Please try again later.",
+                ephemeral=True,
+            )
+            print(f"Unexpected error: {error}")
+        elif isinstance(error, MissingPermissions):
             await interaction.response.send_message(
                 "You need to be an administrator to use this command.",
                 ephemeral=True,
@@ -78,5 +219,60 @@ class ImageUpload(commands.Cog):
             )
             print(f"Unexpected error: {error}")
 
+
+def is_valid_image_url(image_url: str) -> bool:
+    """Check that a custom image URL uses http:// or https://."""
+    return image_url.startswith("http://") or image_url.startswith("https://")
+
+
+def parse_image_mappings(raw: bytes, filename: str):
+    """Parse a CSV or JSON attachment into game -> URL mappings in one pass.
+
+    JSON may be an object (`{"game": "url"}`) or a list of objects with
+    `game_name`/`image_url` keys. CSV rows are `game_name,image_url`, with an
+    optional header row. Returns `(mappings, errors)` where errors are
+    human-readable strings for the rows that were skipped.
+    """
+    text = raw.decode("utf-8-sig")
+    rows = []
+    if filename.lower().endswith(".json") or text.lstrip().startswith(("{", "[")):
+        data = json.loads(text)
+        if isinstance(data, dict):
+            rows = list(data.items())
+        elif isinstance(data, list):
+            for item in data:
+                if isinstance(item, dict):
+                    rows.append((item.get("game_name") or item.get("game"), item.get("image_url") or item.get("url")))
+                else:
+                    rows.append((None, None))
+        else:
+            raise ValueError("JSON must be an object or a list of objects.")
+    else:
+        for row in csv.reader(io.StringIO(text)):
+            if not row or not any(cell.strip() for cell in row):
+                continue
+            rows.append((row[0], row[1] if len(row) > 1 else None))
+        # Skip a header row such as "game_name,image_url"
+        if rows and rows[0][1] and not is_valid_image_url(rows[0][1].strip()):
+            rows = rows[1:]
+
+    mappings = {}
+    errors = []
+    for line, (game_name, image_url) in enumerate(rows, start=1):
+        game_name = str(game_name).strip() if game_name else ""
+        image_url = str(image_url).strip() if image_url else ""
+        if not game_name or not image_url:
+            errors.append(f"Entry {line}: missing game name or image URL.")
+        elif len(game_name) > MAX_GAME_NAME_LENGTH:
+            errors.append(f"Entry {line}: game name is longer than {MAX_GAME_NAME_LENGTH} characters.")
+        elif not is_valid_image_url(image_url):
+            errors.append(f"Entry {line}: **{game_name}** does not have a valid http(s) URL.")
+        else:
+            if game_name in mappings:
+                errors.append(f"Entry {line}: **{game_name}** appears more than once; the last URL wins.")
+            mappings[game_name] = image_url
+    return mappings, errors
+
+
 def setup(bot):
     bot.add_cog(ImageUpload(bot))
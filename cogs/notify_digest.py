@@ -0,0 +1,198 @@
+# cogs/notify_digest.py
+import time
+import discord
+from discord.ext import commands
+from cogs.command_sync import command_mention
+from cogs.config_store import cached_config, update_config
+from cogs.storage import get_storage
+from cogs.debounce import Debouncer
+from cogs.session_index import active_sessions
+
+DIGEST_EDIT_WINDOW_SECONDS = 10     # Session starts/ends within this window share one edit
+DEFAULT_MENTION_WINDOW_MINUTES = 30  # At most one @everyone ping per window
+MAX_DIGEST_LINES = 25
+DIGEST_DESCRIPTION_LIMIT = 4096     # Discord's limit for an embed description
+GAME_NAME_DISPLAY_LIMIT = 100       # Longer game names are cut short in the digest
+
+
+def render_digest(entries: list, allowed_channel_id: int) -> discord.Embed:
+    """Build the "Active sessions" embed from a guild's live sessions."""
+    embed = discord.Embed(title="🎮 Active sessions", color=discord.Color.blue())
+    if not entries:
+        embed.description = f"No sessions are running right now. Use {command_mention('recruit')} to start one!"
+        return embed
+
+    lines = []
+    length = 0
+    ordered = sorted(entries, key=lambda e: e.created_at or 0)
+    for index, entry in enumerate(ordered):
+        spots = entry.remaining_spots
+        spots_text = f"{spots} spot{'s' if spots != 1 else ''} left" if spots > 0 else "full"
+        game_name = entry.game_name or ""
+        if len(game_name) > GAME_NAME_DISPLAY_LIMIT:
+            game_name = game_name[:GAME_NAME_DISPLAY_LIMIT - 1] + "…"
+        link = (
+            f" — [join](https://discord.com/channels/{entry.guild_id}/"
+            f"{entry.allowed_channel_id}/{entry.recruitment_message_id})"
+        )
+        line = f"• **{game_name}** with <@{entry.creator_id}> — {spots_text}{link}"
+        more = f"...and {len(ordered) - index} more in <#{allowed_channel_id}>"
+        if index == MAX_DIGEST_LINES or length + len(line) + 1 + len(more) > DIGEST_DESCRIPTION_LIMIT:
+            lines.append(more)
+            break
+        lines.append(line)
+        length += len(line) + 1
+    embed.description = "\n".join(lines)
+    embed.set_footer(text=f"{len(entries)} session(s) running")
+    return embed
+
+
+class NotifyDigest(commands.Cog):
+    """Cog that keeps one pinned, live-edited "Active sessions" message per guild."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.edits = Debouncer(DIGEST_EDIT_WINDOW_SECONDS)
+        self.last_mention = {}          # guild_id -> time of the last @everyone ping
+        self.last_mention_message = {}  # guild_id -> previous ping message (deleted on the next one)
+        print("NotifyDigest cog initialized.")
+
+    def export_state(self) -> dict:
+        return {
+            "edits": self.edits,
+            "last_mention": self.last_mention,
+            "last_mention_message": self.last_mention_message,
+        }
+
+    def import_state(self, state: dict):
+        self.edits = state["edits"]
+        self.last_mention = state["last_mention"]
+        self.last_mention_message = state["last_mention_message"]
+
+    @staticmethod
+    def enabled(guild_id: int) -> bool:
+        config = cached_config(guild_id) or {}
+        return bool(config.get("notify_digest"))
+
+    def refresh(self, guild: discord.Guild):
+        """Queue a debounced rebuild of the guild's digest message."""
+        if guild is None or not self.enabled(guild.id):
+            return
+
+        async def rebuild():
+            await self._rebuild(guild)
+
+        self.edits.trigger(guild.id, rebuild)
+
+    async def session_started(self, guild: discord.Guild, session_creator: discord.Member, game_name: str):
+        """Refresh the digest and ping @everyone if the mention window allows it."""
+        self.refresh(guild)
+
+        config = cached_config(guild.id) or {}
+        if not config.get("use_mention") or not guild.me.guild_permissions.mention_everyone:
+            return
+        window = int(config.get("digest_mention_minutes", DEFAULT_MENTION_WINDOW_MINUTES)) * 60
+        now = time.time()
+        if now - self.last_mention.get(guild.id, 0) < window:
+            return
+
+        notify_channel = guild.get_channel(config.get("notify_channel_id"))
+        if not notify_channel:
+            return
+        self.last_mention[guild.id] = now
+        try:
+            previous = self.last_mention_message.pop(guild.id, None)
+            if previous:
+                await previous.delete()
+        except discord.HTTPException:
+            pass
+        try:
+            self.last_mention_message[guild.id] = await notify_channel.send(
+                f"Hey @everyone! **{session_creator.mention}** just started a **{game_name}** session. "
+                "Check the pinned **Active sessions** message to join!"
+            )
+        except discord.HTTPException as e:
+            print(f"Failed to send digest mention in guild {guild.id}: {e}")
+
+    async def _rebuild(self, guild: discord.Guild):
+        config = cached_config(guild.id) or {}
+        notify_channel = guild.get_channel(config.get("notify_channel_id"))
+        if not notify_channel:
+            print(f"Notify channel for guild {guild.id} not found. Digest not updated.")
+            return
+
+        embed = render_digest(active_sessions.for_guild(guild.id), config.get("allowed_channel_id"))
+        digest_message_id = config.get("digest_message_id")
+        if digest_message_id:
+            try:
+                await notify_channel.get_partial_message(digest_message_id).edit(content=None, embed=embed)
+                return
+            except discord.NotFound:
+                print(f"Digest message {digest_message_id} not found. Posting a new one.")
+
+        message = await notify_channel.send(embed=embed)
+        try:
+            await message.pin(reason="Scout Master active sessions digest.")
+        except discord.HTTPException as e:
+            print(f"Failed to pin digest message in guild {guild.id}: {e}")
+
+        firestore_cog = get_storage(self.bot)
+        if firestore_cog:
+            await update_config(firestore_cog, guild.id, {"digest_message_id": message.id})
+        print(f"Posted new digest message {message.id} in guild {guild.id}.")
+
+    @commands.slash_command(
+        name="set_notify_digest",
+        description="Post one pinned, live-updating list of active sessions instead of a message per session."
+    )
+    @commands.has_permissions(administrator=True)
+    async def set_notify_digest(
+        self,
+        interaction: discord.Interaction,
+        enabled: bool,
+        mention_every_minutes: int = DEFAULT_MENTION_WINDOW_MINUTES,
+    ):
+        """Turns digest mode on or off and sets the @everyone rate limit."""
+        if mention_every_minutes < 1:
+            await interaction.response.send_message(
+                "Please allow at least 1 minute between mentions.", ephemeral=True
+            )
+            return
+
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
+
+        await update_config(firestore_cog, interaction.guild.id, {
+            "notify_digest": enabled,
+            "digest_mention_minutes": mention_every_minutes,
+        })
+        if enabled:
+            self.refresh(interaction.guild)
+            message = (
+                "Digest mode enabled! Active sessions will be listed in one pinned message in your notification channel, "
+                f"with at most one `@everyone` ping every **{mention_every_minutes}** minute(s) (if mentions are on)."
+            )
+        else:
+            message = "Digest mode disabled. Each session will get its own notification again."
+        await interaction.response.send_message(message, ephemeral=True)
+
+    @set_notify_digest.error
+    async def set_notify_digest_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the set_notify_digest command."""
+        if isinstance(error, commands.MissingPermissions):
+            await interaction.response.send_message(
+                "You need Administrator permissions to run this command.",
+                ephemeral=True
+            )
+        else:
+            await interaction.response.send_message(
+                "An unexpected error occurred while executing the command. Please try again later.",
+                ephemeral=True
+            )
+            print(f"Unexpected error in /set_notify_digest: {error}")
+
+
+def setup(bot):
+    bot.add_cog(NotifyDigest(bot))
@@ -0,0 +1,251 @@
+# cogs/orphan_reaper.py
+import asyncio
+import time
+from collections import Counter
+import discord
+from discord.ext import commands
+from cogs.channel_ledger import channel_ledger
+from cogs.config_store import load_config
+from cogs.session_archive import session_archive
+from cogs.session_index import active_sessions
+from cogs.storage import get_storage, tag_operations
+from cogs.vc_pool import POOL_CHANNEL_NAME
+
+REAP_START_DELAY_SECONDS = 600   # Let restore finish before the first pass
+REAP_INTERVAL_SECONDS = 3600     # Pause between passes over all guilds
+REAP_GUILD_PAUSE_SECONDS = 5     # Pause between guilds within a pass
+ORPHAN_GRACE_SECONDS = 900       # Never touch anything younger; /recruit may still be setting it up
+HISTORY_LIMIT = 100              # Recent messages checked per allowed/notify channel
+DELETE_PAUSE_SECONDS = 1         # Between single deletes (channels, old messages)
+BULK_DELETE_MAX_AGE_SECONDS = 13 * 86400  # Discord only bulk-deletes messages under 14 days old
+HELD_CHANNEL_DAYS = 7            # Archived sessions this recent say which channels were session channels
+NOTIFY_MESSAGE_MARKER = "has started a gaming session to play"
+
+
+def session_ids_in(message: discord.Message) -> set:
+    """Session IDs referenced by a message's scout:<action>:<session_id> buttons."""
+    session_ids = set()
+    for row in message.components:
+        for component in getattr(row, "children", [row]):
+            custom_id = getattr(component, "custom_id", None) or ""
+            prefix, _, rest = custom_id.partition(":")
+            _, _, session_id = rest.partition(":")
+            if prefix == "scout" and session_id:
+                session_ids.add(session_id)
+    return session_ids
+
+
+def held_channel_ids(days: int = HELD_CHANNEL_DAYS) -> dict:
+    """guild_id -> voice channel IDs that archived sessions held (blocking; reads the archive)."""
+    held = {}
+    for record in session_archive.read(days):
+        if record.get("guild_id") and record.get("vc_id"):
+            held.setdefault(int(record["guild_id"]), set()).add(int(record["vc_id"]))
+    return held
+
+
+class OrphanReaper(commands.Cog):
+    """Cog that reconciles session channels and messages against the live session index.
+
+    A crash between the steps of /recruit or a teardown can leave voice
+    channels and buttoned messages that no session owns. Each pass walks the
+    guilds one at a time, compares the voice channels under the configured
+    category and the bot's recent messages in the allowed/notify channels
+    with the index in bulk, and deletes what nothing owns: messages in bulk,
+    channels one by one with a pause. Only things the bot made, older than
+    ORPHAN_GRACE_SECONDS, are considered: voice channels only if an
+    archived session held them, the channel ledger still claims them (set
+    up or torn down when the bot stopped), or they are standby pool
+    channels.
+    Passes wait until the recruitment cog has checked the index against
+    storage.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.task = None
+        self.reclaimed = Counter()  # kind -> total reclaimed since startup
+        self.last_pass = {}         # guild_id -> (finished at, Counter of that pass)
+        print("OrphanReaper cog initialized.")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    def cog_unload(self):
+        if self.task:
+            self.task.cancel()
+
+    def export_state(self) -> dict:
+        return {"reclaimed": self.reclaimed, "last_pass": self.last_pass}
+
+    def import_state(self, state: dict):
+        self.reclaimed = state["reclaimed"]
+        self.last_pass = state["last_pass"]
+        if self.bot.is_ready() and self.task is None:
+            self.task = asyncio.create_task(self.run())
+
+    async def run(self):
+        await asyncio.sleep(REAP_START_DELAY_SECONDS)
+        while True:
+            recruitment = self.bot.get_cog('Recruitment')
+            if recruitment is None or not recruitment.restore_succeeded:
+                # Without the restored index every live session would look orphaned
+                print("Sessions not restored yet. Skipping orphan reaper pass.")
+            else:
+                try:
+                    held = await asyncio.to_thread(held_channel_ids)
+                except Exception as e:
+                    print(f"Error reading archived session channels: {e}")
+                    held = {}
+                pruned = channel_ledger.prune()
+                if pruned:
+                    print(f"Forgot {pruned} channel ledger claims past their age limit.")
+                for guild in list(self.bot.guilds):
+                    try:
+                        with tag_operations("orphan reaper", guild.id):
+                            await self.reap_guild(guild, held.get(guild.id, set()))
+                    except Exception as e:
+                        print(f"Error reaping orphans in guild {guild.id}: {e}")
+                    await asyncio.sleep(REAP_GUILD_PAUSE_SECONDS)
+            await asyncio.sleep(REAP_INTERVAL_SECONDS)
+
+    def _known_ids(self, guild_id: int) -> tuple:
+        """Channel and message IDs owned by the guild's live sessions and voice channel pool."""
+        channels, messages = set(), set()
+        for entry in active_sessions.for_guild(guild_id):
+            channels.update(filter(None, (entry.vc_id, entry.text_channel_id)))
+            messages.update(filter(None, (
+                entry.recruitment_message_id, entry.notify_message_id, entry.followup_message_id
+            )))
+        pool = self.bot.get_cog('VoiceChannelPool')
+        if pool:
+            channels.update(pool.pools.get(guild_id, ()))
+        return channels, messages
+
+    async def reap_guild(self, guild: discord.Guild, held_channels: set = frozenset()) -> Counter:
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            return Counter()
+        config = await load_config(firestore_cog, guild.id) or {}
+        cutoff = time.time() - ORPHAN_GRACE_SECONDS
+        reclaimed = Counter()
+
+        category = guild.get_channel(config.get("category_id") or 0)
+        if isinstance(category, discord.CategoryChannel):
+            await self._reap_channels(guild, category, cutoff, reclaimed, held_channels)
+
+        for key in ("allowed_channel_id", "notify_channel_id"):
+            channel = guild.get_channel(config.get(key) or 0)
+            if isinstance(channel, discord.TextChannel):
+                await self._reap_messages(guild, channel, cutoff, reclaimed)
+
+        self.last_pass[guild.id] = (time.time(), reclaimed)
+        if reclaimed:
+            self.reclaimed.update(reclaimed)
+            summary = ", ".join(f"{count} {kind}" for kind, count in sorted(reclaimed.items()))
+            print(f"Orphan reaper reclaimed {summary} in guild {guild.id}.")
+        return reclaimed
+
+    async def _reap_channels(self, guild, category, cutoff: float, reclaimed: Counter, held_channels: set):
+        known_channels, _ = self._known_ids(guild.id)
+        pool = self.bot.get_cog('VoiceChannelPool')
+        for vc in list(category.voice_channels):
+            # Known, too new, in use, or not one of ours: leave it alone
+            if vc.id in known_channels or vc.created_at.timestamp() > cutoff or vc.members:
+                continue
+            if vc.name == POOL_CHANNEL_NAME:
+                # A standby channel the pool forgot (e.g. after a restart) goes back into it if there's room
+                if pool and pool.adopt(vc):
+                    reclaimed["pool channels adopted"] += 1
+                    continue
+            elif vc.id not in held_channels and not channel_ledger.owns(guild.id, vc):
+                # Never a session's channel (e.g. an admin's "Study Session"): not ours to delete
+                continue
+
+            # Re-check right before deleting; a session may have claimed it meanwhile
+            if vc.id in self._known_ids(guild.id)[0]:
+                continue
+            try:
+                await vc.delete(reason="Scout Master: voice channel not owned by any live session.")
+                reclaimed["voice channels"] += 1
+                channel_ledger.release_channel(vc.id)
+            except discord.NotFound:
+                channel_ledger.release_channel(vc.id)
+            except discord.HTTPException as e:
+                print(f"Failed to delete orphaned voice channel {vc.id}: {e}")
+            await asyncio.sleep(DELETE_PAUSE_SECONDS)
+
+    async def _reap_messages(self, guild, channel, cutoff: float, reclaimed: Counter):
+        _, known_messages = self._known_ids(guild.id)
+        orphans = []
+        async for message in channel.history(limit=HISTORY_LIMIT):
+            if message.author.id != self.bot.user.id or message.created_at.timestamp() > cutoff:
+                continue
+            if message.id in known_messages or message.pinned:
+                continue
+            session_ids = session_ids_in(message)
+            if session_ids:
+                # Dead buttons: none of the sessions they point at are live
+                if not any(active_sessions.get(session_id) for session_id in session_ids):
+                    orphans.append(message)
+            elif NOTIFY_MESSAGE_MARKER in (message.content or ""):
+                orphans.append(message)
+        if not orphans:
+            return
+
+        bulk_cutoff = time.time() - BULK_DELETE_MAX_AGE_SECONDS
+        recent = [message for message in orphans if message.created_at.timestamp() > bulk_cutoff]
+        old = [message for message in orphans if message.created_at.timestamp() <= bulk_cutoff]
+        for start in range(0, len(recent), 100):
+            batch = recent[start:start + 100]
+            try:
+                if len(batch) == 1:
+                    await batch[0].delete()
+                else:
+                    await channel.delete_messages(batch, reason="Scout Master: messages of sessions that no longer exist.")
+                reclaimed["messages"] += len(batch)
+            except discord.HTTPException as e:
+                # Without Manage Messages, fall back to deleting one at a time
+                print(f"Bulk delete failed in channel {channel.id}: {e}")
+                old.extend(batch)
+            await asyncio.sleep(DELETE_PAUSE_SECONDS)
+        for message in old:
+            try:
+                await message.delete()
+                reclaimed["messages"] += 1
+            except discord.NotFound:
+                pass
+            except discord.HTTPException as e:
+                print(f"Failed to delete orphaned message {message.id}: {e}")
+            await asyncio.sleep(DELETE_PAUSE_SECONDS)
+
+    @commands.slash_command(
+        name="scout_reaper_status",
+        description="(bot owner) Show what the orphan reaper has reclaimed."
+    )
+    @commands.is_owner()
+    async def scout_reaper_status(self, interaction: discord.Interaction):
+        """Reports reclaimed channels and messages since startup."""
+        lines = ["**Orphan reaper**"]
+        if self.reclaimed:
+            lines += [f"{kind}: {count}" for kind, count in sorted(self.reclaimed.items())]
+        else:
+            lines.append("Nothing reclaimed since startup.")
+        if self.last_pass:
+            newest = max(finished for finished, _ in self.last_pass.values())
+            lines.append(f"Guilds checked: {len(self.last_pass)}, last <t:{int(newest)}:R>.")
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    @scout_reaper_status.error
+    async def scout_reaper_status_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the scout_reaper_status command."""
+        if isinstance(error, commands.NotOwner):
+            await interaction.response.send_message("Only the bot owner can use this command.", ephemeral=True)
+        else:
+            print(f"Unexpected error in /scout_reaper_status: {error}")
+
+
+def setup(bot):
+    bot.add_cog(OrphanReaper(bot))
@@ -0,0 +1,86 @@
+# cogs/overwrite_buffer.py
+import discord
+from cogs.debounce import Debouncer
+
+OVERWRITE_FLUSH_WINDOW_SECONDS = 1.5  # Joins/withdraws within this window share one edit
+OVERWRITE_RETRY_LIMIT = 3             # Failed edits retried on their own; later ones wait for the next change
+
+
+class OverwriteBuffer:
+    """Buffer voice channel permission changes and apply them as one channel edit.
+
+    The first change after an idle period is applied immediately; changes
+    that arrive while an edit is in flight or within the flush window are
+    merged and sent together as the channel's full overwrite map. Changes
+    from a failed edit are queued again under any newer ones and retried.
+    """
+
+    def __init__(self, window: float):
+        self.flushes = Debouncer(window)
+        self.pending = {}  # vc_id -> {target_id: (target, PermissionOverwrite or None)}
+        self.applied = {}  # vc_id -> {target_id: (target, PermissionOverwrite)} as last sent
+        self.failures = {}  # vc_id -> failed edits in a row
+
+    def grant(self, vc: discord.VoiceChannel, member):
+        """Let a member see and connect to the channel."""
+        self._queue(vc, member, discord.PermissionOverwrite(connect=True, view_channel=True))
+
+    def revoke(self, vc: discord.VoiceChannel, member):
+        """Remove a member's overwrite from the channel."""
+        self._queue(vc, member, None)
+
+    def discard(self, vc_id: int):
+        """Forget a channel's buffered changes (called at teardown)."""
+        self.flushes.cancel(vc_id)
+        self.pending.pop(vc_id, None)
+        self.applied.pop(vc_id, None)
+        self.failures.pop(vc_id, None)
+
+    def _queue(self, vc, target, overwrite):
+        self.pending.setdefault(vc.id, {})[target.id] = (target, overwrite)
+        self._schedule(vc)
+
+    def _schedule(self, vc):
+        async def flush():
+            await self._flush(vc)
+
+        self.flushes.trigger(vc.id, flush)
+
+    async def _flush(self, vc: discord.VoiceChannel):
+        changes = self.pending.pop(vc.id, None)
+        if not changes:
+            return
+
+        # Build on what was last sent rather than the cached channel, which may
+        # not have caught up with the previous edit's gateway update yet
+        applied = self.applied.get(vc.id)
+        if applied is None:
+            applied = {target.id: (target, overwrite) for target, overwrite in vc.overwrites.items()}
+        merged = dict(applied)
+        for target_id, (target, overwrite) in changes.items():
+            if overwrite is None:
+                merged.pop(target_id, None)
+            else:
+                merged[target_id] = (target, overwrite)
+
+        try:
+            await vc.edit(
+                overwrites={target: overwrite for target, overwrite in merged.values()},
+                reason="Scout Master roster changed."
+            )
+            self.applied[vc.id] = merged
+            self.failures.pop(vc.id, None)
+            print(f"Applied {len(changes)} permission change(s) to voice channel {vc.id} in one edit.")
+        except discord.NotFound:
+            self.discard(vc.id)
+        except discord.HTTPException as e:
+            # Changes queued since this edit started are newer and win
+            self.pending[vc.id] = {**changes, **self.pending.get(vc.id, {})}
+            failures = self.failures[vc.id] = self.failures.get(vc.id, 0) + 1
+            print(f"Failed to update permissions for voice channel {vc.id} (attempt {failures}): {e}")
+            if failures <= OVERWRITE_RETRY_LIMIT:
+                self._schedule(vc)
+
+
+# Shared by every session's Join/Withdraw handlers
+voice_overwrites = OverwriteBuffer(OVERWRITE_FLUSH_WINDOW_SECONDS)
@@ -0,0 +1,123 @@
+# cogs/plan_cache.py
+import asyncio
+import time
+from cogs.custom_images import load_custom_images_document, save_custom_images
+from cogs.discord_plans import get_guild_custom_image, get_guild_session_limit
+from cogs.storage import guarded_call
+
+PLAN_CACHE_TTL_SECONDS = 600  # Older entries are served once more while a refresh runs
+
+# str(guild_id) -> (session limit, fetched at)
+_limits = {}
+# str(guild_id) -> ({"images": {casefolded game name: image URL}, "migrated": bool} from the
+# guild's mappings document, fetched at)
+_guild_images = {}
+# (str(guild_id), casefolded game name) -> (image URL or None, fetched at), for guilds whose
+# mappings set before that document haven't been migrated into it yet
+_images = {}
+# Keys with a background refresh in flight
+_refreshing = set()
+
+
+def _refresh(cache: dict, key, fetch):
+    """Refresh one entry in the background, at most one refresh per key."""
+    if (id(cache), key) in _refreshing:
+        return
+    _refreshing.add((id(cache), key))
+
+    async def run():
+        try:
+            cache[key] = (await fetch(), time.time())
+        except Exception as e:
+            print(f"Error refreshing cached plan data for {key}: {e}")
+        finally:
+            _refreshing.discard((id(cache), key))
+
+    asyncio.create_task(run())
+
+
+async def _cached(cache: dict, key, fetch):
+    """Serve from `cache`, refreshing stale entries in the background (stale-while-revalidate)."""
+    cached = cache.get(key)
+    if cached is None:
+        value = await fetch()
+        cache[key] = (value, time.time())
+        return value
+    value, fetched_at = cached
+    if time.time() - fetched_at > PLAN_CACHE_TTL_SECONDS:
+        _refresh(cache, key, fetch)
+    return value
+
+
+async def session_limit(guild_id, firestore_cog=None) -> int:
+    """The guild's daily session limit (its plan tier), from cache when possible."""
+    guild_id = str(guild_id)
+    return await _cached(
+        _limits, guild_id, lambda: guarded_call(firestore_cog, "get_guild_session_limit", get_guild_session_limit, guild_id)
+    )
+
+
+async def _stored_images(firestore_cog, guild_id: str) -> dict:
+    mappings, migrated = await load_custom_images_document(firestore_cog, guild_id)
+    images = {game_name.strip().casefold(): image_url for game_name, image_url in mappings.items()}
+    return {"images": images, "migrated": migrated}
+
+
+async def custom_image(guild_id, game_name: str, firestore_cog=None):
+    """The guild's custom image URL for a game (or None), from cache when possible.
+
+    The guild's mappings document is the source of truth. Until a guild's
+    older per-game mappings have been migrated into it, a game missing from
+    it is looked up in the old store and, if found, copied over.
+    """
+    guild_id = str(guild_id)
+    key = game_name.strip().casefold()
+    stored = None
+    if firestore_cog is not None:
+        # One read covers every game the guild has mapped
+        stored = await _cached(_guild_images, guild_id, lambda: _stored_images(firestore_cog, guild_id))
+        if key in stored["images"]:
+            return stored["images"][key]
+        if stored["migrated"]:
+            return None
+    image_url = await _cached(
+        _images, (guild_id, key),
+        lambda: guarded_call(firestore_cog, "get_guild_custom_image", get_guild_custom_image, guild_id, game_name)
+    )
+    if image_url and stored is not None:
+        try:
+            await save_custom_images(firestore_cog, guild_id, {game_name: image_url})
+            stored["images"][key] = image_url
+            _images.pop((guild_id, key), None)
+        except Exception as e:
+            print(f"Error moving legacy custom image for guild {guild_id}: {e}")
+    return image_url
+
+
+def forget_guild(guild_id):
+    """Drop a guild's cached plan data after its entitlement or images change."""
+    guild_id = str(guild_id)
+    _limits.pop(guild_id, None)
+    _guild_images.pop(guild_id, None)
+    for key in [key for key in _images if key[0] == guild_id]:
+        del _images[key]
+
+
+def export_entries() -> dict:
+    """Plain-data copy of the caches for the warm-start snapshot."""
+    return {
+        "limits": {guild_id: list(entry) for guild_id, entry in _limits.items()},
+        "guild_images": {guild_id: list(entry) for guild_id, entry in _guild_images.items()},
+        "images": [[guild_id, game, url, fetched_at] for (guild_id, game), (url, fetched_at) in _images.items()],
+    }
+
+
+def import_entries(entries: dict):
+    """Load snapshot entries, keeping their age so stale ones refresh on first use."""
+    for guild_id, (value, fetched_at) in entries.get("limits", {}).items():
+        _limits.setdefault(guild_id, (value, fetched_at))
+    for guild_id, (stored, fetched_at) in entries.get("guild_images", {}).items():
+        if "images" in stored:  # Snapshots from before the migration flag are read again instead
+            _guild_images.setdefault(guild_id, (stored, fetched_at))
+    for guild_id, game, url, fetched_at in entries.get("images", []):
+        _images.setdefault((guild_id, game), (url, fetched_at))
@@ -4,8 +4,34 @@ from discord.ext import commands
 from discord.ui import Button, View
 import time
 import asyncio
-from cogs.discord_plans import get_guild_session_limit, get_guild_custom_image
+from cogs.plan_cache import custom_image, session_limit as cached_session_limit
 from cogs.reset_manager import get_reset_time
+from cogs.game_index import game_name_autocomplete, record_game
+from cogs.config_store import load_config
+from cogs.command_sync import command_mention
+from cogs.storage import (
+    STORAGE_UNAVAILABLE_MESSAGE,
+    StorageUnavailable,
+    get_storage,
+    is_storage_unavailable,
+    tag_operations
+)
+from cogs.vc_pool import release_voice_channel
+from cogs.channel_ledger import channel_ledger
+from cogs.session_scheduler import DEFAULT_TIMEZONE, PROVISION_LEAD_SECONDS, parse_game_time
+from cogs.session_index import active_sessions
+from cogs.session_archive import session_archive
+from cogs.usage_stats import (
+    load_usage,
+    record_session_finished,
+    record_session_started,
+    record_usage,
+    upgrade_hint
+)
+from cogs.session_model import WAITLIST_LIMIT, Session, save_session_changes
+from cogs.debounce import Debouncer
+from cogs.overwrite_buffer import voice_overwrites
+from cogs.fair_scheduler import fair_share, respond
 from datetime import datetime
 import pytz
 from cogs.constants import (
@@ -18,371 +44,551 @@ from cogs.constants import (
 )
 import uuid
 
+ROSTER_EDIT_WINDOW_SECONDS = 2  # Bursts of Join/Withdraw clicks collapse into one edit
+ROSTER_FIELD_LIMIT = 1024       # Discord's limit for an embed field value
+
+CUSTOM_ID_PREFIX = "scout"      # Session buttons use custom IDs like scout:<action>:<session_id>
+SESSION_ENDED_MESSAGE = "This session has already ended."
+SESSION_RECONCILE_DELAY_SECONDS = 30  # Snapshot-resumed sessions are checked against storage after this
+RESTORE_RETRY_SECONDS = 60           # Pause before retrying a restore that couldn't read storage
+RECONCILE_CONCURRENCY = 4            # Guilds whose sessions are read from storage at once
+
+# Debounced edits of recruitment embeds, keyed by session ID
+roster_updates = Debouncer(ROSTER_EDIT_WINDOW_SECONDS)
+
+
+def render_roster(embed: discord.Embed, crew_members, remaining_spots: int, waitlist=()) -> discord.Embed:
+    """Write the current roster, remaining spots and waitlist size into a recruitment embed."""
+    embed.clear_fields()
+    if remaining_spots > 0:
+        spots_text = f"We need **{remaining_spots}** more player{'s' if remaining_spots > 1 else ''}!"
+    else:
+        spots_text = "The session is full!"
+    embed.add_field(name="Spots left", value=spots_text, inline=False)
+
+    lines = []
+    length = 0
+    members = list(crew_members)
+    for index, user_id in enumerate(members):
+        line = f"<@{user_id}>"
+        more = f"...and {len(members) - index} more"
+        if length + len(line) + 1 + len(more) > ROSTER_FIELD_LIMIT:
+            lines.append(more)
+            break
+        lines.append(line)
+        length += len(line) + 1
+    embed.add_field(name=f"Crew ({len(members)})", value="\n".join(lines) or "Nobody yet", inline=False)
+    if waitlist:
+        embed.add_field(
+            name="Waitlist",
+            value=f"{len(waitlist)} waiting. Click Join to queue up; spots are filled in order.",
+            inline=False
+        )
+    return embed
+
+
+def session_custom_id(action: str, session_id: str) -> str:
+    """Custom ID of a session button, routed by Recruitment.on_interaction."""
+    return f"{CUSTOM_ID_PREFIX}:{action}:{session_id}"
+
+
+def recruitment_buttons(session_id: str) -> View:
+    """Join/Withdraw buttons for a recruitment message."""
+    view = View(timeout=None)
+    view.add_item(Button(
+        label="Join this Session", style=discord.ButtonStyle.success, custom_id=session_custom_id("join", session_id)
+    ))
+    view.add_item(Button(
+        label="Withdraw", style=discord.ButtonStyle.danger, custom_id=session_custom_id("withdraw", session_id)
+    ))
+    return view
+
+
+def cancel_button(session_id: str) -> View:
+    """Cancel Session button for the creator."""
+    view = View(timeout=None)
+    view.add_item(Button(
+        label="Cancel Session", style=discord.ButtonStyle.danger, custom_id=session_custom_id("cancel", session_id)
+    ))
+    return view
+
+
+async def send_with_buttons(send, view: View, **kwargs):
+    """Send a message carrying session buttons without keeping the view alive.
+
+    Clicks are routed by custom ID, so the view is dropped from the client's
+    view store as soon as the message is out; nothing per session stays
+    pinned in memory and the buttons keep working after a restart.
+    """
+    message = await send(view=view, **kwargs)
+    view.stop()
+    return message
+
+
+def render_session_embed(entry: Session) -> discord.Embed:
+    """Rebuild a session's recruitment embed from its stored template and roster."""
+    embed = discord.Embed.from_dict(entry.embed)
+    return render_roster(embed, entry.joined_users, entry.remaining_spots, entry.waitlist)
+
+
+async def resolve_member(guild: discord.Guild, user_id: int):
+    """Return a guild member from the cache, fetching it if needed (None if gone)."""
+    member = guild.get_member(user_id)
+    if member is None:
+        try:
+            member = await guild.fetch_member(user_id)
+        except discord.HTTPException:
+            return None
+    return member
 
 
-class RecruitmentView(View):
-    """View for recruitment actions like joining and withdrawing from a session."""
+class Recruitment(commands.Cog):
+    """Cog for handling recruitment commands."""
 
-    def __init__(
-        self,
-        bot: commands.Bot,
-        session_id: str,
-        guild: discord.Guild,
-        vc: discord.VoiceChannel,
-        text_channel: discord.TextChannel,
-        game_name: str,
-        session_creator: discord.Member,
-        joined_users: set,
-        remaining_spots: int,
-        allowed_channel_id: int,
-        notify_channel_id: int,
-        timeout: int  # Timeout in seconds
-    ):
-        super().__init__(timeout=timeout)
+    def __init__(self, bot):
         self.bot = bot
-        self.session_id = session_id
-        self.guild = guild
-        self.vc = vc
-        self.text_channel = text_channel
-        self.game_name = game_name
-        self.session_creator = session_creator
-        self.crew_members = set(joined_users)
-        self.remaining_spots = remaining_spots
-        self.allowed_channel_id = allowed_channel_id
-        self.notify_channel_id = notify_channel_id
-        print(f"RecruitmentView initialized for session_id: {self.session_id}")
-
-    @discord.ui.button(label="Join this Session", style=discord.ButtonStyle.success)
-    async def join(self, button: Button, interaction: discord.Interaction):
+        self.restored = False           # A restore has been started
+        self.restore_succeeded = False  # The index has been checked against storage
+        print("Recruitment cog initialized.")
+
+    async def open_voice_channel(self, guild, category, creator_name, game_name, members, pool_size):
+        """Create (or take from the pool) a session's voice channel.
+
+        `members` are granted access in the same request that creates or
+        re-permissions the channel. Returns `(vc, text_channel)`, or
+        `(None, None)` when the channel could not be set up.
+        """
+        # Members can see and connect; everyone else is locked out
+        vc_name = f"{creator_name}'s {game_name} Session"
+        vc_overwrites = {guild.default_role: discord.PermissionOverwrite(connect=False)}
+        for member in members:
+            vc_overwrites[member] = discord.PermissionOverwrite(connect=True, view_channel=True)
+
+        # Reuse a warm channel from the guild's pool when one is available
+        vc = None
+        pool = self.bot.get_cog('VoiceChannelPool')
+        if pool:
+            vc = await pool.acquire(guild, category, vc_name, vc_overwrites, pool_size)
+            if vc:
+                channel_ledger.claim(guild.id, channel_id=vc.id)
+
+        # Otherwise create the voice channel under the specified category without user limit
+        if vc is None:
+            # Claimed before it exists, so a crash before the session is stored can't hide it from the reaper
+            claim = channel_ledger.claim(guild.id, name=vc_name)
+            try:
+                vc = await guild.create_voice_channel(
+                    name=vc_name,
+                    category=category,
+                    overwrites=vc_overwrites
+                )
+                print(f"Voice channel '{vc_name}' created with ID {vc.id}")
+            except discord.HTTPException as e:
+                channel_ledger.release(claim)
+                print(f"Failed to create a voice channel: {e}")
+                return None, None
+            channel_ledger.bind(claim, vc.id)
+
+        # **Fetch the Associated Text Channel Using the Voice Channel's ID**
+        # This assumes that a text channel with the same ID as the voice channel exists
+        text_channel = guild.get_channel(vc.id)
+        if not text_channel:
+            print("Associated text channel not found.")
+            await release_voice_channel(self.bot, vc, reason="Session setup failed.")
+            channel_ledger.release_channel(vc.id)
+            return None, None
+        return vc, text_channel
+
+    async def close_voice_channel(self, guild: discord.Guild, vc_id: int, reason: str):
+        """Release a session's voice channel at teardown.
+
+        The channel stays claimed in the ledger until it is gone, so if the
+        release fails (or the bot dies first) the orphan reaper still knows
+        it was a session channel once the session is removed from storage.
+        """
+        voice_overwrites.discard(vc_id)
+        channel_ledger.claim(guild.id, channel_id=vc_id)
+        try:
+            vc = guild.get_channel(vc_id)
+            if vc:
+                await release_voice_channel(self.bot, vc, reason=reason)
+                print("Released voice channel.")
+            channel_ledger.release_channel(vc_id)
+        except discord.NotFound:
+            print("Voice channel already deleted.")
+            channel_ledger.release_channel(vc_id)
+        except Exception as e:
+            print(f"Error deleting voice channel: {e}")
+
+    async def notify_added_players(self, creator_name, game_name, vc, text_channel, additional_players):
+        """DM pre-added players a link to the voice channel and list them in its chat."""
+        for player in additional_players:
+            try:
+                # Notify the player via DM with a clickable link to the text channel
+                await player.send(
+                    f"You have been added to {creator_name}'s gaming session to play **{game_name}**! "
+                    f"Join the voice channel in the server: {vc.mention}"
+                )
+                print(f"Sent DM to added player {player}.")
+            except discord.Forbidden:
+                print(f"Could not send DM to {player.display_name}")
+            except discord.HTTPException:
+                print(f"Failed to send DM to {player.display_name}")
+
+        # **Notify Participants in the Associated Text Channel**
+        if additional_players:
+            mentions = ", ".join(player.mention for player in additional_players)
+            await text_channel.send(
+                f"The following players have been added to the session: {mentions}"
+            )
+            print("Notified additional players in the text channel.")
+
+    def session_job(self, method_name: str, *args):
+        """Build a scheduler callback that runs on whichever Recruitment cog is loaded when it fires."""
+        bot = self.bot
+
+        def callback():
+            return getattr(bot.get_cog('Recruitment'), method_name)(*args)
+        return callback
+
+    def export_state(self) -> dict:
+        return {
+            "roster_updates": roster_updates,
+            "restored": self.restored,
+            "restore_succeeded": self.restore_succeeded,
+        }
+
+    def import_state(self, state: dict):
+        # Module-level helpers from before the reload still use the old debouncer
+        global roster_updates
+        roster_updates = state["roster_updates"]
+        self.restored = state["restored"]
+        self.restore_succeeded = state["restore_succeeded"]
+
+    def schedule_roster_update(self, entry: Session):
+        """Edit the recruitment embed in place, debounced across bursts of clicks."""
+        session_id = entry.session_id
+
+        async def edit_message():
+            current = active_sessions.get(session_id)
+            channel = self.bot.get_channel(current.allowed_channel_id) if current else None
+            if channel:
+                message = channel.get_partial_message(current.recruitment_message_id)
+                await message.edit(embed=render_session_embed(current))
+
+        roster_updates.trigger(session_id, edit_message)
+
+        notify_digest = self.bot.get_cog('NotifyDigest')
+        if notify_digest:
+            notify_digest.refresh(self.bot.get_guild(entry.guild_id))
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        """Route session button clicks (scout:<action>:<session_id>) to their handlers."""
+        if interaction.type != discord.InteractionType.component:
+            return
+        prefix, _, rest = (interaction.data or {}).get("custom_id", "").partition(":")
+        action, _, session_id = rest.partition(":")
+        if prefix != CUSTOM_ID_PREFIX or not session_id:
+            return
+
+        handlers = {
+            "join": self.join_session,
+            "withdraw": self.withdraw_session,
+            "cancel": self.cancel_session,
+        }
+        handler = handlers.get(action)
+        if handler:
+            await handler(session_id, interaction)
+
+    @fair_share("join")
+    async def join_session(self, session_id: str, interaction: discord.Interaction):
         """Handle the Join button interaction."""
-        print(f"User {interaction.user} clicked Join button for session {self.session_id}")
+        print(f"User {interaction.user} clicked Join button for session {session_id}")
+        entry = active_sessions.get(session_id)
+        if entry is None:
+            await respond(interaction, SESSION_ENDED_MESSAGE, ephemeral=True)
+            return
         try:
-            if interaction.user.id in self.crew_members:
-                await interaction.response.send_message("You are already in the session!", ephemeral=True)
+            if interaction.user.id in entry.joined_users:
+                await respond(interaction, "You are already in the session!", ephemeral=True)
                 return
-            elif self.remaining_spots > 0:
-                firestore_cog = self.bot.get_cog('FirestoreCog')
+            elif interaction.user.id in entry.waitlist:
+                position = entry.waitlist.index(interaction.user.id) + 1
+                await respond(
+                    interaction,
+                    f"You are already #{position} on the waitlist. You'll be added automatically when a spot opens.",
+                    ephemeral=True
+                )
+                return
+            elif entry.remaining_spots > 0 and not entry.waitlist:
+                firestore_cog = get_storage(self.bot)
                 if not firestore_cog:
-                    await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+                    await respond(interaction, "Internal error: FirestoreCog not found.", ephemeral=True)
                     return
 
                 # Append user to 'joined_users' and decrement 'remaining_spots'
-                await firestore_cog.append_to_field(self.session_id, 'joined_users', interaction.user.id)
-                await firestore_cog.update_session_field(self.session_id, 'remaining_spots', self.remaining_spots - 1)
+                await firestore_cog.append_to_field(session_id, 'joined_users', interaction.user.id)
+                await firestore_cog.update_session_field(session_id, 'remaining_spots', entry.remaining_spots - 1)
 
-                self.crew_members.add(interaction.user.id)
-                self.remaining_spots -= 1
+                entry.joined_users.add(interaction.user.id)
+                entry.remaining_spots -= 1
+                record_usage(entry.guild_id, "joins")
 
-                # Set permissions
-                await self.vc.set_permissions(interaction.user, connect=True, view_channel=True)
+                # Scheduled sessions grant access when their voice channel opens
+                vc = interaction.guild.get_channel(entry.vc_id) if entry.vc_id else None
+                if vc:
+                    # Set permissions (buffered; applied with other joins in one channel edit)
+                    voice_overwrites.grant(vc, interaction.user)
 
-                # Notify the associated text channel
-                await self.text_channel.send(
-                    f"{interaction.user.mention} has joined the session!"
-                )
+                    # Notify the associated text channel
+                    text_channel = interaction.guild.get_channel(entry.text_channel_id)
+                    if text_channel:
+                        await text_channel.send(
+                            f"{interaction.user.mention} has joined the session!"
+                        )
 
-                # Fetch the recruitment channel
-                recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
-                if recruitment_channel:
-                    # Send the join message directly in the recruitment channel
-                    join_message = await recruitment_channel.send(
-                        f"{interaction.user.mention} has joined {self.session_creator.mention}'s session! Remaining spots: {self.remaining_spots}"
-                    )
-                    # Track the join message ID
-                    await firestore_cog.append_to_field(self.session_id, 'join_message_ids', join_message.id)
-                    print(f"Tracked join message with ID: {join_message.id}")
-                else:
-                    print(f"Recruitment channel with ID {self.allowed_channel_id} not found.")
+                # Show the new roster on the recruitment message
+                self.schedule_roster_update(entry)
 
                 # Optionally, send a confirmation to the user
-                await interaction.response.send_message(
+                await respond(
+                    interaction,
                     "✅ You have successfully joined the session! Look for your voice channel to join!",
                     ephemeral=True  # Set to True if you prefer only the user sees this
                 )
+            elif len(entry.waitlist) < WAITLIST_LIMIT:
+                firestore_cog = get_storage(self.bot)
+                if not firestore_cog:
+                    await respond(interaction, "Internal error: FirestoreCog not found.", ephemeral=True)
+                    return
+
+                # Queue the user in memory first so concurrent joins each see the other;
+                # storage gets an atomic append. A withdrawal promotes them without another click
+                entry.waitlist += (interaction.user.id,)
+                try:
+                    await firestore_cog.append_to_field(session_id, 'waitlist', interaction.user.id)
+                except Exception:
+                    entry.waitlist = tuple(user_id for user_id in entry.waitlist if user_id != interaction.user.id)
+                    raise
+                record_usage(entry.guild_id, "waitlisted")
+                self.schedule_roster_update(entry)
+
+                await respond(
+                    interaction,
+                    f"The session is full, so you're #{len(entry.waitlist)} on the waitlist. "
+                    "You'll be added automatically when a spot opens; no need to click again!",
+                    ephemeral=True
+                )
             else:
-                await interaction.response.send_message("The gaming session is already full!", ephemeral=True)
+                await respond(
+                    interaction,
+                    "The gaming session and its waitlist are already full!", ephemeral=True
+                )
+        except StorageUnavailable as e:
+            print(f"Storage unavailable in join method: {e}")
+            await respond(interaction, STORAGE_UNAVAILABLE_MESSAGE, ephemeral=True)
         except Exception as e:
             print(f"Error in join method: {e}")
-            await interaction.response.send_message("An error occurred while joining the session.", ephemeral=True)
+            await respond(interaction, "An error occurred while joining the session.", ephemeral=True)
 
-    @discord.ui.button(label="Withdraw", style=discord.ButtonStyle.danger)
-    async def withdraw(self, button: Button, interaction: discord.Interaction):
+    @fair_share("withdraw")
+    async def withdraw_session(self, session_id: str, interaction: discord.Interaction):
         """Handle the Withdraw button interaction."""
-        print(f"User {interaction.user} clicked Withdraw button for session {self.session_id}")
+        print(f"User {interaction.user} clicked Withdraw button for session {session_id}")
+        entry = active_sessions.get(session_id)
+        if entry is None:
+            await respond(interaction, SESSION_ENDED_MESSAGE, ephemeral=True)
+            return
         try:
-            if interaction.user.id in self.crew_members:
-                firestore_cog = self.bot.get_cog('FirestoreCog')
+            if interaction.user.id in entry.joined_users:
+                firestore_cog = get_storage(self.bot)
                 if not firestore_cog:
-                    await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+                    await respond(interaction, "Internal error: FirestoreCog not found.", ephemeral=True)
                     return
 
                 # Remove user from 'joined_users' and increment 'remaining_spots'
-                await firestore_cog.remove_from_field(self.session_id, 'joined_users', interaction.user.id)
-                await firestore_cog.update_session_field(self.session_id, 'remaining_spots', self.remaining_spots + 1)
+                await firestore_cog.remove_from_field(session_id, 'joined_users', interaction.user.id)
+                await firestore_cog.update_session_field(session_id, 'remaining_spots', entry.remaining_spots + 1)
 
-                self.crew_members.remove(interaction.user.id)
-                self.remaining_spots += 1
+                entry.joined_users.discard(interaction.user.id)
+                entry.remaining_spots += 1
+                record_usage(entry.guild_id, "withdrawals")
 
-                # Reset permissions
-                await self.vc.set_permissions(interaction.user, overwrite=None)
+                # Reset permissions (buffered like joins)
+                vc = interaction.guild.get_channel(entry.vc_id) if entry.vc_id else None
+                if vc:
+                    voice_overwrites.revoke(vc, interaction.user)
 
-                # Send the withdrawal message to the recruitment channel
-                recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
-                if recruitment_channel:
-                    try:
-                        withdraw_msg = await recruitment_channel.send(
-                            f"{interaction.user.mention} has withdrawn from {self.session_creator.mention}'s session. Remaining spots: {self.remaining_spots}"
-                        )
-                        # Track the withdrawal message ID
-                        await firestore_cog.append_to_field(self.session_id, 'withdraw_message_ids', withdraw_msg.id)
-                        print(f"Withdrawal message sent in recruitment channel with ID: {withdraw_msg.id}")
-                    except discord.Forbidden:
-                        print(f"Failed to send withdrawal message in {recruitment_channel}. Check bot permissions.")
-                    except discord.HTTPException as e:
-                        print(f"HTTPException when sending withdrawal message: {e}")
-                else:
-                    print(f"Recruitment channel with ID {self.allowed_channel_id} not found.")
+                # Hand the freed spot to the next user on the waitlist
+                await self.promote_from_waitlist(entry, interaction.guild, firestore_cog)
+
+                # Show the new roster on the recruitment message
+                self.schedule_roster_update(entry)
 
                 # Send confirmation to the user
-                await interaction.response.send_message(
+                await respond(
+                    interaction,
                     f"You have withdrawn from the session. Voice channel is now locked for you!",
                     ephemeral=True
                 )
-            else:
-                await interaction.response.send_message("You are not part of the session!", ephemeral=True)
-        except Exception as e:
-            print(f"Error in withdraw method: {e}")
-            await interaction.response.send_message("An error occurred while withdrawing from the session.", ephemeral=True)
-
-    async def on_timeout(self):
-        """Handle the view timeout by cleaning up the session."""
-        try:
-            firestore_cog = self.bot.get_cog('FirestoreCog')
-            if not firestore_cog:
-                print("FirestoreCog not found.")
-                return
-
-            session_data = await firestore_cog.load_session(self.session_id)
-            if not session_data:
-                print(f"Session {self.session_id} not found in Firestore during timeout cleanup.")
-                return
-
-            join_message_ids = session_data.get("join_message_ids", [])
-
-            # Delete all join session messages
-            for msg_id in join_message_ids:
-                try:
-                    recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
-                    if recruitment_channel:
-                        join_message = await recruitment_channel.fetch_message(msg_id)
-                        await join_message.delete()
-                        print(f"Deleted join session message ID: {msg_id}.")
-                except discord.NotFound:
-                    print(f"Join session message ID {msg_id} not found.")
-                except discord.HTTPException as e:
-                    print(f"Error deleting join session message ID {msg_id}: {e}")
-
-            # Retrieve recruitment_message_id
-            recruitment_message_id = session_data.get("recruitment_message_id")
-
-            if recruitment_message_id:
-                try:
-                    # Fetch the recruitment message and edit it to indicate recruitment has ended
-                    recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
-                    if recruitment_channel:
-                        recruitment_message = await recruitment_channel.fetch_message(recruitment_message_id)
-                        ended_embed = discord.Embed(
-                            title=f"Recruitment for {self.game_name} has ended",
-                            description=(
-                                f"The session is done!\n\n"
-                                f"Participants were:\n" +
-                                "\n".join(f"<@{user_id}>" for user_id in self.crew_members) + "\n"
-                                f"\nUse command </recruit:1330805308125347906> to start your own crew!"
-                            ),
-                            color=discord.Color.orange()
-                        )
-                        await recruitment_message.edit(embed=ended_embed, view=None)
-                        print(f"Edited recruitment message {recruitment_message_id} to indicate recruitment has ended.")
-                except discord.NotFound:
-                    print(f"Recruitment message {recruitment_message_id} not found.")
-                except Exception as e:
-                    print(f"Error editing recruitment message {recruitment_message_id}: {e}")
-
-            # Perform cleanup (delete other resources but keep recruitment message)
-            notify_message_id = session_data.get("notify_message_id")
-            join_message_ids = session_data.get("join_message_ids", [])
-            withdraw_message_ids = session_data.get("withdraw_message_ids", [])
-            vc_id = session_data.get("vc_id")
-            text_channel_id = session_data.get("text_channel_id")
-
-            # Delete notify message
-            if notify_message_id:
-                try:
-                    notify_channel = self.guild.get_channel(self.notify_channel_id)
-                    if notify_channel:
-                        notify_message = await notify_channel.fetch_message(notify_message_id)
-                        await notify_message.delete()
-                        print("Deleted notify message.")
-                except discord.NotFound:
-                    print("Notify message not found.")
-                except Exception as e:
-                    print(f"Error deleting notify message: {e}")
-
-            # Delete join messages (if any)
-            if join_message_ids:
-                for msg_id in join_message_ids:
-                    try:
-                        recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
-                        if recruitment_channel:
-                            join_message = await recruitment_channel.fetch_message(msg_id)
-                            await join_message.delete()
-                            print(f"Deleted join message {msg_id}.")
-                    except discord.NotFound:
-                        print(f"Join message {msg_id} not found.")
-                    except Exception as e:
-                        print(f"Error deleting join message {msg_id}: {e}")
-
-            # Delete withdraw messages from recruitment channel
-            for msg_id in withdraw_message_ids:
-                try:
-                    recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
-                    if recruitment_channel:
-                        withdraw_msg = await recruitment_channel.fetch_message(msg_id)
-                        await withdraw_msg.delete()
-                        print(f"Deleted withdraw message ID {msg_id}.")
-                except discord.NotFound:
-                    print(f"Withdraw message ID {msg_id} not found.")
-                except discord.HTTPException as e:
-                    print(f"Failed to delete withdrawal message ID {msg_id}: {e}")
-
-            # Delete the voice channel
-            if vc_id:
-                try:
-                    vc = self.guild.get_channel(vc_id)
-                    if vc:
-                        await vc.delete(reason="Session timed out.")
-                        print("Deleted voice channel.")
-                except discord.NotFound:
-                    print("Voice channel already deleted.")
-                except Exception as e:
-                    print(f"Error deleting voice channel: {e}")
+            elif interaction.user.id in entry.waitlist:
+                firestore_cog = get_storage(self.bot)
+                if not firestore_cog:
+                    await respond(interaction, "Internal error: FirestoreCog not found.", ephemeral=True)
+                    return
 
-            # Delete the follow-up message
-            followup_message_id = session_data.get("followup_message_id")
-            followup_channel_id = session_data.get("followup_channel_id")
-            if followup_message_id and followup_channel_id:
+                position = entry.waitlist.index(interaction.user.id)
+                entry.waitlist = tuple(user_id for user_id in entry.waitlist if user_id != interaction.user.id)
                 try:
-                    channel = self.guild.get_channel(followup_channel_id)
-                    if channel:
-                        followup_message = await channel.fetch_message(followup_message_id)
-                        await followup_message.delete()
-                        print("Deleted follow-up message.")
-                except discord.NotFound:
-                    print("Follow-up message already deleted.")
-                except discord.HTTPException as e:
-                    print(f"Failed to delete follow-up message: {e}")
+                    await firestore_cog.remove_from_field(session_id, 'waitlist', interaction.user.id)
+                except Exception:
+                    entry.waitlist = entry.waitlist[:position] + (interaction.user.id,) + entry.waitlist[position:]
+                    raise
+                self.schedule_roster_update(entry)
+                await respond(interaction, "You have left the waitlist.", ephemeral=True)
             else:
-                print("No follow-up message information found in session data.")
-
-            # Retain recruitment_message_id in Firestore
-            updated_data = {
-                "recruitment_message_id": session_data.get("recruitment_message_id")
-            }
-            await firestore_cog.save_session(self.session_id, updated_data)
-            print(f"Cleaned up session {self.session_id} but retained recruitment_message_id.")
-
+                await respond(interaction, "You are not part of the session!", ephemeral=True)
+        except StorageUnavailable as e:
+            print(f"Storage unavailable in withdraw method: {e}")
+            await respond(interaction, STORAGE_UNAVAILABLE_MESSAGE, ephemeral=True)
         except Exception as e:
-            print(f"Error in on_timeout for RecruitmentView {self.session_id}: {e}")
-
-class CancelSessionView(View):
-    """View for canceling a session by the creator."""
-
-    def __init__(
-        self,
-        bot: commands.Bot,
-        session_id: str,
-        vc: discord.VoiceChannel,
-        text_channel: discord.TextChannel,
-        allowed_channel_id: int,
-        notify_channel_id: int,
-        guild: discord.Guild
-    ):
-        super().__init__(timeout=None)
-        self.bot = bot
-        self.session_id = session_id
-        self.vc = vc
-        self.text_channel = text_channel
-        self.allowed_channel_id = allowed_channel_id
-        self.notify_channel_id = notify_channel_id
-        self.guild = guild
-        print(f"CancelSessionView initialized for session_id: {self.session_id}")
-
-    @discord.ui.button(label="Cancel Session", style=discord.ButtonStyle.danger)
-    async def cancel(self, button: Button, interaction: discord.Interaction):
+            print(f"Error in withdraw method: {e}")
+            await respond(interaction, "An error occurred while withdrawing from the session.", ephemeral=True)
+
+    async def promote_from_waitlist(self, entry: Session, guild: discord.Guild, firestore_cog):
+        """Move waitlisted users into free spots, in order, and let them know.
+
+        Users who left the server are skipped. Returns the promoted members.
+        """
+        snapshot = entry.snapshot()
+        promoted = []
+        while entry.waitlist and entry.remaining_spots > 0:
+            user_id, entry.waitlist = entry.waitlist[0], entry.waitlist[1:]
+            if user_id in entry.joined_users:
+                continue
+            member = await resolve_member(guild, user_id)
+            if member is None:
+                continue
+            entry.joined_users.add(user_id)
+            entry.remaining_spots -= 1
+            promoted.append(member)
+        await save_session_changes(firestore_cog, entry, snapshot)
+
+        vc = guild.get_channel(entry.vc_id) if entry.vc_id else None
+        text_channel = guild.get_channel(entry.text_channel_id) if entry.text_channel_id else None
+        for member in promoted:
+            print(f"Promoted {member} from the waitlist of session {entry.session_id}")
+            if vc:
+                voice_overwrites.grant(vc, member)
+            if text_channel:
+                await text_channel.send(f"{member.mention} has joined the session from the waitlist!")
+            where = f"Hop into {vc.mention}!" if vc else "You'll get access when the voice channel opens."
+            try:
+                await member.send(
+                    f"🎉 A spot opened up in the **{entry.game_name}** session in **{guild.name}** "
+                    f"and you've been moved off the waitlist. {where}"
+                )
+            except discord.HTTPException:
+                print(f"Could not DM {member} about their promotion.")
+        return promoted
+
+    def forget_session(self, session_id: str):
+        """Drop a session's in-memory state and pending jobs; returns its entry (or None)."""
+        entry = active_sessions.remove(session_id)
+        scheduler = self.bot.get_cog('SessionScheduler')
+        if scheduler:
+            scheduler.cancel(session_id)
+        roster_updates.cancel(session_id)
+        if entry:
+            notify_digest = self.bot.get_cog('NotifyDigest')
+            if notify_digest:
+                notify_digest.refresh(self.bot.get_guild(entry.guild_id))
+        return entry
+
+    @fair_share("cancel")
+    async def cancel_session(self, session_id: str, interaction: discord.Interaction):
         """Handle the Cancel Session button interaction."""
-        print(f"User {interaction.user} clicked Cancel button for session {self.session_id}")
+        print(f"User {interaction.user} clicked Cancel button for session {session_id}")
+        guild = interaction.guild
+        entry = active_sessions.get(session_id)
+        if entry is None:
+            await respond(
+                interaction,
+                "Session data not found. It might have already been canceled or timed out.", ephemeral=True
+            )
+            return
+        # Checked from the index so other members' clicks never cost a storage read
+        if interaction.user.id != entry.creator_id:
+            await respond(
+                interaction,
+                "Only the gaming session creator can cancel this session.", ephemeral=True
+            )
+            return
         try:
-            firestore_cog = self.bot.get_cog('FirestoreCog')
+            firestore_cog = get_storage(self.bot)
             if not firestore_cog:
-                await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+                await respond(interaction, "Internal error: FirestoreCog not found.", ephemeral=True)
                 return
 
-            session_data = await firestore_cog.load_session(self.session_id)
+            session_data = await firestore_cog.load_session(session_id)
             if not session_data:
-                await interaction.response.send_message(
+                await respond(
+                    interaction,
                     "Session data not found. It might have already been canceled or timed out.", ephemeral=True
                 )
                 return
 
-            creator_id = session_data.get('creator_id')
-            creator = self.guild.get_member(creator_id)
-            if not creator:
-                print(f"Creator with ID {creator_id} not found.")
-                await interaction.response.send_message(
-                    "Creator not found. Cannot cancel the session.", ephemeral=True
-                )
-                return
-
-            if interaction.user.id != creator.id:
-                await interaction.response.send_message(
-                    "Only the gaming session creator can cancel this session.", ephemeral=True
-                )
-                return
-
             # Send the confirmation message BEFORE deleting channels
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 "The gaming session has been successfully canceled.",
                 ephemeral=True
             )
             print("Sent cancellation confirmation message.")
 
+        except StorageUnavailable as e:
+            print(f"Storage unavailable in cancel method: {e}")
+            await respond(interaction, STORAGE_UNAVAILABLE_MESSAGE, ephemeral=True)
+            return
         except Exception as e:
             print(f"Error in sending confirmation message: {e}")
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 "An error occurred while canceling the session.",
                 ephemeral=True
             )
             return
 
+        # Stop the session's buttons and any pending scheduled job
+        self.forget_session(session_id)
+        session_archive.record(entry, "canceled")
+        record_session_finished(entry, canceled=True)
+
+        # The slow deletes run outside the handler slot
+        asyncio.create_task(self.cancel_teardown(guild, entry, session_data, firestore_cog))
+
+    async def cancel_teardown(self, guild: discord.Guild, entry: Session, session_data: dict, firestore_cog):
+        """Delete a canceled session's messages and channels and remove it from storage."""
+        session_id = entry.session_id
+        allowed_channel_id = entry.allowed_channel_id
+        notify_channel_id = entry.notify_channel_id
         try:
             # Proceed to delete messages and channels
             notify_message_id = session_data.get("notify_message_id")
             recruitment_message_id = session_data.get("recruitment_message_id")
-            join_message_ids = session_data.get("join_message_ids", [])
-            withdraw_message_ids = session_data.get("withdraw_message_ids", [])
             vc_id = session_data.get("vc_id")
             text_channel_id = session_data.get("text_channel_id")
 
             # Delete the @everyone notify message
             if notify_message_id:
                 try:
-                    notify_channel = self.guild.get_channel(self.notify_channel_id)
+                    notify_channel = guild.get_channel(notify_channel_id)
                     if notify_channel:
-                        notify_message = await notify_channel.fetch_message(notify_message_id)
-                        await notify_message.delete()
+                        await notify_channel.get_partial_message(notify_message_id).delete()
                         print("Deleted @everyone notify message.")
                     else:
-                        print(f"Notify channel ID {self.notify_channel_id} not found.")
+                        print(f"Notify channel ID {notify_channel_id} not found.")
                 except discord.NotFound:
                     print("Notify message already deleted.")
                 except discord.HTTPException as e:
@@ -391,78 +597,41 @@ class CancelSessionView(View):
             # Delete the recruitment message
             if recruitment_message_id:
                 try:
-                    recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
+                    recruitment_channel = guild.get_channel(allowed_channel_id)
                     if recruitment_channel:
-                        recruitment_message = await recruitment_channel.fetch_message(recruitment_message_id)
-                        await recruitment_message.delete()
+                        await recruitment_channel.get_partial_message(recruitment_message_id).delete()
                         print("Deleted recruitment message.")
                     else:
-                        print(f"Recruitment channel ID {self.allowed_channel_id} not found.")
+                        print(f"Recruitment channel ID {allowed_channel_id} not found.")
                 except discord.NotFound:
                     print("Recruitment message already deleted.")
                 except discord.HTTPException as e:
                     print(f"Failed to delete recruitment message: {e}")
 
-            # Delete all join messages from recruitment channel
-            if join_message_ids:
-                for msg_id in join_message_ids:
-                    try:
-                        recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
-                        if recruitment_channel:
-                            join_message = await recruitment_channel.fetch_message(msg_id)
-                            await join_message.delete()
-                            print(f"Deleted join message ID {msg_id}.")
-                    except discord.NotFound:
-                        print(f"Join message ID {msg_id} already deleted.")
-                    except discord.HTTPException as e:
-                        print(f"Error deleting join message ID {msg_id}: {e}")
-
-            # Delete all withdraw messages from recruitment channel
-            for msg_id in withdraw_message_ids:
-                try:
-                    recruitment_channel = self.guild.get_channel(self.allowed_channel_id)
-                    if recruitment_channel:
-                        withdraw_msg = await recruitment_channel.fetch_message(msg_id)
-                        await withdraw_msg.delete()
-                        print(f"Deleted withdraw message ID {msg_id}.")
-                except discord.NotFound:
-                    print(f"Withdraw message ID {msg_id} already deleted.")
-                except discord.HTTPException as e:
-                    print(f"Failed to delete withdrawal message ID {msg_id}: {e}")
-
             # Notify participants in the allowed channel
-            allowed_channel = self.guild.get_channel(self.allowed_channel_id)
+            allowed_channel = guild.get_channel(allowed_channel_id)
             if allowed_channel:
                 mentions = " ".join(f"<@{user_id}>" for user_id in session_data.get("joined_users", []))
                 await allowed_channel.send(
-                    f"The gaming session to play **{session_data.get('game_name', 'a game')}**, hosted by {creator.mention}, has been canceled. "
+                    f"The gaming session to play **{session_data.get('game_name', 'a game')}**, hosted by <@{entry.creator_id}>, has been canceled. "
                     f"Apologies to anyone who joined: {mentions}"
                 )
                 print("Notified participants about session cancellation.")
             else:
-                print(f"Allowed channel ID {self.allowed_channel_id} not found.")
+                print(f"Allowed channel ID {allowed_channel_id} not found.")
 
             # Delete the voice channel if it still exists
             if vc_id:
-                try:
-                    vc = self.guild.get_channel(vc_id)
-                    if vc:
-                        await vc.delete(reason="Gaming session canceled by the creator.")
-                        print("Deleted voice channel.")
-                except discord.NotFound:
-                    print("Voice channel already deleted.")
-                except Exception as e:
-                    print(f"Error deleting voice channel: {e}")
+                await self.close_voice_channel(guild, vc_id, "Gaming session canceled by the creator.")
 
             # Delete the follow-up message
             followup_message_id = session_data.get("followup_message_id")
             followup_channel_id = session_data.get("followup_channel_id")
             if followup_message_id and followup_channel_id:
                 try:
-                    channel = self.guild.get_channel(followup_channel_id)
+                    channel = guild.get_channel(followup_channel_id)
                     if channel:
-                        followup_message = await channel.fetch_message(followup_message_id)
-                        await followup_message.delete()
+                        await channel.get_partial_message(followup_message_id).delete()
                         print("Deleted follow-up message.")
                 except discord.NotFound:
                     print("Follow-up message already deleted.")
@@ -471,32 +640,30 @@ class CancelSessionView(View):
             else:
                 print("No follow-up message information found in session data.")
 
-            # Delete the text channel
-            if text_channel_id:
+            # Delete the text channel (unless it is the voice channel's own chat,
+            # which was released above)
+            if text_channel_id and text_channel_id != vc_id:
                 try:
-                    text_channel = self.guild.get_channel(text_channel_id)
+                    text_channel = guild.get_channel(text_channel_id)
                     if text_channel:
-                        await text_channel.delete(reason="Session timed out.")
+                        await text_channel.delete(reason="Gaming session canceled by the creator.")
                         print("Deleted text channel.")
                 except discord.NotFound:
                     print("Text channel already deleted.")
                 except Exception as e:
                     print(f"Error deleting text channel: {e}")
 
-            # Retain recruitment_message_id in Firestore
-            updated_data = {
-                "recruitment_message_id": session_data.get("recruitment_message_id")
-            }
-            await firestore_cog.save_session(self.session_id, updated_data)
-            print(f"Cleaned up session {self.session_id} but retained recruitment_message_id.")
+            # The session is in the archive now; only live sessions stay in Firestore
+            await firestore_cog.remove_session(session_id)
+            print(f"Cleaned up session {session_id} and moved it to the archive.")
 
         except Exception as e:
             print(f"Error in cancel session: {e}")
 
             # Delete the text channel if it still exists
-            if text_channel_id:
+            if text_channel_id and text_channel_id != vc_id:
                 try:
-                    text_channel = self.guild.get_channel(text_channel_id)
+                    text_channel = guild.get_channel(text_channel_id)
                     if text_channel:
                         await text_channel.delete(reason="Gaming session canceled by the creator.")
                         print("Deleted text channel.")
@@ -506,21 +673,325 @@ class CancelSessionView(View):
                     print(f"Error deleting text channel: {e}")
 
             # Remove session from Firestore
-            await firestore_cog.remove_session(self.session_id)
-            print(f"Session {self.session_id} cleaned up successfully.")
+            await firestore_cog.remove_session(session_id)
+            print(f"Session {session_id} cleaned up successfully.")
+
+    async def end_session(self, session_id: str):
+        """End a session (its time is up or its voice channel stayed empty) with the normal teardown."""
+        entry = self.forget_session(session_id)
+        if entry is None:
+            return  # Already torn down
+        session_archive.record(entry, "ended")
+        record_session_finished(entry, canceled=False)
+        guild = self.bot.get_guild(entry.guild_id)
+        if guild is None:
+            return
+        # Not in a handler slot: channel and message deletes can be slow and would hold up interactions
+        with tag_operations("session teardown", guild.id):
+            await self.tear_down(guild, entry)
 
-class Recruitment(commands.Cog):
-    """Cog for handling recruitment commands."""
+    async def tear_down(self, guild: discord.Guild, entry: Session):
+        """Remove the session's channels and messages and release its voice channel."""
+        session_id = entry.session_id
+        try:
+            firestore_cog = get_storage(self.bot)
+            if not firestore_cog:
+                print("FirestoreCog not found.")
+                return
 
-    def __init__(self, bot):
-        self.bot = bot
-        print("Recruitment cog initialized.")
+            session_data = await firestore_cog.load_session(session_id)
+            if not session_data:
+                print(f"Session {session_id} not found in Firestore during timeout cleanup.")
+                return
+
+            # Retrieve recruitment_message_id
+            recruitment_message_id = session_data.get("recruitment_message_id")
+
+            if recruitment_message_id:
+                try:
+                    # Edit the recruitment message to indicate recruitment has ended
+                    recruitment_channel = guild.get_channel(entry.allowed_channel_id)
+                    if recruitment_channel:
+                        ended_embed = discord.Embed(
+                            title=f"Recruitment for {entry.game_name} has ended",
+                            description=(
+                                f"The session is done!\n\n"
+                                f"Participants were:\n" +
+                                "\n".join(f"<@{user_id}>" for user_id in entry.joined_users) + "\n"
+                                f"\nUse command {command_mention('recruit')} to start your own crew!"
+                            ),
+                            color=discord.Color.orange()
+                        )
+                        await recruitment_channel.get_partial_message(recruitment_message_id).edit(
+                            embed=ended_embed, view=None
+                        )
+                        print(f"Edited recruitment message {recruitment_message_id} to indicate recruitment has ended.")
+                except discord.NotFound:
+                    print(f"Recruitment message {recruitment_message_id} not found.")
+                except Exception as e:
+                    print(f"Error editing recruitment message {recruitment_message_id}: {e}")
+
+            # Perform cleanup (delete other resources but keep recruitment message)
+            notify_message_id = session_data.get("notify_message_id")
+            vc_id = session_data.get("vc_id")
+
+            # Delete notify message
+            if notify_message_id:
+                try:
+                    notify_channel = guild.get_channel(entry.notify_channel_id)
+                    if notify_channel:
+                        await notify_channel.get_partial_message(notify_message_id).delete()
+                        print("Deleted notify message.")
+                except discord.NotFound:
+                    print("Notify message not found.")
+                except Exception as e:
+                    print(f"Error deleting notify message: {e}")
+
+            # Delete the voice channel
+            if vc_id:
+                await self.close_voice_channel(guild, vc_id, "Session timed out.")
+
+            # Delete the follow-up message
+            followup_message_id = session_data.get("followup_message_id")
+            followup_channel_id = session_data.get("followup_channel_id")
+            if followup_message_id and followup_channel_id:
+                try:
+                    channel = guild.get_channel(followup_channel_id)
+                    if channel:
+                        await channel.get_partial_message(followup_message_id).delete()
+                        print("Deleted follow-up message.")
+                except discord.NotFound:
+                    print("Follow-up message already deleted.")
+                except discord.HTTPException as e:
+                    print(f"Failed to delete follow-up message: {e}")
+            else:
+                print("No follow-up message information found in session data.")
+
+            # The session is in the archive now; only live sessions stay in Firestore
+            await firestore_cog.remove_session(session_id)
+            print(f"Cleaned up session {session_id} and moved it to the archive.")
+
+        except Exception as e:
+            print(f"Error tearing down session {session_id}: {e}")
+
+    async def provision_scheduled_session(self, session_id: str, additional_player_ids: list, hours_playing: int):
+        """Open the voice channel for a scheduled session and start its clock."""
+        entry = active_sessions.get(session_id)
+        if entry is None:
+            return  # Canceled before it started
+        firestore_cog = get_storage(self.bot)
+        scheduler = self.bot.get_cog('SessionScheduler')
+        guild = self.bot.get_guild(entry.guild_id)
+        if not firestore_cog or not scheduler or not guild:
+            print("FirestoreCog, SessionScheduler or guild not found. Cannot provision session.")
+            return
+
+        end_at = time.time() + PROVISION_LEAD_SECONDS + hours_playing * 3600
+        scheduler.schedule(session_id, end_at, self.session_job("end_session", session_id))
+
+        config = await load_config(firestore_cog, guild.id) or {}
+        category = discord.utils.get(guild.categories, id=config.get("category_id"))
+        if not category:
+            print(f"Category for scheduled session {session_id} not found.")
+            return
+
+        session_creator = await resolve_member(guild, entry.creator_id)
+        creator_name = session_creator.display_name if session_creator else "Scout"
+        members = [guild.get_member(user_id) or discord.Object(id=user_id) for user_id in entry.joined_users]
+        vc, text_channel = await self.open_voice_channel(
+            guild, category, creator_name, entry.game_name, members, config.get("vc_pool_size", 0)
+        )
+        if not vc:
+            print(f"Failed to open voice channel for scheduled session {session_id}.")
+            return
+        snapshot = entry.snapshot()
+        active_sessions.set_vc(session_id, vc.id)
+        entry.text_channel_id = text_channel.id
+        entry.start_time = time.time()
+        await save_session_changes(firestore_cog, entry, snapshot)
+        channel_ledger.release_channel(vc.id)  # Owned by the stored session now
+
+        additional_players = [member for member in map(guild.get_member, additional_player_ids) if member]
+        await self.notify_added_players(creator_name, entry.game_name, vc, text_channel, additional_players)
+        mentions = " ".join(f"<@{user_id}>" for user_id in entry.joined_users)
+        await send_with_buttons(
+            text_channel.send,
+            cancel_button(session_id),
+            content=(
+                f"Your **{entry.game_name}** session is about to start! {mentions}\n"
+                f"<@{entry.creator_id}>, if you have to cancel, click the Cancel Session button below."
+            )
+        )
+        print(f"Provisioned voice channel {vc.id} for scheduled session {session_id}.")
+
+        voice_monitor = self.bot.get_cog('VoiceMonitor')
+        if voice_monitor:
+            voice_monitor.watch(session_id)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # on_ready fires again after reconnects; only restore once per process
+        if self.restored:
+            return
+        self.restored = True
+        # Until storage has been read the index may be missing sessions; the orphan reaper waits for this
+        confirmed = await self.restore_sessions()
+        while not confirmed:
+            print(f"Sessions not fully restored. Retrying in {RESTORE_RETRY_SECONDS}s.")
+            await asyncio.sleep(RESTORE_RETRY_SECONDS)
+            confirmed = await self.reconcile_sessions()
+        self.restore_succeeded = True
+
+    async def restore_sessions(self) -> bool:
+        """Rebuild live sessions and their timers after a restart.
+
+        Sessions preloaded from the warm-start snapshot are resumed at once
+        and reconciled with storage shortly after; otherwise they are read
+        from storage, guild by guild, by the same reconcile. Buttons are
+        routed by custom ID, so once a session is back in the index its old
+        messages work again without re-sending anything. Returns False if
+        storage couldn't be read.
+        """
+        firestore_cog = get_storage(self.bot)
+        scheduler = self.bot.get_cog('SessionScheduler')
+        if not firestore_cog or not scheduler:
+            print("FirestoreCog or SessionScheduler not found. Sessions not restored.")
+            return False
+
+        warm = list(active_sessions.sessions.values())
+        if warm:
+            resumed = 0
+            for session in warm:
+                active_sessions.remove(session.session_id)
+                if await self.resume_session(firestore_cog, scheduler, session):
+                    resumed += 1
+            print(f"Resumed {resumed} live sessions from the warm-start snapshot.")
+            await asyncio.sleep(SESSION_RECONCILE_DELAY_SECONDS)
+        return await self.reconcile_sessions()
+
+    async def resume_session(self, firestore_cog, scheduler, session: Session) -> bool:
+        """Put a session back in the index and re-arm its timers; False if its guild is gone."""
+        guild = self.bot.get_guild(int(session.guild_id or 0))
+        if guild is None:
+            return False
+        session.guild_id = guild.id
+
+        # Sessions saved before these fields existed fall back to the guild config
+        config = await load_config(firestore_cog, guild.id) or {}
+        if session.allowed_channel_id is None:
+            session.allowed_channel_id = config.get("allowed_channel_id")
+        if session.notify_channel_id is None:
+            session.notify_channel_id = config.get("notify_channel_id")
+        if session.remaining_spots is None:
+            session.remaining_spots = session.player_count or 0
+        if session.embed is None:
+            session.embed = discord.Embed(
+                title=f"Recruiting Players for {session.game_name}", color=discord.Color.blue()
+            ).to_dict()
+        session.created_at = session.start_time or session.created_at or time.time()
+        active_sessions.add(session)
+        if session.game_name:
+            record_game(guild.id, session.game_name, used_at=session.created_at)
+
+        hours_playing = session.hours_playing or 1
+        if session.vc_id:
+            end_at = session.created_at + hours_playing * 3600
+            scheduler.schedule(session.session_id, end_at, self.session_job("end_session", session.session_id))
+            voice_monitor = self.bot.get_cog('VoiceMonitor')
+            if voice_monitor:
+                voice_monitor.watch(session.session_id)
+        elif session.scheduled_start:
+            scheduler.schedule(
+                session.session_id,
+                session.scheduled_start - PROVISION_LEAD_SECONDS,
+                self.session_job("provision_scheduled_session", session.session_id, [], hours_playing)
+            )
+        return True
+
+    async def reconcile_sessions(self) -> bool:
+        """Bring the session index in line with storage. Returns False if storage couldn't be read.
+
+        Each guild's sessions are read with their own query, a few guilds at
+        a time, rather than streaming the whole collection. The snapshot can
+        be a few minutes old: stored fields are taken from storage, sessions
+        missing from the index are resumed and sessions no longer stored are
+        dropped. A guild whose read fails is left as it is.
+        """
+        firestore_cog = get_storage(self.bot)
+        scheduler = self.bot.get_cog('SessionScheduler')
+        if not firestore_cog or not scheduler:
+            return False
+        semaphore = asyncio.Semaphore(RECONCILE_CONCURRENCY)
+
+        async def reconcile(guild):
+            async with semaphore:
+                return await self.reconcile_guild(firestore_cog, scheduler, guild)
+
+        results = await asyncio.gather(*(reconcile(guild) for guild in self.bot.guilds))
+        counts = [result for result in results if result is not None]
+        added, updated, dropped = (sum(column) for column in zip((0, 0, 0), *counts))
+        failed = len(results) - len(counts)
+        print(
+            f"Reconciled sessions with storage: {added} added, {updated} updated, {dropped} dropped"
+            + (f"; {failed} guild(s) couldn't be read." if failed else ".")
+        )
+        return not failed
+
+    async def reconcile_guild(self, firestore_cog, scheduler, guild: discord.Guild):
+        """Reconcile one guild's sessions. Returns (added, updated, dropped), or None if the read failed."""
+        started = time.time()
+        try:
+            with tag_operations("session restore", guild.id):
+                session_docs = await firestore_cog.run_query(
+                    "live_sessions",
+                    # Older sessions stored the guild ID as a string
+                    lambda: list(
+                        firestore_cog.sessions_collection.where('guild_id', 'in', [guild.id, str(guild.id)]).stream()
+                    )
+                )
+        except Exception as e:
+            print(f"Error reconciling sessions with storage for guild {guild.id}: {e}")
+            return None
+
+        stored = set()
+        added = updated = 0
+        for session_doc in session_docs:
+            data = session_doc.to_dict() or {}
+            # Ended sessions only keep their recruitment_message_id
+            if not data.get("creator_id") or not data.get("recruitment_message_id"):
+                continue
+            stored.add(session_doc.id)
+            fresh = Session.from_document(session_doc.id, data)
+            entry = active_sessions.get(session_doc.id)
+            if entry is None:
+                if await self.resume_session(firestore_cog, scheduler, fresh):
+                    added += 1
+                continue
+            changes = entry.diff(fresh.snapshot())
+            if changes:
+                for name in changes:
+                    # Keep config fallbacks filled in at resume time
+                    if name != "vc_id" and getattr(fresh, name) is not None:
+                        setattr(entry, name, getattr(fresh, name))
+                if fresh.vc_id and fresh.vc_id != entry.vc_id:
+                    active_sessions.set_vc(entry.session_id, fresh.vc_id)
+                self.schedule_roster_update(entry)
+                updated += 1
+
+        dropped = 0
+        for entry in active_sessions.for_guild(guild.id):
+            # Sessions created since the query started aren't in its results yet
+            if entry.session_id not in stored and (entry.created_at or 0) < started:
+                self.forget_session(entry.session_id)
+                dropped += 1
+        return added, updated, dropped
 
     @commands.slash_command(name="recruit", description="Recruit players for a game session")
+    @fair_share("recruit")  # Throttled and queued per guild before any usage or config reads
     async def recruit(
         self,
         interaction: discord.Interaction,
-        game_name: str,
+        game_name: discord.Option(str, "The game you want to play", autocomplete=game_name_autocomplete),
         player_count: int,
         game_time: str,
         hours_playing: int,
@@ -530,13 +1001,13 @@ class Recruitment(commands.Cog):
     ):
         guild_id = interaction.guild.id
         user_id = interaction.user.id
-        firestore_cog = self.bot.get_cog('FirestoreCog')
+        firestore_cog = get_storage(self.bot)
         if not firestore_cog:
-            await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+            await respond(interaction, "Internal error: FirestoreCog not found.", ephemeral=True)
             return
 
         # Server-wide daily limit
-        session_limit = await get_guild_session_limit(str(guild_id))
+        session_limit = await cached_session_limit(guild_id, firestore_cog)
 
         # Fetch guild-wide daily usage
         guild_daily_usage = await firestore_cog.get_daily_usage(guild_id)
@@ -549,20 +1020,26 @@ class Recruitment(commands.Cog):
             remaining_minutes = int((remaining % 3600) // 60)
             reset_dt = datetime.fromtimestamp(reset_time, pytz.timezone('US/Eastern'))
             reset_time_str = reset_dt.strftime('%I:%M %p EST')
-            await interaction.response.send_message(
+            record_usage(guild_id, "limit_hits")
+            await load_usage(firestore_cog, guild_id)
+            hint = upgrade_hint(guild_id)
+            await respond(
+                interaction,
                 f"🚨 This server has reached its **daily limit of {session_limit} sessions.**\n\n"
                 f"⏰ Please wait {remaining_hours} hours and {remaining_minutes} minutes until the reset at {reset_time_str}. \n\n"
-                f"⏫ Server owners can increase session limit by using command </upgrade_scoutmaster:1330785705542287434> ",
+                + (f"{hint}\n\n" if hint else "") +
+                f"⏫ Server owners can increase session limit by using command {command_mention('upgrade_scoutmaster')} ",
                 ephemeral=True
             )
             print(f"Guild limit reached: {session_limit} sessions.")
             return
 
         # Load guild configuration
-        config = await firestore_cog.load_config(guild_id)
+        config = await load_config(firestore_cog, guild_id)
         if not config:
-            await interaction.response.send_message(
-                "🚨 Configuration not found for this server. Please run </setup_scout_master1330805308125347907 first.> 🚨",
+            await respond(
+                interaction,
+                f"🚨 Configuration not found for this server. Please run {command_mention('setup_scout_master')} first. 🚨",
                 ephemeral=True
             )
             print("Configuration not found for the guild.")
@@ -572,7 +1049,8 @@ class Recruitment(commands.Cog):
         if role_restrictions:
             user_roles = [role.id for role in interaction.user.roles]
             if not any(role_id in user_roles for role_id in role_restrictions):
-                await interaction.response.send_message(
+                await respond(
+                    interaction,
                     "You do not have the required role to use this command. Talk with the server owner!",
                  ephemeral=True
                 )
@@ -596,7 +1074,8 @@ class Recruitment(commands.Cog):
             remaining_minutes = int((remaining % 3600) // 60)
             reset_dt = datetime.fromtimestamp(reset_time, pytz.timezone('US/Eastern'))
             reset_time_str = reset_dt.strftime('%I:%M %p EST')
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"🚨 You reached your limit of {user_usage_limit} per day. The next reset is at {reset_time_str}. \n\n"
                 f"⏰ Please wait {remaining_hours} hours and {remaining_minutes} minutes until the reset at {reset_time_str}.",
                 ephemeral=True
@@ -610,26 +1089,17 @@ class Recruitment(commands.Cog):
         user_usage_count += 1
         await firestore_cog.set_daily_usage(guild_id, usage_count=user_usage_count, user_id=user_id)
 
-        
         print(f"Guild usage updated: {guild_usage_count}, User usage updated: {user_usage_count}")
-        
-        async def count_active_sessions(firestore_cog, guild_id: int, user_id: int = None) -> int:
-            try:
-                query = firestore_cog.sessions_collection.where('guild_id', '==', guild_id)
-                if user_id is not None:
-                    query = query.where('creator_id', '==', user_id)
-                sessions = await asyncio.to_thread(lambda: list(query.stream()))
-                return len(sessions)
-            except Exception as e:
-                print(f"Error counting active sessions for guild {guild_id}, user {user_id}: {e}")
-                return 0
-
-        active_guild_sessions = await count_active_sessions(firestore_cog, guild_id)
-        print(f"User {user_id} has {active_guild_sessions} active sessions.")
+
+        # Live sessions are all in the index, so counting them costs no reads
+        guild_sessions = active_sessions.for_guild(guild_id)
+        active_guild_sessions = len(guild_sessions)
+        print(f"Guild {guild_id} has {active_guild_sessions} active sessions.")
 
         # 3) If user has reached or exceeded the limit, block creation
         if active_guild_sessions >= session_limit:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"You've reached your limit of {session_limit} sessions for your current plan. "
                 f"Please upgrade your plan or end an existing session.",
                 ephemeral=True
@@ -637,9 +1107,10 @@ class Recruitment(commands.Cog):
             print(f"User {user_id} has reached the session limit: {session_limit}")
             return
 
-        active_user_sessions = await count_active_sessions(firestore_cog, guild_id, user_id)
+        active_user_sessions = sum(1 for entry in guild_sessions if entry.creator_id == user_id)
         if active_user_sessions >= session_limit:
-            await interaction.response.send_message(
+            await respond(
+                interaction,
                 f"You've reached your limit of {session_limit} active sessions for your current plan. "
                 f"Please end an existing session before creating a new one.",
                 ephemeral=True
@@ -647,43 +1118,12 @@ class Recruitment(commands.Cog):
             print(f"User {user_id} has reached the session limit of {session_limit}.")
             return
 
-        
-        
         session_id = str(uuid.uuid4())
-        session_data = await firestore_cog.load_session(session_id)
-        
-        if session_data:
-            start_time = session_data.get("start_time", 0)
-            current_time = time.time()
-            reset_time = await get_reset_time()
-
-            if current_time < reset_time:
-                user_usage = await firestore_cog.get_daily_usage(guild_id, user_id)
-                if not user_usage:
-                    # If usage data is missing, clean up the session and proceed
-                    print(f"Mismatch detected for session {session_id}. Cleaning up...")
-                    await firestore_cog.remove_session(session_id)
-                else:
-                    remaining = reset_time - current_time
-                    remaining_hours = int(remaining // 3600)
-                    remaining_minutes = int((remaining % 3600) // 60)
-                    reset_dt = datetime.fromtimestamp(reset_time, pytz.timezone('US/Eastern'))
-                    reset_time_str = reset_dt.strftime('%I:%M %p EST')
-
-                    await interaction.response.send_message(
-                        f"You reached your limit of {user_usage_limit} per day. The next reset is at {reset_time_str}. "
-                        f"Please wait {remaining_hours} hours and {remaining_minutes} minutes until the reset.",
-                        ephemeral=True
-                    )
-                    print(f"Session cooldown active for user {user_id}.")
-                    return
-            else:
-                # Cooldown has expired; remove the session to allow reuse
-                await firestore_cog.remove_session(session_id)
-                print(f"Session cooldown expired for user {user_id}. Removed session.")
 
         print("Recruit command invoked")
-        await interaction.response.defer()  # Defer the interaction
+        if not interaction.response.is_done():  # Already deferred if it queued for a slot
+            # Private, like the fair_share defer: errors below reply into it
+            await interaction.response.defer(ephemeral=True)
 
         try:
             # Track session creator and joined users
@@ -716,11 +1156,23 @@ class Recruitment(commands.Cog):
             timeout_seconds = hours_playing * 3600  # Convert hours to seconds
             print(f"Timeout set to {timeout_seconds} seconds based on hours_playing={hours_playing}")
 
+            # Sessions starting well in the future get their voice channel later
+            start_at = parse_game_time(game_time, config.get("timezone", DEFAULT_TIMEZONE))
+            deferred = start_at is not None and start_at - time.time() > PROVISION_LEAD_SECONDS
+            if start_at is not None:
+                game_time_text = f"<t:{int(start_at)}:F> (<t:{int(start_at)}:R>)"
+            else:
+                game_time_text = f"**{game_time}**"
+            if deferred:
+                channel_text = "The voice channel opens shortly before the start time, and the voice channel and session will automatically be deleted afterward."
+            else:
+                channel_text = "the voice channel and session will automatically be deleted afterward."
+
             # Embed for recruitment message
             default_image_url = 'https://cdn.discordapp.com/attachments/808508638918475808/1328923195855867905/scoutmaster.jpg'
-            session_limit = await get_guild_session_limit(str(guild_id))
+            session_limit = await cached_session_limit(guild_id, firestore_cog)
             if session_limit > 3:
-                possible_custom_image = await get_guild_custom_image(str(guild_id), game_name)
+                possible_custom_image = await custom_image(guild_id, game_name, firestore_cog)
                 if possible_custom_image:
                     image_url = possible_custom_image
                     print("Using premium custom image.")
@@ -735,9 +1187,8 @@ class Recruitment(commands.Cog):
             embed = discord.Embed(
                 title=f"Recruiting Players for {game_name}",
                 description=(
-                    f"Join **{session_creator.mention}**'s gaming session{added_players_text} happening at **{game_time}**!\n\n"
-                    f"They will be playing for about **{hours_playing} hour/s**, and the voice channel and session will automatically be deleted afterward.\n\n"
-                    f"We need **{remaining_spots}** more player{'s' if remaining_spots > 1 else ''}! "
+                    f"Join **{session_creator.mention}**'s gaming session{added_players_text} happening at {game_time_text}!\n\n"
+                    f"They will be playing for about **{hours_playing} hour/s**, and {channel_text}\n\n"
                     f"Click the buttons below to join or withdraw."
                 ),
                 color=discord.Color.blue()
@@ -754,69 +1205,30 @@ class Recruitment(commands.Cog):
                 print("Specified category does not exist.")
                 return
 
-            # Create the voice channel under the specified category without user limit
-            vc_name = f"{session_creator.display_name}'s {game_name} Session"
-            try:
-                vc = await interaction.guild.create_voice_channel(
-                    name=vc_name,
-                    category=category
-                )
-                print(f"Voice channel '{vc_name}' created with ID {vc.id}")
-            except discord.HTTPException as e:
-                print(f"Failed to create a voice channel: {e}")
-                await interaction.followup.send(
-                    "Failed to create a voice channel. Please try again later.",
-                    ephemeral=True
-                )
-                return
-
-            # **Fetch the Associated Text Channel Using the Voice Channel's ID**
-            # This assumes that a text channel with the same ID as the voice channel exists
-            text_channel = interaction.guild.get_channel(vc.id)
-            if not text_channel:
-                await interaction.followup.send(
-                    "Error: Failed to find the associated text channel.",
-                    ephemeral=True
-                )
-                print("Associated text channel not found.")
-                return
-
-            # **Set Permissions for the Creator**
-            try:
-                await vc.set_permissions(session_creator, connect=True, view_channel=True)
-                await vc.set_permissions(interaction.guild.default_role, connect=False)
-                print(f"Permissions set for creator {session_creator} in voice channel.")
-            except discord.HTTPException as e:
-                print(f"Failed to set permissions for the voice channel: {e}")
-                await interaction.followup.send(
-                    "Failed to set permissions for the voice channel. Please try again later.",
-                    ephemeral=True
+            if deferred:
+                # Scheduled for later: only the post and roster exist until
+                # shortly before the start time
+                vc = None
+                text_channel = None
+                joined_users.update(player.id for player in additional_players)
+                print(f"Session {session_id} deferred until {start_at} (game_time={game_time!r}).")
+            else:
+                vc, text_channel = await self.open_voice_channel(
+                    interaction.guild,
+                    category,
+                    session_creator.display_name,
+                    game_name,
+                    [session_creator] + additional_players,
+                    config.get("vc_pool_size", 0)
                 )
-                return
-
-            # **Add Pre-specified Players**
-            for player in additional_players:
-                try:
-                    await vc.set_permissions(player, connect=True, view_channel=True)
-                    joined_users.add(player.id)
-                    # Notify the player via DM with a clickable link to the text channel
-                    await player.send(
-                        f"You have been added to {session_creator.display_name}'s gaming session to play **{game_name}**! "
-                        f"Join the voice channel in the server: {vc.mention}"
+                if not vc:
+                    await interaction.followup.send(
+                        "Failed to create a voice channel. Please try again later.",
+                        ephemeral=True
                     )
-                    print(f"Added {player} to voice channel permissions and sent DM.")
-                except discord.Forbidden:
-                    print(f"Could not send DM to {player.display_name}")
-                except discord.HTTPException:
-                    print(f"Failed to set permissions for {player.display_name}")
-
-            # **Notify Participants in the Associated Text Channel**
-            if additional_players:
-                mentions = ", ".join(player.mention for player in additional_players)
-                await text_channel.send(
-                    f"The following players have been added to the session: {mentions}"
-                )
-                print("Notified additional players in the text channel.")
+                    return
+                joined_users.update(player.id for player in additional_players)
+                await self.notify_added_players(session_creator.display_name, game_name, vc, text_channel, additional_players)
 
             # **Fetch the Notification Channel by Its ID**
             notify_channel = interaction.guild.get_channel(notify_channel_id)
@@ -828,18 +1240,39 @@ class Recruitment(commands.Cog):
                 print("Notification channel not found.")
                 return
 
-            # **Send the Notification Message to the Notification Channel**
-            if use_mention and interaction.guild.me.guild_permissions.mention_everyone:
-                try:
-                    notify_message = await notify_channel.send(
-                        content=(
-                            f"Hey @everyone! **{session_creator.mention}** has started a gaming session to play **{game_name}**!"
-                            f" Join the recruitment channel here: <#{allowed_channel_id}>"
+            # Digest mode lists the session in the pinned digest instead
+            notify_digest = self.bot.get_cog('NotifyDigest')
+            digest_mode = bool(notify_digest) and config.get("notify_digest", False)
+            notify_message = None
+            if not digest_mode:
+                # **Send the Notification Message to the Notification Channel**
+                if use_mention and interaction.guild.me.guild_permissions.mention_everyone:
+                    try:
+                        notify_message = await notify_channel.send(
+                            content=(
+                                f"Hey @everyone! **{session_creator.mention}** has started a gaming session to play **{game_name}**!"
+                                f" Join the recruitment channel here: <#{allowed_channel_id}>"
+                            )
                         )
-                    )
-                    print("Sent @everyone notification message.")
-                except discord.HTTPException as e:
-                    print(f"Failed to send @everyone message: {e}")
+                        print("Sent @everyone notification message.")
+                    except discord.HTTPException as e:
+                        print(f"Failed to send @everyone message: {e}")
+                        try:
+                            notify_message = await notify_channel.send(
+                                content=(
+                                    f"**{session_creator.mention}** has started a gaming session to play **{game_name}**!"
+                                    f" Join the recruitment channel here: <#{allowed_channel_id}>"
+                                )
+                            )
+                            print("Sent notification message without @everyone mention.")
+                        except discord.HTTPException as e:
+                            print(f"Failed to send fallback notification message: {e}")
+                            await interaction.followup.send(
+                                "Failed to send notification message. Please check the bot's permissions.",
+                                ephemeral=True
+                            )
+                            return
+                else:
                     try:
                         notify_message = await notify_channel.send(
                             content=(
@@ -849,44 +1282,12 @@ class Recruitment(commands.Cog):
                         )
                         print("Sent notification message without @everyone mention.")
                     except discord.HTTPException as e:
-                        print(f"Failed to send fallback notification message: {e}")
+                        print(f"Failed to send notification message: {e}")
                         await interaction.followup.send(
                             "Failed to send notification message. Please check the bot's permissions.",
                             ephemeral=True
                         )
                         return
-            else:
-                try:
-                    notify_message = await notify_channel.send(
-                        content=(
-                            f"**{session_creator.mention}** has started a gaming session to play **{game_name}**!"
-                            f" Join the recruitment channel here: <#{allowed_channel_id}>"
-                        )
-                    )
-                    print("Sent notification message without @everyone mention.")
-                except discord.HTTPException as e:
-                    print(f"Failed to send notification message: {e}")
-                    await interaction.followup.send(
-                        "Failed to send notification message. Please check the bot's permissions.",
-                        ephemeral=True
-                    )
-                    return
-
-            # **Add RecruitmentView to Send Recruitment Message with Buttons**
-            view = RecruitmentView(
-                self.bot,  # Pass the bot instance
-                session_id,
-                interaction.guild,  # Corrected: pass guild object
-                vc,
-                text_channel,
-                game_name,
-                session_creator,
-                joined_users,
-                remaining_spots,
-                allowed_channel_id,
-                notify_channel_id,
-                timeout_seconds  # Dynamic timeout
-            )
 
             # **Send the Recruitment Message to the Allowed Channel**
             allowed_channel = interaction.guild.get_channel(allowed_channel_id)
@@ -898,70 +1299,124 @@ class Recruitment(commands.Cog):
                 print("Allowed recruitment channel not found.")
                 return
 
-            recruitment_message = await allowed_channel.send(
-                embed=embed,
-                view=view
+            # The roster is re-rendered onto this template as players join and withdraw
+            embed_template = embed.to_dict()
+            recruitment_message = await send_with_buttons(
+                allowed_channel.send,
+                recruitment_buttons(session_id),
+                embed=render_roster(embed, joined_users, remaining_spots)
             )
             print(f"Sent recruitment message to allowed channel ID {allowed_channel_id} with message ID {recruitment_message.id}")
 
-            # **Add Session to Firestore, Including notify_message_id and Lists for join/withdraw messages**
+            # **Add Session to Firestore, Including notify_message_id**
             print(f"Saving session with ID: {session_id}")  # Debugging
 
             # Save recruitment_message_id first
-            session_data = {
-                "creator_id": session_creator.id,
-                "game_name": game_name,
-                "player_count": player_count,
-                "game_time": game_time,
-                "vc_id": vc.id,
-                "text_channel_id": text_channel.id,
-                "joined_users": list(joined_users),
-                "notify_message_id": notify_message.id,                # Store the notify message ID
-                "recruitment_message_id": recruitment_message.id,      # Initialize recruitment_message_id
-                "join_message_ids": [],                                # List to store join message IDs
-                "withdraw_message_ids": [],
-                # "followup_message_id": followup_message.id,           # Remove from here
-                # "followup_channel_id": interaction.channel.id,       # Remove from here
-                "start_time": time.time(),                             # Record the current timestamp
-                "hours_playing": hours_playing                         # New field
-            }
-            await firestore_cog.add_session(session_id, session_data)
+            session = Session(
+                session_id,
+                guild_id=guild_id,
+                creator_id=session_creator.id,
+                game_name=game_name,
+                player_count=player_count,
+                game_time=game_time,
+                hours_playing=hours_playing,
+                remaining_spots=remaining_spots,
+                joined_users=joined_users,
+                vc_id=vc.id if vc else None,
+                text_channel_id=text_channel.id if text_channel else None,
+                allowed_channel_id=allowed_channel_id,
+                notify_channel_id=notify_channel_id,
+                notify_message_id=notify_message.id if notify_message else None,  # Store the notify message ID
+                recruitment_message_id=recruitment_message.id,
+                start_time=None if deferred else time.time(),  # Set when the voice channel opens
+                scheduled_start=start_at,                      # Parsed game_time (None if unparsed)
+                embed=embed_template,                          # Lets the buttons work after a restart
+                created_at=time.time(),
+            )
+            await firestore_cog.add_session(session_id, session.to_document())
             print(f"Session {session_id} added to Firestore.")
-
-            # **Attach CancelSessionView to the Session's Text Channel**
-            await text_channel.send(
-                f"Welcome {session_creator.mention} to your gaming session VC! If you have to cancel, click the Cancel Session button below.",
-                view=CancelSessionView(
-                    self.bot,  # Pass the bot instance
-                    session_id,
-                    vc,
-                    text_channel,
-                    allowed_channel_id,
-                    notify_channel_id,
-                    interaction.guild  # Corrected: pass interaction.guild
+            if vc:
+                channel_ledger.release_channel(vc.id)  # Owned by the stored session now
+            record_game(guild_id, game_name)
+            record_session_started(guild_id, game_name)
+            active_sessions.add(session)
+            if digest_mode:
+                await notify_digest.session_started(interaction.guild, session_creator, game_name)
+
+            # **Attach the Cancel Session Button to the Session's Text Channel**
+            if not deferred:
+                await send_with_buttons(
+                    text_channel.send,
+                    cancel_button(session_id),
+                    content=f"Welcome {session_creator.mention} to your gaming session VC! If you have to cancel, click the Cancel Session button below."
                 )
-            )
-            print("Attached CancelSessionView to the text channel.")
+                print("Attached Cancel Session button to the text channel.")
 
             # **Send the Follow-Up Message with Line Break and Emoji**
-            followup_message = await interaction.followup.send(
-                content=(
-                    f"✅ Recruitment session created!\n\n"  # Line break
-                    f"🔥 This server has **{session_limit - guild_usage_count}** session(s) left today!"  # Fire emoji
-                ),
-                ephemeral=False
+            # Scheduled sessions have no text channel yet, so the creator's
+            # Cancel button rides on the follow-up message instead
+            followup_content = (
+                f"✅ Recruitment session created!\n\n"  # Line break
+                f"🔥 This server has **{session_limit - guild_usage_count}** session(s) left today!"  # Fire emoji
             )
+            if guild_usage_count >= session_limit:
+                # That was the last one today; nudge toward an upgrade if it keeps happening
+                await load_usage(firestore_cog, guild_id)
+                hint = upgrade_hint(guild_id)
+                if hint:
+                    followup_content += f"\n\n{hint} Server owners can raise the limit with {command_mention('upgrade_scoutmaster')}."
+            # The first followup fills the private deferred reply; the announcement is a public one after it
+            await interaction.followup.send("✅ Your session is set up! The details are posted below.", ephemeral=True)
+            if deferred:
+                followup_message = await send_with_buttons(
+                    interaction.followup.send,
+                    cancel_button(session_id),
+                    content=followup_content + f"\n\n🗓️ The voice channel opens <t:{int(start_at - PROVISION_LEAD_SECONDS)}:R>.",
+                    ephemeral=False
+                )
+            else:
+                followup_message = await interaction.followup.send(
+                    content=followup_content,
+                    ephemeral=False
+                )
             print("Sent minimal follow-up message to conclude the interaction.")
 
-            # **Update session_data with followup_message_id and save again**
-            session_data['followup_message_id'] = followup_message.id
-            session_data['followup_channel_id'] = interaction.channel.id
-            await firestore_cog.save_session(session_id, session_data)
+            # **Store the follow-up message** (only these fields; joins may already have landed)
+            snapshot = session.snapshot()
+            session.followup_message_id = followup_message.id
+            session.followup_channel_id = interaction.channel.id
+            await save_session_changes(firestore_cog, session, snapshot)
             print(f"Follow-up message stored: ID {followup_message.id} in channel {interaction.channel.id}")
 
-            asyncio.create_task(view.wait())
-            print("RecruitmentView is now active and waiting for interactions.")
+            # The scheduler ends every session, so nothing per session waits in memory
+            scheduler = self.bot.get_cog('SessionScheduler')
+            if not scheduler:
+                print("SessionScheduler not found. Session will not be provisioned or ended automatically.")
+            elif deferred:
+                scheduler.schedule(
+                    session_id,
+                    start_at - PROVISION_LEAD_SECONDS,
+                    self.session_job(
+                        "provision_scheduled_session", session_id,
+                        [player.id for player in additional_players], hours_playing
+                    )
+                )
+                print(f"Scheduled voice channel for session {session_id}.")
+            else:
+                scheduler.schedule(
+                    session_id, time.time() + timeout_seconds, self.session_job("end_session", session_id)
+                )
+
+            if not deferred:
+                voice_monitor = self.bot.get_cog('VoiceMonitor')
+                if voice_monitor:
+                    voice_monitor.watch(session_id)
 
+            print(f"Session {session_id} is live; its buttons are routed by custom ID.")
+
+        except StorageUnavailable as e:
+            print(f"Storage unavailable in recruit command: {e}")
+            await interaction.followup.send(STORAGE_UNAVAILABLE_MESSAGE, ephemeral=True)
         except Exception as e:
             print(f"Error in recruit command: {e}")
             try:
@@ -973,5 +1428,18 @@ class Recruitment(commands.Cog):
             except Exception as ex:
                 print(f"Failed to send error follow-up message: {ex}")
 
+    @recruit.error
+    async def recruit_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for failures before the recruit command defers (usage and config reads)."""
+        if is_storage_unavailable(error):
+            message = STORAGE_UNAVAILABLE_MESSAGE
+        else:
+            message = "An unexpected error occurred while executing the command. Please try again later."
+            print(f"Unexpected error in /recruit: {error}")
+        if interaction.response.is_done():
+            await interaction.followup.send(message, ephemeral=True)
+        else:
+            await respond(interaction, message, ephemeral=True)
+
 def setup(bot):
     bot.add_cog(Recruitment(bot))
@@ -0,0 +1,102 @@
+# cogs/reloader.py
+import time
+import discord
+from discord.ext import commands
+from cogs.command_sync import sync_command_tree
+
+
+async def loaded_extension_autocomplete(ctx: discord.AutocompleteContext):
+    """Autocomplete provider listing the bot's loaded extensions."""
+    value = (ctx.value or "").lower()
+    return [name for name in sorted(ctx.bot.extensions) if value in name.lower()][:25]
+
+
+class Reloader(commands.Cog):
+    """Cog that reloads extensions in place without restarting the bot.
+
+    Cogs may define `export_state() -> dict` and `import_state(state)`. The
+    old instance's state is exported before the reload and handed to the new
+    instance afterwards, so live sessions, timers and caches carry over.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        print("Reloader cog initialized.")
+
+    def cogs_from(self, extension: str) -> list:
+        return [cog for cog in self.bot.cogs.values() if type(cog).__module__ == extension]
+
+    def reload_with_handoff(self, extension: str) -> list:
+        """Reload an extension, handing state from its old cogs to the new ones.
+
+        Returns the names of the cogs whose state was handed over. Errors from
+        the reload itself propagate after the state has been restored to
+        whatever cogs are loaded (py-cord rolls back to the old module).
+        """
+        states = {}
+        for cog in self.cogs_from(extension):
+            if hasattr(cog, "export_state"):
+                states[cog.qualified_name] = cog.export_state()
+
+        try:
+            self.bot.reload_extension(extension)
+        finally:
+            handed_over = []
+            for name, state in states.items():
+                cog = self.bot.get_cog(name)
+                if cog is None or not hasattr(cog, "import_state"):
+                    print(f"No cog named {name} to hand state to after reloading {extension}.")
+                    continue
+                try:
+                    cog.import_state(state)
+                    handed_over.append(name)
+                except Exception as e:
+                    print(f"Failed to hand state over to {name}: {e}")
+        return handed_over
+
+    @commands.slash_command(
+        name="reload",
+        description="(bot owner) Reload a cog in place, keeping live sessions running."
+    )
+    @commands.is_owner()
+    async def reload(
+        self,
+        interaction: discord.Interaction,
+        extension: discord.Option(str, "Extension to reload, e.g. cogs.recruitment", autocomplete=loaded_extension_autocomplete),
+        sync_commands: discord.Option(bool, "Force a slash command sync (changed commands are synced anyway)", default=False),
+    ):
+        """Reloads one extension and optionally re-syncs the command tree."""
+        if extension not in self.bot.extensions:
+            await interaction.response.send_message(f"`{extension}` is not loaded.", ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        started = time.perf_counter()
+        try:
+            handed_over = self.reload_with_handoff(extension)
+        except Exception as e:
+            print(f"Failed to reload {extension}: {e}")
+            await interaction.followup.send(f"❌ Failed to reload `{extension}`: {e}", ephemeral=True)
+            return
+
+        # Reloaded commands lose their IDs; this re-attaches them, syncing only if they changed
+        await sync_command_tree(self.bot, force=sync_commands)
+        elapsed = time.perf_counter() - started
+        print(f"Reloaded {extension} in {elapsed:.2f}s (state handed to: {', '.join(handed_over) or 'none'}).")
+        await interaction.followup.send(
+            f"✅ Reloaded `{extension}` in {elapsed:.2f}s. "
+            f"State handed over: {', '.join(handed_over) or 'none'}.",
+            ephemeral=True
+        )
+
+    @reload.error
+    async def reload_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the reload command."""
+        if isinstance(error, commands.NotOwner):
+            await interaction.response.send_message("Only the bot owner can use this command.", ephemeral=True)
+        else:
+            print(f"Unexpected error in /reload: {error}")
+
+
+def setup(bot):
+    bot.add_cog(Reloader(bot))
@@ -9,6 +9,10 @@ from cogs.constants import (
     RESET_HOUR,
     RESET_MINUTE
 )
+from cogs.storage import tag_operations
+from cogs.session_index import active_sessions
+from cogs.session_model import Session
+from cogs.session_archive import session_archive
 
 async def get_reset_time() -> float:
     """Calculate the next reset time as a UNIX timestamp."""
@@ -34,28 +38,39 @@ async def reset_usage(firestore_cog):
 
         try:
             # Convert guild_docs generator to a list for synchronous iteration
-            guild_docs = list(firestore_cog.db.collection(DAILY_USAGE_COLLECTION).stream())
+            with tag_operations("daily reset"):
+                guild_docs = await firestore_cog.run_query(
+                    "daily_usage", lambda: list(firestore_cog.db.collection(DAILY_USAGE_COLLECTION).stream())
+                )
             for guild_doc in guild_docs:
                 guild_id = guild_doc.id
-                await firestore_cog.set_daily_usage(guild_id, usage_count=0)
+                with tag_operations("daily reset", guild_id):
+                    await firestore_cog.set_daily_usage(guild_id, usage_count=0)
 
-                # Convert user_docs generator to a list
-                user_docs = list(
-                    firestore_cog.db.collection(DAILY_USAGE_COLLECTION)
-                    .document(guild_id)
-                    .collection(USER_USAGE_SUBCOLLECTION)
-                    .stream()
-                )
-                for user_doc in user_docs:
-                    user_id = user_doc.id
-                    await firestore_cog.set_daily_usage(guild_id, usage_count=0, user_id=int(user_id))
+                    # Convert user_docs generator to a list
+                    user_docs = await firestore_cog.run_query("user_usage", lambda: list(
+                        firestore_cog.db.collection(DAILY_USAGE_COLLECTION)
+                        .document(guild_id)
+                        .collection(USER_USAGE_SUBCOLLECTION)
+                        .stream()
+                    ))
+                    for user_doc in user_docs:
+                        user_id = user_doc.id
+                        await firestore_cog.set_daily_usage(guild_id, usage_count=0, user_id=int(user_id))
 
-                # Convert session_docs generator to a list
-                session_docs = list(
-                    firestore_cog.sessions_collection.where('guild_id', '==', guild_id).stream()
-                )
-                for session_doc in session_docs:
-                    await firestore_cog.remove_session(session_doc.id)
+                    # Finished sessions are archived as they end, so anything left here
+                    # that isn't live was orphaned (e.g. by a crash mid-teardown)
+                    session_docs = await firestore_cog.run_query("guild_sessions", lambda: list(
+                        # Session documents store guild_id as an int; older ones as a string
+                        firestore_cog.sessions_collection.where('guild_id', 'in', [int(guild_id), guild_id]).stream()
+                    ))
+                    for session_doc in session_docs:
+                        if active_sessions.get(session_doc.id):
+                            continue
+                        session_archive.record(
+                            Session.from_document(session_doc.id, session_doc.to_dict() or {}), "orphaned"
+                        )
+                        await firestore_cog.remove_session(session_doc.id)
 
                 print(f"Reset usage counts and cleaned up sessions for guild {guild_id}.")
 
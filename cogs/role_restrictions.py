@@ -3,6 +3,11 @@ from discord.ext import commands
 from discord.ui import View, Select
 from cogs.discord_plans import get_guild_session_limit, update_entitlements_from_api  # Ensure this import is correct
 from cogs.firestore import FirestoreCog  # Update the import path as per your project structure
+from cogs.command_sync import command_mention
+from cogs.config_store import update_config
+from cogs.storage import get_storage, guarded_call
+
+MAX_SELECTED_ROLES = 25  # Discord's limit for values in a single select
 
 class RoleRestrictions(commands.Cog):
     """Cog for managing role restrictions for premium guilds."""
@@ -19,24 +24,30 @@ class RoleRestrictions(commands.Cog):
     async def set_role_restrictions(self, interaction: discord.Interaction):
         """Command for admins to set role restrictions."""
         guild_id = str(interaction.guild.id)
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
 
         # Perform an on-demand entitlement check
-        await update_entitlements_from_api()
+        await guarded_call(firestore_cog, "update_entitlements_from_api", update_entitlements_from_api)
 
         # Check if the guild is premium
-        session_limit = await get_guild_session_limit(guild_id)
+        session_limit = await guarded_call(firestore_cog, "get_guild_session_limit", get_guild_session_limit, guild_id)
         if session_limit <= 3:  # Assuming 3 is the free limit
             await interaction.response.send_message(
-                "Role restrictions are only available for premium servers. Use </upgrade_scoutmaster:1330785705542287434> to access this feature.",
+                f"Role restrictions are only available for premium servers. Use {command_mention('upgrade_scoutmaster')} to access this feature.",
                 ephemeral=True
             )
             return
 
-        # Fetch roles in the guild
-        roles = interaction.guild.roles
-        options = [discord.SelectOption(label=role.name, value=str(role.id)) for role in roles if not role.managed]
+        # Only check that an assignable role exists; the native role select
+        # lists and searches the guild's roles itself
+        has_assignable_role = any(
+            not role.managed and not role.is_default() for role in interaction.guild.roles
+        )
 
-        if not options:
+        if not has_assignable_role:
             await interaction.response.send_message(
                 "No roles found to restrict. Please create roles first.",
                 ephemeral=True
@@ -44,7 +55,7 @@ class RoleRestrictions(commands.Cog):
             return
 
         # Display a dropdown menu for role selection
-        view = RoleSelectionView(options, self.bot.get_cog("FirestoreCog"), guild_id)
+        view = RoleSelectionView(firestore_cog, guild_id)
         await interaction.response.send_message(
             "Select the roles allowed to use recruitment:",
             view=view,
@@ -70,32 +81,40 @@ class RoleRestrictions(commands.Cog):
 class RoleSelectionView(View):
     """View to handle role selection for restrictions."""
 
-    def __init__(self, options, firestore_cog, guild_id):
+    def __init__(self, firestore_cog, guild_id):
         super().__init__(timeout=300)
         self.firestore_cog = firestore_cog
         self.guild_id = guild_id
-        self.add_item(RoleSelect(options, self.firestore_cog, self.guild_id))
+        self.add_item(RoleSelect(self.firestore_cog, self.guild_id))
 
 class RoleSelect(Select):
     """Dropdown for selecting roles."""
 
-    def __init__(self, options, firestore_cog, guild_id):
+    def __init__(self, firestore_cog, guild_id):
         super().__init__(
+            select_type=discord.ComponentType.role_select,
             placeholder="Select roles...",
             min_values=1,
-            max_values=len(options),
-            options=options
+            max_values=MAX_SELECTED_ROLES,
         )
         self.firestore_cog = firestore_cog
         self.guild_id = guild_id
 
     async def callback(self, interaction: discord.Interaction):
-        selected_roles = [int(role_id) for role_id in self.values]
+        # Bot-managed roles and @everyone can't be used as restrictions
+        selected_roles = [
+            role.id for role in self.values
+            if not role.managed and not role.is_default()
+        ]
+        if not selected_roles:
+            await interaction.response.send_message(
+                "Please select at least one role that isn't managed by a bot or integration.",
+                ephemeral=True
+            )
+            return
 
-        # Save selected roles to Firestore
-        config = await self.firestore_cog.load_config(self.guild_id)
-        config["role_restrictions"] = selected_roles
-        await self.firestore_cog.save_config(self.guild_id, config)
+        # Save selected roles to Firestore without touching the other settings
+        await update_config(self.firestore_cog, self.guild_id, {"role_restrictions": selected_roles})
 
         await interaction.response.send_message(
             "Role restrictions updated successfully!",
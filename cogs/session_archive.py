@@ -0,0 +1,158 @@
+# cogs/session_archive.py
+import asyncio
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timezone
+from discord.ext import commands
+from cogs.session_model import Session
+
+ARCHIVE_DIR = os.getenv("SCOUT_ARCHIVE_DIR", "archive/sessions")      # One file per UTC day
+ARCHIVE_RETENTION_DAYS = int(os.getenv("SCOUT_ARCHIVE_RETENTION_DAYS", 90))
+ARCHIVE_FLUSH_SECONDS = 60     # Finished sessions are written out in batches this often
+PARTITION_PREFIX = "sessions-"
+PARTITION_SUFFIX = ".jsonl.gz"
+
+
+class SessionArchive:
+    """Append-only archive of finished sessions, kept out of the live collection.
+
+    Records are gzip-compressed JSON lines in one file per UTC day
+    (sessions-YYYY-MM-DD.jsonl.gz); each flush appends a gzip member, which
+    readers see as one continuous stream. Partitions older than the
+    retention period are deleted whole.
+    """
+
+    def __init__(self, directory: str = ARCHIVE_DIR, retention_days: int = ARCHIVE_RETENTION_DAYS):
+        self.directory = directory
+        self.retention_days = retention_days
+        self.pending = []  # Records waiting for the next flush
+
+    def record(self, session: Session, reason: str, ended_at: float = None):
+        """Queue a finished session for the archive."""
+        ended_at = time.time() if ended_at is None else ended_at
+        record = {name: value for name, value in session.to_document().items() if value not in (None, [])}
+        record.update(session_id=session.session_id, ended_at=ended_at, end_reason=reason)
+        self.pending.append(record)
+
+    def partition_path(self, day: str) -> str:
+        return os.path.join(self.directory, f"{PARTITION_PREFIX}{day}{PARTITION_SUFFIX}")
+
+    def partitions(self) -> list:
+        """Return (day, path) for every partition on disk, oldest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        days = []
+        for name in os.listdir(self.directory):
+            if name.startswith(PARTITION_PREFIX) and name.endswith(PARTITION_SUFFIX):
+                days.append(name[len(PARTITION_PREFIX):-len(PARTITION_SUFFIX)])
+        return [(day, self.partition_path(day)) for day in sorted(days)]
+
+    def flush(self) -> int:
+        """Write queued records to their day partitions (blocking). Returns how many were written."""
+        batch, self.pending = self.pending, []
+        if not batch:
+            return 0
+        by_day = {}
+        for record in batch:
+            day = datetime.fromtimestamp(record["ended_at"], timezone.utc).strftime("%Y-%m-%d")
+            by_day.setdefault(day, []).append(json.dumps(record, separators=(",", ":")))
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for day, lines in by_day.items():
+                with gzip.open(self.partition_path(day), "at", encoding="utf-8") as archive_file:
+                    archive_file.write("\n".join(lines) + "\n")
+        except OSError as e:
+            # Keep the batch for the next attempt rather than losing it
+            self.pending = batch + self.pending
+            print(f"Error writing session archive: {e}")
+            return 0
+        return len(batch)
+
+    def read(self, days: int = None):
+        """Yield archived records, oldest partition first, optionally only the last `days` days."""
+        cutoff = None
+        if days is not None:
+            cutoff = datetime.fromtimestamp(time.time() - days * 86400, timezone.utc).strftime("%Y-%m-%d")
+        for day, path in self.partitions():
+            if cutoff and day < cutoff:
+                continue
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as archive_file:
+                    for line in archive_file:
+                        if line.strip():
+                            yield json.loads(line)
+            except (OSError, EOFError, ValueError) as e:
+                # A partition cut short by a crash still yields what was readable
+                print(f"Error reading session archive {path}: {e}")
+
+    def prune(self, now: float = None) -> int:
+        """Delete partitions older than the retention period. Returns how many were removed."""
+        now = time.time() if now is None else now
+        cutoff = datetime.fromtimestamp(now - self.retention_days * 86400, timezone.utc).strftime("%Y-%m-%d")
+        removed = 0
+        for day, path in self.partitions():
+            if day >= cutoff:
+                break
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError as e:
+                print(f"Error removing session archive {path}: {e}")
+        return removed
+
+
+# Shared by the recruitment, reset and game index code
+session_archive = SessionArchive()
+
+
+class SessionArchiver(commands.Cog):
+    """Cog that flushes the session archive in batches and applies its retention policy."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.flush_task = None
+        print("SessionArchiver cog initialized.")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush_periodically())
+
+    async def flush_periodically(self):
+        last_prune_day = None
+        while True:
+            await asyncio.sleep(ARCHIVE_FLUSH_SECONDS)
+            try:
+                written = await asyncio.to_thread(session_archive.flush)
+                if written:
+                    print(f"Archived {written} finished sessions.")
+                today = time.strftime("%Y-%m-%d", time.gmtime())
+                if today != last_prune_day:
+                    last_prune_day = today
+                    removed = await asyncio.to_thread(session_archive.prune)
+                    if removed:
+                        print(f"Removed {removed} session archive partitions past retention.")
+            except Exception as e:
+                print(f"Error flushing session archive: {e}")
+
+    def cog_unload(self):
+        if self.flush_task:
+            self.flush_task.cancel()
+        # Nothing queued is lost on reload or shutdown
+        session_archive.flush()
+
+    def export_state(self) -> dict:
+        return {"archive": session_archive}
+
+    def import_state(self, state: dict):
+        # Modules that imported session_archive before the reload still hold the old one
+        global session_archive
+        session_archive = state["archive"]
+        if self.bot.is_ready() and self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush_periodically())
+
+
+def setup(bot):
+    bot.add_cog(SessionArchiver(bot))
@@ -0,0 +1,65 @@
+# cogs/session_index.py
+
+
+class ActiveSessionIndex:
+    """In-memory index of live sessions by session ID, voice channel and guild.
+
+    Entries are Session objects holding only IDs and plain values; Discord
+    objects are resolved from the client cache when a handler needs them.
+    """
+
+    def __init__(self):
+        self.sessions = {}  # session_id -> Session
+        self.by_vc = {}     # vc_id -> session_id
+        self.by_guild = {}  # guild_id -> set of session_ids
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def add(self, session):
+        """Register a live Session."""
+        self.sessions[session.session_id] = session
+        self.by_guild.setdefault(session.guild_id, set()).add(session.session_id)
+        if session.vc_id:
+            self.by_vc[session.vc_id] = session.session_id
+        return session
+
+    def set_vc(self, session_id: str, vc_id: int):
+        """Record the voice channel of a session (scheduled sessions get one later)."""
+        entry = self.sessions.get(session_id)
+        if entry is None:
+            return
+        if entry.vc_id:
+            self.by_vc.pop(entry.vc_id, None)
+        entry.vc_id = vc_id
+        self.by_vc[vc_id] = session_id
+
+    def get(self, session_id: str):
+        return self.sessions.get(session_id)
+
+    def for_vc(self, vc_id: int):
+        """Return the entry of the session using a voice channel, if any."""
+        session_id = self.by_vc.get(vc_id)
+        return self.sessions.get(session_id) if session_id else None
+
+    def for_guild(self, guild_id: int) -> list:
+        """Return the entries of a guild's live sessions."""
+        return [self.sessions[session_id] for session_id in self.by_guild.get(guild_id, ())]
+
+    def remove(self, session_id: str):
+        """Drop a session from the index and return its entry (or None)."""
+        entry = self.sessions.pop(session_id, None)
+        if entry is None:
+            return None
+        if entry.vc_id:
+            self.by_vc.pop(entry.vc_id, None)
+        guild_sessions = self.by_guild.get(entry.guild_id)
+        if guild_sessions is not None:
+            guild_sessions.discard(session_id)
+            if not guild_sessions:
+                del self.by_guild[entry.guild_id]
+        return entry
+
+
+# Shared by the recruitment, voice monitor and other session-aware cogs
+active_sessions = ActiveSessionIndex()
@@ -0,0 +1,151 @@
+# cogs/session_list.py
+import discord
+from discord.ext import commands
+from discord.ui import Button, View
+from cogs.session_index import active_sessions
+
+SESSIONS_PER_PAGE = 10
+PAGE_TIMEOUT_SECONDS = 300  # Prev/Next buttons stop working after this long
+
+
+async def active_game_autocomplete(ctx: discord.AutocompleteContext):
+    """Autocomplete provider listing the games of the guild's live sessions."""
+    value = (ctx.value or "").lower()
+    games = {entry.game_name for entry in active_sessions.for_guild(ctx.interaction.guild_id) if entry.game_name}
+    return sorted(game for game in games if value in game.lower())[:25]
+
+
+def matching_sessions(guild_id: int, game: str = None, creator_id: int = None) -> list:
+    """Return a guild's live sessions matching the filters, newest first."""
+    game = game.strip().lower() if game else None
+    entries = [
+        entry for entry in active_sessions.for_guild(guild_id)
+        if (not game or game in (entry.game_name or "").lower())
+        and (not creator_id or entry.creator_id == creator_id)
+    ]
+    entries.sort(key=lambda e: e.created_at or 0, reverse=True)
+    return entries
+
+
+def render_page(entries: list, page: int, filters: str) -> discord.Embed:
+    """Build one page of the /sessions listing."""
+    pages = max(1, -(-len(entries) // SESSIONS_PER_PAGE))
+    embed = discord.Embed(title="🎮 Active sessions", color=discord.Color.blue())
+    if not entries:
+        embed.description = "No sessions match." if filters else "No sessions are running right now."
+        return embed
+
+    lines = []
+    for entry in entries[page * SESSIONS_PER_PAGE:(page + 1) * SESSIONS_PER_PAGE]:
+        spots = entry.remaining_spots
+        if spots > 0:
+            spots_text = f"{spots} spot{'s' if spots != 1 else ''} left"
+        elif entry.waitlist:
+            spots_text = f"full, {len(entry.waitlist)} waiting"
+        else:
+            spots_text = "full"
+        if entry.start_time:
+            when = f"started <t:{int(entry.start_time)}:R>"
+        elif entry.scheduled_start:
+            when = f"starts <t:{int(entry.scheduled_start)}:R>"
+        else:
+            when = entry.game_time or ""
+        link = (
+            f"https://discord.com/channels/{entry.guild_id}/"
+            f"{entry.allowed_channel_id}/{entry.recruitment_message_id}"
+        )
+        lines.append(
+            f"• **{entry.game_name}** with <@{entry.creator_id}> — {spots_text}, {when} — [join]({link})"
+        )
+    embed.description = "\n".join(lines)
+    embed.set_footer(text=f"{len(entries)} session(s){filters} · page {page + 1}/{pages}")
+    return embed
+
+
+class SessionPages(View):
+    """Prev/Next buttons for one /sessions reply.
+
+    The listing is re-read from the in-memory index on every page turn, so
+    sessions that ended in the meantime drop out.
+    """
+
+    def __init__(self, guild_id: int, game: str, creator_id: int, filters: str):
+        super().__init__(timeout=PAGE_TIMEOUT_SECONDS)
+        self.guild_id = guild_id
+        self.game = game
+        self.creator_id = creator_id
+        self.filters = filters
+        self.page = 0
+
+        self.previous_button = Button(label="◀ Prev", style=discord.ButtonStyle.secondary)
+        self.previous_button.callback = self.previous
+        self.next_button = Button(label="Next ▶", style=discord.ButtonStyle.secondary)
+        self.next_button.callback = self.next
+        self.add_item(self.previous_button)
+        self.add_item(self.next_button)
+
+    def render(self) -> discord.Embed:
+        entries = matching_sessions(self.guild_id, self.game, self.creator_id)
+        pages = max(1, -(-len(entries) // SESSIONS_PER_PAGE))
+        self.page = min(self.page, pages - 1)
+        self.previous_button.disabled = self.page == 0
+        self.next_button.disabled = self.page >= pages - 1
+        return render_page(entries, self.page, self.filters)
+
+    async def previous(self, interaction: discord.Interaction):
+        self.page = max(0, self.page - 1)
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+    async def next(self, interaction: discord.Interaction):
+        self.page += 1
+        await interaction.response.edit_message(embed=self.render(), view=self)
+
+
+class SessionList(commands.Cog):
+    """Cog for the /sessions listing, answered from the in-memory session index."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        print("SessionList cog initialized.")
+
+    @commands.slash_command(
+        name="sessions",
+        description="List the gaming sessions currently running in this server."
+    )
+    async def sessions(
+        self,
+        interaction: discord.Interaction,
+        game: discord.Option(str, "Only show sessions for this game", autocomplete=active_game_autocomplete, required=False),
+        creator: discord.Option(discord.Member, "Only show sessions hosted by this member", required=False),
+    ):
+        """Shows live sessions without touching storage."""
+        if interaction.guild is None:
+            await interaction.response.send_message("This command can only be used in a server.", ephemeral=True)
+            return
+
+        filters = ""
+        if game:
+            filters += f" for {game}"
+        if creator:
+            filters += f" by {creator.display_name}"
+
+        view = SessionPages(interaction.guild.id, game, creator.id if creator else None, filters)
+        embed = view.render()
+        if view.next_button.disabled and view.previous_button.disabled:
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            view.stop()
+        else:
+            await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+
+    @sessions.error
+    async def sessions_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the sessions command."""
+        await interaction.response.send_message(
+            "An unexpected error occurred while executing the command. Please try again later.",
+            ephemeral=True
+        )
+        print(f"Unexpected error in /sessions: {error}")
+
+
+def setup(bot):
+    bot.add_cog(SessionList(bot))
@@ -0,0 +1,228 @@
+# cogs/session_model.py
+import json
+import struct
+
+CODEC_VERSION = 2  # 2: sizes moved into the fixed struct
+WAITLIST_LIMIT = 20  # Most users a full session queues up for a free spot
+
+# (field, kind) in codec order; kinds are "str", "int", "float", "ids" (set of ints),
+# "queue" (ordered ints) and "json". New fields go at the end so old encodings still decode.
+SESSION_SCHEMA = (
+    ("session_id", "str"),
+    ("guild_id", "int"),
+    ("creator_id", "int"),
+    ("game_name", "str"),
+    ("game_time", "str"),
+    ("player_count", "int"),
+    ("hours_playing", "int"),
+    ("remaining_spots", "int"),
+    ("joined_users", "ids"),
+    ("vc_id", "int"),
+    ("text_channel_id", "int"),
+    ("allowed_channel_id", "int"),
+    ("notify_channel_id", "int"),
+    ("notify_message_id", "int"),
+    ("recruitment_message_id", "int"),
+    ("followup_message_id", "int"),
+    ("followup_channel_id", "int"),
+    ("start_time", "float"),
+    ("scheduled_start", "float"),
+    ("embed", "json"),
+    ("created_at", "float"),
+    ("waitlist", "queue"),
+)
+SESSION_FIELDS = tuple(name for name, _ in SESSION_SCHEMA)
+# Fields kept in memory only, never written to the session document
+LOCAL_FIELDS = frozenset({"session_id", "created_at"})
+
+
+class Session:
+    """A live session: IDs and plain values only, one slot per schema field."""
+
+    __slots__ = SESSION_FIELDS
+
+    def __init__(self, session_id: str, **fields):
+        unknown = set(fields) - set(SESSION_FIELDS)
+        if unknown:
+            raise TypeError(f"Unknown session field(s): {', '.join(sorted(unknown))}")
+        self.session_id = session_id
+        for name in SESSION_FIELDS[1:]:
+            setattr(self, name, fields.get(name))
+        self.joined_users = set(self.joined_users or ())
+        # A tuple: most sessions never queue anyone, and the empty tuple costs nothing per session
+        self.waitlist = tuple(self.waitlist or ())[:WAITLIST_LIMIT]
+
+    def __repr__(self):
+        return f"<Session {self.session_id} guild={self.guild_id} game={self.game_name!r}>"
+
+    @classmethod
+    def from_document(cls, session_id: str, data: dict):
+        """Build a session from a stored document, ignoring fields outside the schema."""
+        fields = {name: data.get(name) for name in SESSION_FIELDS if name not in LOCAL_FIELDS}
+        return cls(session_id, **fields)
+
+    def to_document(self) -> dict:
+        """Return the session as a storage document (None fields included)."""
+        document = {}
+        for name in SESSION_FIELDS:
+            if name in LOCAL_FIELDS:
+                continue
+            value = getattr(self, name)
+            if name == "joined_users":
+                value = sorted(value)
+            elif name == "waitlist":
+                value = list(value)
+            document[name] = value
+        return document
+
+    def snapshot(self) -> tuple:
+        """Cheap copy of the current values, for diff()."""
+        return tuple(_frozen(name, getattr(self, name)) for name in SESSION_FIELDS)
+
+    def diff(self, snapshot: tuple) -> dict:
+        """Return the stored fields changed since `snapshot`, ready for a partial update."""
+        changes = {}
+        for name, before in zip(SESSION_FIELDS, snapshot):
+            if name in LOCAL_FIELDS:
+                continue
+            value = getattr(self, name)
+            if _frozen(name, value) == before:
+                continue
+            if name == "joined_users":
+                value = sorted(value)
+            elif name == "waitlist":
+                value = list(value)
+            changes[name] = value
+        return changes
+
+    def encode(self) -> bytes:
+        """Serialize to the compact binary form used by local caches and snapshots."""
+        return _layout(_presence(self)).encode(self)
+
+    @classmethod
+    def decode(cls, data: bytes):
+        """Inverse of encode()."""
+        if len(data) < _HEADER.size or data[0] != CODEC_VERSION:
+            raise ValueError("Unsupported session encoding.")
+        _, present = _HEADER.unpack_from(data)
+        return _layout(present).decode(data)
+
+
+def _frozen(name: str, value):
+    if name == "joined_users":
+        return frozenset(value)
+    return value
+
+
+async def save_session_changes(firestore_cog, session: Session, snapshot: tuple):
+    """Write only the fields changed since `snapshot` instead of re-saving the whole session."""
+    changes = session.diff(snapshot)
+    if not changes:
+        return
+    # One partial update for every changed field
+    await firestore_cog.run_blocking(
+        "update_session_fields",
+        lambda session_id, fields: firestore_cog.sessions_collection.document(session_id).update(fields),
+        session.session_id, changes
+    )
+
+
+class _Layout:
+    """Codec for one combination of present fields, compiled on first use.
+
+    Numbers, string lengths and collection sizes of the present fields go
+    in one fixed struct right after the header, followed by the string,
+    JSON and ID payloads. The encoder and decoder are generated for the
+    combination, so a session costs one pack/unpack call plus plain slot
+    reads and writes rather than a lookup and call per field; absent
+    fields are decoded as None (empty for collections).
+    """
+
+    __slots__ = ("encode", "decode")
+
+    def __init__(self, present: int):
+        scalars, variable, absent = [], [], []
+        for index, (name, kind) in enumerate(SESSION_SCHEMA):
+            if not present >> index & 1:
+                absent.append((name, kind))
+            elif kind in _SCALAR_CODES:
+                scalars.append((name, kind))
+            else:
+                variable.append((name, kind))
+        fixed = struct.Struct("<" + "".join(_SCALAR_CODES[kind] for _, kind in scalars) + "I" * len(variable))
+        namespace = {
+            "Session": Session, "new": object.__new__, "pack": struct.pack, "unpack_from": struct.unpack_from,
+            "dumps": json.dumps, "loads": json.loads, "fixed": fixed,
+            "prefix": _HEADER.pack(CODEC_VERSION, present),
+        }
+
+        # Encoder: payloads first, then the fixed part with their sizes
+        lines = ["def encode(s):"]
+        packed = [f"s.{name}" for name, _ in scalars]
+        payloads = []
+        for name, kind in variable:
+            if kind == "str":
+                lines.append(f"    {name} = s.{name}.encode('utf-8')")
+                packed.append(f"len({name})")
+                payloads.append(name)
+            elif kind == "json":
+                lines.append(f"    {name} = dumps(s.{name}, separators=(',', ':')).encode('utf-8')")
+                packed.append(f"len({name})")
+                payloads.append(name)
+            else:
+                lines.append(f"    {name} = s.{name}")
+                packed.append(f"len({name})")
+                payloads.append(f"pack('<%dQ' % len({name}), *{name})")
+        lines.append(f"    return b''.join((prefix, fixed.pack({', '.join(packed)}), {''.join(p + ', ' for p in payloads)}))")
+
+        # Decoder: one unpack for the fixed part, then slice out each payload
+        targets = [f"s.{name}" for name, _ in scalars] + [f"n_{name}" for name, _ in variable]
+        lines += [
+            "def decode(data):",
+            "    s = new(Session)",
+            f"    ({''.join(t + ', ' for t in targets)}) = fixed.unpack_from(data, {_HEADER.size})",
+            f"    o = {_HEADER.size + fixed.size}",
+        ]
+        for name, kind in variable:
+            if kind == "str":
+                lines += [f"    e = o + n_{name}", f"    s.{name} = data[o:e].decode('utf-8')"]
+            elif kind == "json":
+                lines += [f"    e = o + n_{name}", f"    s.{name} = loads(data[o:e])"]
+            else:
+                collection = "set" if kind == "ids" else "tuple"
+                lines += [f"    e = o + 8 * n_{name}", f"    s.{name} = {collection}(unpack_from('<%dQ' % n_{name}, data, o))"]
+            lines.append("    o = e")
+        for name, kind in absent:
+            lines.append(f"    s.{name} = {_EMPTY.get(kind, 'None')}")
+        lines.append("    return s")
+
+        exec("\n".join(lines), namespace)
+        self.encode = namespace["encode"]
+        self.decode = namespace["decode"]
+
+
+_HEADER = struct.Struct("<BI")              # codec version, presence bitmask
+_SCALAR_CODES = {"int": "q", "float": "d"}  # Fixed width: one pack call for every number
+_EMPTY = {"ids": "set()", "queue": "()"}    # Empty collections are left out like None
+_layouts = {}                               # presence bitmask -> _Layout
+
+
+def _layout(present: int) -> _Layout:
+    layout = _layouts.get(present)
+    if layout is None:
+        layout = _layouts[present] = _Layout(present)
+    return layout
+
+
+def _compile_presence():
+    """Build the function returning a session's presence bitmask in one expression."""
+    bits = " | ".join(
+        f"({1 << index} if s.{name}{'' if kind in _EMPTY else ' is not None'} else 0)"
+        for index, (name, kind) in enumerate(SESSION_SCHEMA)
+    )
+    namespace = {}
+    exec(f"def presence(s):\n    return {bits}", namespace)
+    return namespace["presence"]
+
+
+_presence = _compile_presence()
@@ -0,0 +1,205 @@
+# cogs/session_scheduler.py
+import asyncio
+import re
+import time
+from datetime import datetime, timedelta
+import pytz
+import discord
+from discord.ext import commands
+from cogs.config_store import update_config
+from cogs.storage import get_storage, tag_operations
+
+DEFAULT_TIMEZONE = "US/Eastern"  # Same zone the daily reset uses
+PROVISION_LEAD_SECONDS = 900     # Open the voice channel this long before start
+PAST_GRACE_SECONDS = 1800        # A clock time this recently passed means "now"
+
+# Abbreviations players commonly type after a time, e.g. "9pm EST"
+TIMEZONE_ABBREVIATIONS = {
+    "est": "US/Eastern", "edt": "US/Eastern", "et": "US/Eastern",
+    "cst": "US/Central", "cdt": "US/Central", "ct": "US/Central",
+    "mst": "US/Mountain", "mdt": "US/Mountain", "mt": "US/Mountain",
+    "pst": "US/Pacific", "pdt": "US/Pacific", "pt": "US/Pacific",
+    "utc": "UTC", "gmt": "UTC",
+    "bst": "Europe/London",
+    "cet": "Europe/Paris", "cest": "Europe/Paris",
+    "aest": "Australia/Sydney", "aedt": "Australia/Sydney",
+}
+
+_IMMEDIATE = {"now", "asap", "right now", "now!", "today now"}
+_RELATIVE = re.compile(
+    r"^in\s+(?:(?P<hours>\d+(?:\.\d+)?)\s*(?:h|hr|hrs|hour|hours))?\s*,?\s*(?:and\s+)?"
+    r"(?:(?P<minutes>\d+)\s*(?:m|min|mins|minute|minutes))?$"
+)
+_CLOCK = re.compile(
+    r"^(?:(?P<day>today|tonight|tomorrow)\s+)?(?:at\s+)?"
+    r"(?:(?P<word>noon|midnight)|(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>am|pm|a\.m\.|p\.m\.)?)"
+    r"(?:\s+(?P<day_after>today|tonight|tomorrow))?$"
+)
+
+
+def parse_game_time(text: str, timezone: str = DEFAULT_TIMEZONE, now: float = None):
+    """Parse a free-text `game_time` into a UNIX timestamp.
+
+    Understands "now", relative times ("in 2 hours", "in 1h 30m") and clock
+    times with an optional day and zone ("9pm", "21:30", "tomorrow 8:15 pm
+    PST"). Clock times are read in the guild's timezone unless a zone
+    abbreviation is given. Returns None when the text can't be understood
+    or names a day whose time has already passed ("today 9am" at noon), in
+    which case the session starts immediately as before.
+    """
+    now = time.time() if now is None else now
+    text = " ".join(text.strip().lower().split())
+    if not text:
+        return None
+    if text in _IMMEDIATE:
+        return now
+
+    match = _RELATIVE.match(text)
+    if match and (match.group("hours") or match.group("minutes")):
+        hours = float(match.group("hours") or 0)
+        minutes = int(match.group("minutes") or 0)
+        return now + hours * 3600 + minutes * 60
+
+    words = text.split(" ")
+    if words[-1] in TIMEZONE_ABBREVIATIONS:
+        timezone = TIMEZONE_ABBREVIATIONS[words[-1]]
+        text = " ".join(words[:-1])
+
+    match = _CLOCK.match(text)
+    if not match:
+        return None
+    try:
+        tz = pytz.timezone(timezone)
+    except pytz.UnknownTimeZoneError:
+        tz = pytz.timezone(DEFAULT_TIMEZONE)
+
+    if match.group("word"):
+        hour, minute, ampm = (12 if match.group("word") == "noon" else 0), 0, None
+    else:
+        hour = int(match.group("hour"))
+        minute = int(match.group("minute") or 0)
+        ampm = match.group("ampm")
+        if ampm:
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if ampm.startswith("p") else 0)
+    if hour > 23 or minute > 59:
+        return None
+
+    day = match.group("day") or match.group("day_after")
+    local_now = datetime.fromtimestamp(now, tz)
+    date = local_now.date() + timedelta(days=1 if day == "tomorrow" else 0)
+
+    # "9" without am/pm means whichever of 9:00 or 21:00 comes next
+    # ("tonight 9" only ever means 21:00)
+    hours_to_try = [hour]
+    if not ampm and not match.group("word") and 1 <= hour <= 11:
+        hours_to_try = [hour + 12] if day == "tonight" else [hour, hour + 12]
+
+    candidates = []
+    for candidate_hour in hours_to_try:
+        local = tz.localize(datetime(date.year, date.month, date.day, candidate_hour, minute))
+        timestamp = local.timestamp()
+        if timestamp < now - PAST_GRACE_SECONDS:
+            if day:
+                # The named day's time has passed; another reading may still be ahead
+                continue
+            timestamp = tz.localize(datetime.combine(date + timedelta(days=1), local.time())).timestamp()
+        candidates.append(timestamp)
+    if not candidates:
+        return None
+    return max(min(candidates), now)
+
+
+class SessionScheduler(commands.Cog):
+    """Cog that runs delayed jobs for scheduled sessions (provisioning and ending)."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.jobs = {}      # session_id -> pending asyncio task
+        self.job_specs = {}  # session_id -> (when, callback), handed over on reload
+        print("SessionScheduler cog initialized.")
+
+    def schedule(self, session_id: str, when: float, callback):
+        """Run `callback()` at `when`, replacing any job pending for the session."""
+        self.cancel(session_id)
+        self.job_specs[session_id] = (when, callback)
+        self.jobs[session_id] = asyncio.create_task(self._run(session_id, when, callback))
+
+    def cancel(self, session_id: str):
+        """Cancel the job pending for a session, if any."""
+        self.job_specs.pop(session_id, None)
+        task = self.jobs.pop(session_id, None)
+        if task and not task.done() and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _run(self, session_id: str, when: float, callback):
+        try:
+            await asyncio.sleep(max(0, when - time.time()))
+            if self.jobs.get(session_id) is asyncio.current_task():
+                del self.jobs[session_id]
+                self.job_specs.pop(session_id, None)
+            # Otherwise the job would be billed to the /recruit call that scheduled it
+            with tag_operations("scheduled job"):
+                await callback()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Error in scheduled job for session {session_id}: {e}")
+
+    def cog_unload(self):
+        for task in self.jobs.values():
+            task.cancel()
+        self.jobs.clear()
+
+    def export_state(self) -> dict:
+        return {"job_specs": dict(self.job_specs)}
+
+    def import_state(self, state: dict):
+        for session_id, (when, callback) in state["job_specs"].items():
+            self.schedule(session_id, when, callback)
+
+    @commands.slash_command(
+        name="set_scout_timezone",
+        description="Set the timezone used to read game times, e.g. US/Pacific or Europe/London."
+    )
+    @commands.has_permissions(administrator=True)
+    async def set_scout_timezone(self, interaction: discord.Interaction, timezone: str):
+        """Stores the guild's timezone for parsing /recruit game times."""
+        if timezone.lower() in TIMEZONE_ABBREVIATIONS:
+            timezone = TIMEZONE_ABBREVIATIONS[timezone.lower()]
+        if timezone not in pytz.all_timezones_set:
+            await interaction.response.send_message(
+                "Unknown timezone. Please use a name such as `US/Eastern`, `US/Pacific` or `Europe/London`.",
+                ephemeral=True
+            )
+            return
+
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
+
+        await update_config(firestore_cog, interaction.guild.id, {"timezone": timezone})
+        await interaction.response.send_message(
+            f"Game times will now be read in **{timezone}**.", ephemeral=True
+        )
+
+    @set_scout_timezone.error
+    async def set_scout_timezone_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the set_scout_timezone command."""
+        if isinstance(error, commands.MissingPermissions):
+            await interaction.response.send_message(
+                "You need Administrator permissions to run this command.",
+                ephemeral=True
+            )
+        else:
+            await interaction.response.send_message(
+                "An unexpected error occurred while executing the command. Please try again later.",
+                ephemeral=True
+            )
+            print(f"Unexpected error in /set_scout_timezone: {error}")
+
+
+def setup(bot):
+    bot.add_cog(SessionScheduler(bot))
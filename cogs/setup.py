@@ -2,9 +2,12 @@
 import discord
 from discord.ext import commands
 from discord.ui import View, Select, button
+from cogs.command_sync import command_mention
+from cogs.config_store import update_config
+from cogs.storage import get_storage
 
 class Config:
-    """A class to hold the configuration data for a server."""
+    """A draft of the configuration data for a server, committed once at the end of setup."""
     def __init__(self, guild, bot):
         self.guild = guild
         self.bot = bot
@@ -12,6 +15,17 @@ class Config:
         self.use_mention = False
         self.selected_recruitment_channel_id = None
         self.selected_category_id = None
+        self.user_usage_limit = None
+
+    def to_fields(self) -> dict:
+        """Return the config fields managed by the setup wizard."""
+        return {
+            "notify_channel_id": self.notify_channel_id,
+            "use_mention": self.use_mention,
+            "allowed_channel_id": self.selected_recruitment_channel_id,
+            "category_id": self.selected_category_id,
+            "user_usage_limit": self.user_usage_limit,
+        }
 
 class SetupScoutMaster(commands.Cog):
     """Cog for setting up Scout Master configurations."""
@@ -72,12 +86,9 @@ class SetupChannelSelectView(View):
                 disabled=True
             ))
             return
-        self.notification_channels = [
-            discord.SelectOption(label=channel.name, value=str(channel.id))
-            for channel in guild.text_channels
-        ]
-        # Add the dropdown menu with the populated options
-        self.add_item(NotificationChannelSelect(self.notification_channels, self.config))
+        # Native channel select: Discord lists and searches the channels itself,
+        # so there is no 25-option limit and no option list to build
+        self.add_item(NotificationChannelSelect(self.config))
 
     async def on_timeout(self):
         print("SetupChannelSelectView timed out.")
@@ -85,18 +96,19 @@ class SetupChannelSelectView(View):
 class NotificationChannelSelect(Select):
     """Select component for choosing the notification channel."""
 
-    def __init__(self, options, config):
+    def __init__(self, config):
         super().__init__(
+            select_type=discord.ComponentType.channel_select,
+            channel_types=[discord.ChannelType.text, discord.ChannelType.news],
             placeholder="Select the notification channel...",
             min_values=1,
             max_values=1,
-            options=options
         )
         self.config = config
 
     async def callback(self, interaction: discord.Interaction):
         # Store the selected notification channel ID
-        self.config.notify_channel_id = int(self.values[0])
+        self.config.notify_channel_id = self.values[0].id
         await interaction.response.send_message(
             "Do you want to use `@everyone` mentions in notifications?",
             view=MentionPreferenceView(self.config),
@@ -142,14 +154,13 @@ class RecruitmentChannelSelectView(View):
         super().__init__(timeout=300)
         self.config = config
         guild = config.guild
-        # Populate channels excluding the previously selected notification channel
-        self.recruitment_channels = [
-            discord.SelectOption(label=channel.name, value=str(channel.id))
-            for channel in guild.text_channels
-            if channel.id != config.notify_channel_id
-        ]
-
-        if not self.recruitment_channels:
+        # The notification channel is rejected in the select callback instead of
+        # being filtered out of a prebuilt option list
+        has_eligible_channel = any(
+            channel.id != config.notify_channel_id for channel in guild.text_channels
+        )
+
+        if not has_eligible_channel:
             # Handle case with no eligible recruitment channels
             self.add_item(discord.ui.Button(
                 label="No Eligible Recruitment Channels Found",
@@ -158,7 +169,7 @@ class RecruitmentChannelSelectView(View):
             ))
             return
 
-        self.add_item(RecruitmentChannelSelect(self.recruitment_channels, self.config))
+        self.add_item(RecruitmentChannelSelect(self.config))
 
     async def on_timeout(self):
         print("RecruitmentChannelSelectView timed out.")
@@ -166,17 +177,25 @@ class RecruitmentChannelSelectView(View):
 class RecruitmentChannelSelect(Select):
     """Select component for choosing the recruitment channel."""
 
-    def __init__(self, options, config):
+    def __init__(self, config):
         super().__init__(
+            select_type=discord.ComponentType.channel_select,
+            channel_types=[discord.ChannelType.text, discord.ChannelType.news],
             placeholder="Select the recruitment channel...",
             min_values=1,
             max_values=1,
-            options=options
         )
         self.config = config
 
     async def callback(self, interaction: discord.Interaction):
-        self.config.selected_recruitment_channel_id = int(self.values[0])
+        channel_id = self.values[0].id
+        if channel_id == self.config.notify_channel_id:
+            await interaction.response.send_message(
+                "The recruitment channel must be different from the notification channel. Please pick another one.",
+                ephemeral=True
+            )
+            return
+        self.config.selected_recruitment_channel_id = channel_id
         await interaction.response.send_message(
             "Please select the category for the voice channels to be created in\n\n"
             "**Scout Master creates temporary voice channels under the selected category**",
@@ -191,13 +210,8 @@ class CategorySelectView(View):
         super().__init__(timeout=300)
         self.config = config
         guild = config.guild
-        # Populate categories
-        self.categories = [
-            discord.SelectOption(label=category.name, value=str(category.id))
-            for category in guild.categories
-        ]
 
-        if not self.categories:
+        if not guild.categories:
             # Handle case with no categories
             self.add_item(discord.ui.Button(
                 label="No Categories Found",
@@ -206,75 +220,31 @@ class CategorySelectView(View):
             ))
             return
 
-        self.add_item(CategorySelect(self.categories, self.config))
-
-    async def callback(self, interaction: discord.Interaction):
-        self.config.selected_category_id = int(self.values[0])
-        await interaction.response.send_message(
-            "🎉 Setup complete! Your Scout Master settings have been configured. \n\n"
-            "Members can now use </recruit:1330805308125347906> to start a gaming session! 🥳 Let them know!.🥳 ",
-            ephemeral=True
-        )
-        # Save the configurations to Firestore
-        firestore_cog = self.config.bot.get_cog('FirestoreCog')
-        if not firestore_cog:
-            await interaction.followup.send(
-                "Internal error: FirestoreCog not found.",
-                ephemeral=True
-            )
-            return
-
-        guild_id = self.config.guild.id
-        config_data = {
-            "notify_channel_id": self.config.notify_channel_id,
-            "use_mention": self.config.use_mention,
-            "allowed_channel_id": self.config.selected_recruitment_channel_id,
-            "category_id": self.config.selected_category_id
-            # Removed 'cooldown' and 'timeout'
-        }
+        self.add_item(CategorySelect(self.config))
 
-        await firestore_cog.save_config(guild_id, config_data)
-        print(f"Configuration for guild {guild_id} saved.")
+    async def on_timeout(self):
+        print("CategorySelectView timed out.")
 
 class CategorySelect(Select):
     """Select component for choosing the category."""
 
-    def __init__(self, options, config):
+    def __init__(self, config):
         super().__init__(
+            select_type=discord.ComponentType.channel_select,
+            channel_types=[discord.ChannelType.category],
             placeholder="Select the category...",
             min_values=1,
             max_values=1,
-            options=options
         )
         self.config = config
 
     async def callback(self, interaction: discord.Interaction):
-        self.config.selected_category_id = int(self.values[0])
+        self.config.selected_category_id = self.values[0].id
         await interaction.response.send_message(
             "How many gaming sessions do you want to allow your members to do per day?",
             view=UserUsageLimitSelectView(self.config),
             ephemeral=True
         )
-        # Save the configurations to Firestore
-        firestore_cog = self.config.bot.get_cog('FirestoreCog')
-        if not firestore_cog:
-            await interaction.followup.send(
-                "Internal error: FirestoreCog not found.",
-                ephemeral=True
-            )
-            return
-
-        guild_id = self.config.guild.id
-        config_data = {
-            "notify_channel_id": self.config.notify_channel_id,
-            "use_mention": self.config.use_mention,
-            "allowed_channel_id": self.config.selected_recruitment_channel_id,
-            "category_id": self.config.selected_category_id
-            # Removed 'cooldown' and 'timeout'
-        }
-
-        await firestore_cog.save_config(guild_id, config_data)
-        print(f"Configuration for guild {guild_id} saved.")
 
 class UserUsageLimitSelectView(View):
     """View to select the daily usage limit for users."""
@@ -305,32 +275,35 @@ class UserUsageLimitSelect(Select):
     async def callback(self, interaction: discord.Interaction):
         limit = int(self.values[0])
         self.view.config.user_usage_limit = limit
-        await interaction.response.send_message(
-            f"Daily usage limit set to {limit}.\n\n"
-            "Members can now use </recruit:1330805308125347906> to start a gaming session! 🥳 Let them know!.🥳 ",
-            ephemeral=True
-        )
-        # Save the settings to Firestore
-        firestore_cog = self.view.config.bot.get_cog("FirestoreCog")
+
+        # Commit the whole draft in one field-level merge so other settings
+        # (such as role restrictions) are preserved
+        firestore_cog = get_storage(self.view.config.bot)
         if not firestore_cog:
-            await interaction.followup.send(
+            await interaction.response.send_message(
                 "Internal error: FirestoreCog not found.",
                 ephemeral=True,
             )
             return
 
         guild_id = self.view.config.guild.id
-        config_data = {
-            "notify_channel_id": self.view.config.notify_channel_id,
-            "use_mention": self.view.config.use_mention,
-            "allowed_channel_id": self.view.config.selected_recruitment_channel_id,
-            "category_id": self.view.config.selected_category_id,
-            "user_usage_limit": self.view.config.user_usage_limit,
-        }
-
-        await firestore_cog.save_config(guild_id, config_data)
+        try:
+            await update_config(firestore_cog, guild_id, self.view.config.to_fields())
+        except Exception as e:
+            print(f"Error saving configuration for guild {guild_id}: {e}")
+            await interaction.response.send_message(
+                "Failed to save your settings. Please run the setup again later.",
+                ephemeral=True,
+            )
+            return
         print(f"Configuration for guild {guild_id} saved.")
 
+        await interaction.response.send_message(
+            f"🎉 Setup complete! Daily usage limit set to {limit}.\n\n"
+            f"Members can now use {command_mention('recruit')} to start a gaming session! 🥳 Let them know!.🥳 ",
+            ephemeral=True
+        )
+
 
 
 
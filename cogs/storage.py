@@ -0,0 +1,445 @@
+# cogs/storage.py
+import asyncio
+import contextvars
+import random
+import time
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+import discord
+from discord.ext import commands
+
+CALL_TIMEOUT_SECONDS = 2.5     # Give up on a single storage call after this long
+RESPONSE_BUDGET_SECONDS = 2.5  # Storage time an unacknowledged interaction can afford (Discord allows 3s)
+READ_ATTEMPTS = 3              # Reads are retried with backoff
+WRITE_ATTEMPTS = 2             # Writes get one retry
+BACKOFF_BASE_SECONDS = 0.2     # Backoff doubles per attempt, with jitter
+FAILURE_THRESHOLD = 5          # Consecutive failures that open the circuit
+RESET_TIMEOUT_SECONDS = 30     # How long the circuit stays open before a probe
+MAX_CACHED_READS = 20000       # Last known results kept for degraded mode
+
+LEDGER_BUCKET_SECONDS = 3600    # Operation counters roll over hourly
+LEDGER_BUCKETS = 48            # Hours of counters kept
+SUMMARY_INTERVAL_SECONDS = 86400
+SUMMARY_LINES = 10             # Commands/guilds listed per section
+
+# FirestoreCog methods whose results can be served from cache while degraded
+READ_METHOD_PREFIXES = ("load_", "get_")
+# Prefix given to run_query() calls, which are billed per document returned
+QUERY_PREFIX = "query_"
+# FirestoreCog methods billed as deletes; everything else that isn't a read is a write
+DELETE_METHOD_PREFIXES = ("remove_session", "delete_")
+
+# (command or handler, guild_id) that storage operations are billed to
+operation_context = contextvars.ContextVar("storage_operation", default=("other", None))
+# (interaction, deadline) for the interaction being handled in this context, if any
+pending_response = contextvars.ContextVar("pending_response", default=None)
+
+STORAGE_UNAVAILABLE_MESSAGE = (
+    "⚠️ Scout Master's storage is temporarily unavailable. Please try again in a minute."
+)
+
+
+class StorageUnavailable(Exception):
+    """Raised when the storage circuit is open or a storage call keeps failing."""
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open probe -> closed."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+        self.trips = 0
+        self.total_failures = 0
+        self.rejected_calls = 0
+        self.served_from_cache = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Whether a call may go to storage right now."""
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self.probe_in_flight:
+            self.probe_in_flight = True
+            return True
+        self.rejected_calls += 1
+        return False
+
+    def record_success(self):
+        if self.opened_at is not None:
+            print("Storage circuit closed again after a successful probe.")
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+
+    def record_failure(self):
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        if self.probe_in_flight or (self.opened_at is None and self.consecutive_failures >= self.failure_threshold):
+            if self.opened_at is None:
+                self.trips += 1
+                print(f"Storage circuit opened after {self.consecutive_failures} consecutive failures.")
+            self.opened_at = time.monotonic()
+        self.probe_in_flight = False
+
+    def status(self) -> dict:
+        return {
+            "state": self.state,
+            "trips": self.trips,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "rejected_calls": self.rejected_calls,
+            "served_from_cache": self.served_from_cache,
+        }
+
+
+@contextmanager
+def tag_operations(command: str, guild_id=None):
+    """Bill storage operations made inside the block to `command` in `guild_id`."""
+    token = operation_context.set((command, guild_id))
+    ledger.record("calls")
+    try:
+        yield
+    finally:
+        operation_context.reset(token)
+
+
+def track_response(interaction):
+    """Budget storage calls in this context against the interaction's acknowledgement deadline."""
+    pending_response.set((interaction, time.monotonic() + RESPONSE_BUDGET_SECONDS))
+
+
+def response_budget():
+    """Seconds left to acknowledge the current interaction, or None if nothing is waiting on a response."""
+    pending = pending_response.get()
+    if pending is None:
+        return None
+    interaction, deadline = pending
+    if interaction.response.is_done():
+        return None  # Deferred or answered; followups have 15 minutes
+    return deadline - time.monotonic()
+
+
+class OperationLedger:
+    """Rolling hourly counters of storage operations per command and guild."""
+
+    def __init__(self, bucket_seconds: int = LEDGER_BUCKET_SECONDS, max_buckets: int = LEDGER_BUCKETS):
+        self.bucket_seconds = bucket_seconds
+        self.buckets = deque(maxlen=max_buckets)  # (bucket_start, Counter[(command, guild_id, kind)])
+
+    def record(self, kind: str, count: int = 1):
+        """Count `count` operations of `kind` ("read", "write", "delete" or "calls")."""
+        command, guild_id = operation_context.get()
+        bucket_start = int(time.time() // self.bucket_seconds * self.bucket_seconds)
+        if not self.buckets or self.buckets[-1][0] != bucket_start:
+            self.buckets.append((bucket_start, Counter()))
+        self.buckets[-1][1][(command, str(guild_id) if guild_id else None, kind)] += count
+
+    def summarize(self, hours: int = 24):
+        """Return ({command: Counter(kind)}, {guild_id: Counter(kind)}) for the last `hours`."""
+        since = time.time() - hours * 3600
+        by_command, by_guild = {}, {}
+        for bucket_start, counts in self.buckets:
+            if bucket_start + self.bucket_seconds <= since:
+                continue
+            for (command, guild_id, kind), count in counts.items():
+                by_command.setdefault(command, Counter())[kind] += count
+                if guild_id and kind != "calls":
+                    by_guild.setdefault(guild_id, Counter())[kind] += count
+        return by_command, by_guild
+
+
+ledger = OperationLedger()
+
+
+def format_cost_report(hours: int = 24, guild_name=None) -> str:
+    """Render the ledger's busiest commands and guilds as text."""
+    by_command, by_guild = ledger.summarize(hours)
+
+    def ops(counts):
+        return counts["read"] + counts["write"] + counts["delete"]
+
+    def describe(counts):
+        return f"{counts['read']} reads, {counts['write']} writes, {counts['delete']} deletes"
+
+    lines = [f"**Storage operations, last {hours}h**", "__By command__"]
+    for command, counts in sorted(by_command.items(), key=lambda item: ops(item[1]), reverse=True)[:SUMMARY_LINES]:
+        per_call = f" (~{ops(counts) / counts['calls']:.1f} per call)" if counts["calls"] else ""
+        lines.append(f"• {command}: {describe(counts)}{per_call}")
+    lines.append("__By guild__")
+    for guild_id, counts in sorted(by_guild.items(), key=lambda item: ops(item[1]), reverse=True)[:SUMMARY_LINES]:
+        name = guild_name(guild_id) if guild_name else guild_id
+        lines.append(f"• {name}: {describe(counts)}")
+    if len(lines) == 3:
+        lines.append("No storage operations recorded yet.")
+    return "\n".join(lines)
+
+
+def operation_kind(name: str) -> str:
+    if name.startswith(READ_METHOD_PREFIXES + (QUERY_PREFIX,)):
+        return "read"
+    if name.startswith(DELETE_METHOD_PREFIXES):
+        return "delete"
+    return "write"
+
+
+class GuardedStorage:
+    """Wraps FirestoreCog so every storage call goes through the circuit breaker.
+
+    Coroutine methods get a per-call timeout and retries with backoff.
+    Successful reads are remembered, and while the circuit is open they are
+    answered from that last known value; writes fail fast with
+    StorageUnavailable. Other attributes (collections, the client) pass
+    through unchanged.
+    """
+
+    def __init__(self, firestore_cog, breaker: CircuitBreaker):
+        self._cog = firestore_cog
+        self.breaker = breaker
+        self.last_known = OrderedDict()
+
+    def __getattr__(self, name):
+        attr = getattr(self._cog, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        async def guarded(*args, **kwargs):
+            return await self.call(name, attr, *args, **kwargs)
+
+        return guarded
+
+    @staticmethod
+    def _cache_key(name: str, args, kwargs):
+        # IDs are passed as both int and str around the codebase
+        return (name,) + tuple(str(arg) for arg in args) + tuple(f"{k}={v}" for k, v in sorted(kwargs.items()))
+
+    def _remember(self, key, result):
+        self.last_known[key] = result
+        self.last_known.move_to_end(key)
+        while len(self.last_known) > MAX_CACHED_READS:
+            self.last_known.popitem(last=False)
+
+    async def call(self, name: str, func, *args, **kwargs):
+        """Run a storage coroutine function through the breaker."""
+        kind = operation_kind(name)
+        # Point reads can be answered from the last known value; queries cannot
+        is_read = name.startswith(READ_METHOD_PREFIXES)
+        key = self._cache_key(name, args, kwargs) if is_read else None
+
+        if not self.breaker.allow():
+            if is_read and key in self.last_known:
+                self.breaker.served_from_cache += 1
+                return self.last_known[key]
+            raise StorageUnavailable(f"Storage circuit is {self.breaker.state}; {name} rejected.")
+
+        attempts = READ_ATTEMPTS if kind == "read" else WRITE_ATTEMPTS
+        last_error = None
+        for attempt in range(attempts):
+            # Inside an unacknowledged interaction, attempts and backoff share its response budget
+            budget = response_budget()
+            timeout = CALL_TIMEOUT_SECONDS if budget is None else min(CALL_TIMEOUT_SECONDS, budget)
+            if timeout <= 0:
+                last_error = last_error or asyncio.TimeoutError("interaction response deadline reached")
+                break
+            try:
+                result = await asyncio.wait_for(func(*args, **kwargs), timeout)
+            except Exception as e:
+                last_error = e
+                # A call cut short by the response budget says nothing about storage health
+                if timeout >= CALL_TIMEOUT_SECONDS or not isinstance(e, asyncio.TimeoutError):
+                    self.breaker.record_failure()
+                print(f"Storage call {name} failed (attempt {attempt + 1}/{attempts}): {e!r}")
+                if attempt + 1 == attempts or not self.breaker.allow():
+                    break
+                backoff = BACKOFF_BASE_SECONDS * (2 ** attempt) * (0.5 + random.random())
+                budget = response_budget()
+                if budget is not None and backoff >= budget:
+                    break
+                await asyncio.sleep(backoff)
+            else:
+                self.breaker.record_success()
+                # Queries are billed per document returned (at least one read)
+                if name.startswith(QUERY_PREFIX):
+                    ledger.record(kind, max(1, len(result)))
+                else:
+                    ledger.record(kind)
+                if is_read:
+                    self._remember(key, result)
+                elif name == "remove_session" and args:
+                    self.last_known.pop(self._cache_key("load_session", args[:1], {}), None)
+                return result
+
+        if is_read and key in self.last_known:
+            self.breaker.served_from_cache += 1
+            return self.last_known[key]
+        raise StorageUnavailable(f"Storage call {name} failed: {last_error!r}") from last_error
+
+    async def run_query(self, name: str, func):
+        """Run a blocking query returning a list of documents in a thread through the breaker."""
+        async def run():
+            return await asyncio.to_thread(func)
+
+        return await self.call(f"{QUERY_PREFIX}{name}", run)
+
+    async def run_blocking(self, name: str, func, *args):
+        """Run a blocking client call in a thread through the breaker.
+
+        For point reads and writes FirestoreCog has no method for; `name` is
+        billed like a method name (load_/get_ reads are cached per `args`).
+        """
+        async def run(*args):
+            return await asyncio.to_thread(func, *args)
+
+        return await self.call(name, run, *args)
+
+
+class StorageGuard(commands.Cog):
+    """Cog that owns the storage circuit breaker and operation ledger and reports on them."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.breaker = CircuitBreaker()
+        self._storage = None
+        self.summary_task = None
+        # Bill slash commands' storage operations to the command and guild
+        bot.before_invoke(self.tag_command)
+        print("StorageGuard cog initialized.")
+
+    async def tag_command(self, ctx):
+        operation_context.set((f"/{ctx.command.qualified_name}", ctx.guild_id))
+        track_response(ctx)
+        ledger.record("calls")
+
+    def guild_name(self, guild_id) -> str:
+        guild = self.bot.get_guild(int(guild_id))
+        return guild.name if guild else str(guild_id)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if self.summary_task is None:
+            self.summary_task = asyncio.create_task(self.daily_summary())
+
+    async def daily_summary(self):
+        """Print the last day's storage cost report once a day."""
+        while True:
+            await asyncio.sleep(SUMMARY_INTERVAL_SECONDS)
+            print(format_cost_report(24, self.guild_name))
+
+    def cog_unload(self):
+        if self.summary_task:
+            self.summary_task.cancel()
+
+    def export_state(self) -> dict:
+        return {
+            "breaker": self.breaker,
+            "storage": self._storage,
+            "ledger": ledger,
+            "operation_context": operation_context,
+            "pending_response": pending_response,
+        }
+
+    def import_state(self, state: dict):
+        # Other modules imported tag_operations and friends from the old module,
+        # so keep using its breaker, ledger and context variable
+        global ledger, operation_context, pending_response
+        ledger = state["ledger"]
+        operation_context = state["operation_context"]
+        pending_response = state["pending_response"]
+        self.breaker = state["breaker"]
+        self._storage = state["storage"]
+        if self.bot.is_ready() and self.summary_task is None:
+            self.summary_task = asyncio.create_task(self.daily_summary())
+
+    @property
+    def storage(self):
+        firestore_cog = self.bot.get_cog('FirestoreCog')
+        if firestore_cog is None:
+            return None
+        if self._storage is None or self._storage._cog is not firestore_cog:
+            self._storage = GuardedStorage(firestore_cog, self.breaker)
+        return self._storage
+
+    @commands.slash_command(
+        name="scout_storage_status",
+        description="(bot owner) Show the storage circuit breaker state."
+    )
+    @commands.is_owner()
+    async def scout_storage_status(self, interaction: discord.Interaction):
+        """Reports the breaker state and counters."""
+        status = self.breaker.status()
+        lines = [f"**{key.replace('_', ' ').capitalize()}:** {value}" for key, value in status.items()]
+        await interaction.response.send_message("\n".join(lines), ephemeral=True)
+
+    @scout_storage_status.error
+    async def scout_storage_status_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the scout_storage_status command."""
+        if isinstance(error, commands.NotOwner):
+            await interaction.response.send_message("Only the bot owner can use this command.", ephemeral=True)
+        else:
+            await interaction.response.send_message(
+                "An unexpected error occurred while executing the command. Please try again later.",
+                ephemeral=True
+            )
+            print(f"Unexpected error in /scout_storage_status: {error}")
+
+
+    @commands.slash_command(
+        name="scout_storage_cost",
+        description="(bot owner) Show storage reads, writes and deletes per command and guild."
+    )
+    @commands.is_owner()
+    async def scout_storage_cost(self, interaction: discord.Interaction, hours: int = 24):
+        """Reports the operation ledger for the last `hours` (up to 48)."""
+        hours = max(1, min(hours, LEDGER_BUCKETS))
+        await interaction.response.send_message(format_cost_report(hours, self.guild_name), ephemeral=True)
+
+    @scout_storage_cost.error
+    async def scout_storage_cost_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the scout_storage_cost command."""
+        if isinstance(error, commands.NotOwner):
+            await interaction.response.send_message("Only the bot owner can use this command.", ephemeral=True)
+        else:
+            await interaction.response.send_message(
+                "An unexpected error occurred while executing the command. Please try again later.",
+                ephemeral=True
+            )
+            print(f"Unexpected error in /scout_storage_cost: {error}")
+
+
+def get_storage(bot):
+    """Return the guarded storage wrapper, or the raw FirestoreCog if the guard isn't loaded."""
+    guard = bot.get_cog('StorageGuard')
+    if guard:
+        return guard.storage
+    return bot.get_cog('FirestoreCog')
+
+
+async def guarded_call(firestore_cog, name: str, func, *args):
+    """Run a storage coroutine that isn't a FirestoreCog method (e.g. from discord_plans) through the guard."""
+    if isinstance(firestore_cog, GuardedStorage):
+        return await firestore_cog.call(name, func, *args)
+    return await func(*args)
+
+
+def is_storage_unavailable(error: Exception) -> bool:
+    """Whether a command error was caused by the storage circuit (possibly wrapped)."""
+    return isinstance(getattr(error, "original", error), StorageUnavailable)
+
+
+def setup(bot):
+    bot.add_cog(StorageGuard(bot))
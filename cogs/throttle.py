@@ -0,0 +1,99 @@
+# cogs/throttle.py
+import os
+import time
+from collections import Counter
+
+
+def _limit_from_env(name: str, default: tuple) -> tuple:
+    """Read a "burst/seconds" limit such as "4/10" from the environment."""
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        burst, seconds = value.split("/")
+        return int(burst), float(seconds)
+    except ValueError:
+        print(f"Ignoring invalid throttle setting {name}={value!r}; using {default[0]}/{default[1]}.")
+        return default
+
+
+# (burst, seconds): a user may act `burst` times at once, refilled evenly over `seconds`
+USER_LIMITS = {
+    "recruit": _limit_from_env("SCOUT_THROTTLE_RECRUIT", (3, 60)),
+    "join": _limit_from_env("SCOUT_THROTTLE_JOIN", (4, 20)),
+    "withdraw": _limit_from_env("SCOUT_THROTTLE_WITHDRAW", (4, 20)),
+    "cancel": _limit_from_env("SCOUT_THROTTLE_CANCEL", (3, 20)),
+}
+# Shared by everyone in a guild, across all actions
+GUILD_LIMIT = _limit_from_env("SCOUT_THROTTLE_GUILD", (60, 30))
+MAX_TRACKED_BUCKETS = 50000  # Idle full buckets are pruned past this
+
+THROTTLED_MESSAGE = "⏳ Slow down! Please try again in {seconds} second(s)."
+
+
+class TokenBucketLimiter:
+    """Token buckets keyed by arbitrary hashables, stored as (tokens, last_refill) tuples."""
+
+    def __init__(self):
+        self.buckets = {}
+
+    def take(self, key, burst: int, seconds: float) -> float:
+        """Take one token for `key`; return 0 if allowed, else seconds until a token is free."""
+        now = time.monotonic()
+        rate = burst / seconds
+        tokens, last = self.buckets.get(key, (burst, now))
+        tokens = min(burst, tokens + (now - last) * rate)
+        if tokens < 1:
+            self.buckets[key] = (tokens, now)
+            return (1 - tokens) / rate
+        self.buckets[key] = (tokens - 1, now)
+        if len(self.buckets) > MAX_TRACKED_BUCKETS:
+            self._prune(now)
+        return 0
+
+    def give_back(self, key):
+        """Return a token taken for `key` (used when a later check rejects the call)."""
+        tokens, last = self.buckets.get(key, (0, time.monotonic()))
+        self.buckets[key] = (tokens + 1, last)
+
+    def _prune(self, now: float):
+        # A bucket idle for its full refill period is indistinguishable from a new one
+        longest = max([seconds for _, seconds in USER_LIMITS.values()] + [GUILD_LIMIT[1]])
+        self.buckets = {key: value for key, value in self.buckets.items() if now - value[1] < longest}
+
+
+limiter = TokenBucketLimiter()
+throttled_counts = Counter()  # (action, "user" | "guild") -> rejected calls since start
+
+
+def check_throttle(action: str, user_id: int, guild_id: int) -> float:
+    """Charge a user's and their guild's bucket for `action`; return seconds to wait (0 if allowed)."""
+    burst, seconds = USER_LIMITS[action]
+    user_key = (action, user_id)
+    retry_after = limiter.take(user_key, burst, seconds)
+    if retry_after:
+        throttled_counts[(action, "user")] += 1
+        return retry_after
+
+    if guild_id is not None:
+        retry_after = limiter.take(("guild", guild_id), *GUILD_LIMIT)
+        if retry_after:
+            limiter.give_back(user_key)
+            throttled_counts[(action, "guild")] += 1
+            return retry_after
+    return 0
+
+
+async def reject_if_throttled(interaction, action: str) -> bool:
+    """Answer a throttled interaction from memory; return True if it was rejected."""
+    retry_after = check_throttle(action, interaction.user.id, interaction.guild_id)
+    if not retry_after:
+        return False
+    print(
+        f"Throttled {action} by user {interaction.user.id} in guild {interaction.guild_id} "
+        f"({sum(throttled_counts.values())} throttled since start)."
+    )
+    await interaction.response.send_message(
+        THROTTLED_MESSAGE.format(seconds=max(1, round(retry_after))), ephemeral=True
+    )
+    return True
@@ -0,0 +1,343 @@
+# cogs/usage_stats.py
+import asyncio
+import time
+from collections import Counter
+from datetime import datetime
+import pytz
+import discord
+from discord.ext import commands
+from cogs.config_store import cached_config
+from cogs.plan_cache import session_limit as cached_session_limit
+from cogs.session_scheduler import DEFAULT_TIMEZONE
+from cogs.storage import STORAGE_UNAVAILABLE_MESSAGE, get_storage, is_storage_unavailable, tag_operations
+
+STATS_COLLECTION = "guild_stats"  # One document per guild, rewritten by the flush
+STATS_FLUSH_SECONDS = 300         # Counters are written behind at most this often
+STATS_DAYS = 30                   # Daily buckets kept per guild
+DAY_COUNTERS = ("sessions", "completed", "canceled", "joins", "withdrawals", "waitlisted", "limit_hits")
+
+
+def _new_bucket() -> dict:
+    bucket = dict.fromkeys(DAY_COUNTERS, 0)
+    bucket.update(hours={}, games={}, fill_total=0.0, fill_count=0)
+    return bucket
+
+
+class GuildUsage:
+    """Rolling per-day usage counters for one guild.
+
+    Each bucket holds plain counters plus sparse hour-of-day and per-game
+    counts, so a window is summed in memory and stored as one document.
+    """
+
+    def __init__(self, days: dict = None):
+        self.days = days or {}  # "YYYY-MM-DD" (guild time) -> bucket
+
+    def bucket(self, day: str) -> dict:
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = _new_bucket()
+            for old_day in sorted(self.days)[:-STATS_DAYS]:
+                del self.days[old_day]
+        return bucket
+
+    def merge(self, other: "GuildUsage"):
+        """Add another guild usage's counts into this one."""
+        for day, theirs in other.days.items():
+            ours = self.bucket(day)
+            for counter in DAY_COUNTERS + ("fill_total", "fill_count"):
+                ours[counter] += theirs.get(counter, 0)
+            for key in ("hours", "games"):
+                for name, count in theirs.get(key, {}).items():
+                    ours[key][name] = ours[key].get(name, 0) + count
+
+    def totals(self, days: int, today: str) -> dict:
+        """Sum the last `days` buckets up to `today`."""
+        recent = sorted(day for day in self.days if day <= today)[-days:]
+        totals = dict.fromkeys(DAY_COUNTERS, 0)
+        totals.update(hours=Counter(), games=Counter(), fill_total=0.0, fill_count=0, days_at_limit=0)
+        for day in recent:
+            bucket = self.days[day]
+            for counter in DAY_COUNTERS + ("fill_total", "fill_count"):
+                totals[counter] += bucket.get(counter, 0)
+            totals["hours"].update({int(hour): count for hour, count in bucket.get("hours", {}).items()})
+            totals["games"].update(bucket.get("games", {}))
+            if bucket.get("limit_hits"):
+                totals["days_at_limit"] += 1
+        return totals
+
+    def to_document(self) -> dict:
+        return {"days": self.days, "updated_at": time.time()}
+
+    @classmethod
+    def from_document(cls, data: dict):
+        days = {}
+        for day, bucket in (data or {}).get("days", {}).items():
+            days[day] = {**_new_bucket(), **bucket}
+        return cls(days)
+
+
+# guild_id -> GuildUsage; increments land here first and are written behind
+_usage = {}
+_loaded = set()  # Guilds whose stored document has been merged in
+_dirty = set()   # Guilds with increments not yet written
+_locks = {}      # guild_id -> lock so concurrent first loads merge the document once
+
+
+def _lock_for(guild_id: int) -> asyncio.Lock:
+    lock = _locks.get(guild_id)
+    if lock is None:
+        lock = _locks[guild_id] = asyncio.Lock()
+    return lock
+
+
+def _local_time(guild_id, when: float = None) -> datetime:
+    config = cached_config(guild_id) or {}
+    try:
+        tz = pytz.timezone(config.get("timezone", DEFAULT_TIMEZONE))
+    except pytz.UnknownTimeZoneError:
+        tz = pytz.timezone(DEFAULT_TIMEZONE)
+    return datetime.fromtimestamp(time.time() if when is None else when, tz)
+
+
+def _today_bucket(guild_id) -> tuple:
+    guild_id = int(guild_id)
+    usage = _usage.get(guild_id)
+    if usage is None:
+        usage = _usage[guild_id] = GuildUsage()
+    local = _local_time(guild_id)
+    _dirty.add(guild_id)
+    return usage.bucket(local.strftime("%Y-%m-%d")), local
+
+
+def record_usage(guild_id, counter: str, amount: int = 1):
+    """Bump one of DAY_COUNTERS for today (joins, withdrawals, limit hits...)."""
+    bucket, _ = _today_bucket(guild_id)
+    bucket[counter] += amount
+
+
+def record_session_started(guild_id, game_name: str):
+    bucket, local = _today_bucket(guild_id)
+    bucket["sessions"] += 1
+    hour = str(local.hour)
+    bucket["hours"][hour] = bucket["hours"].get(hour, 0) + 1
+    bucket["games"][game_name] = bucket["games"].get(game_name, 0) + 1
+
+
+def record_session_finished(entry, canceled: bool):
+    """Count a completion or cancellation and how full the session got."""
+    bucket, _ = _today_bucket(entry.guild_id)
+    bucket["canceled" if canceled else "completed"] += 1
+    spots = len(entry.joined_users) + max(entry.remaining_spots or 0, 0)
+    if spots:
+        bucket["fill_total"] += len(entry.joined_users) / spots
+        bucket["fill_count"] += 1
+
+
+def usage_totals(guild_id, days: int = 7) -> dict:
+    """Sum a guild's last `days` days from memory."""
+    usage = _usage.get(int(guild_id)) or GuildUsage()
+    return usage.totals(days, _local_time(guild_id).strftime("%Y-%m-%d"))
+
+
+def upgrade_hint(guild_id, days: int = 7) -> str:
+    """A line for upgrade prompts when the guild keeps running into its limit (or "")."""
+    totals = usage_totals(guild_id, days)
+    if totals["days_at_limit"] < 2:
+        return ""
+    hint = f"📈 This server hit its daily limit on **{totals['days_at_limit']} of the last {days} days**"
+    if totals["fill_count"]:
+        hint += f", and sessions fill **{totals['fill_total'] / totals['fill_count']:.0%}** of their spots"
+    return hint + "."
+
+
+def _stats_document(firestore_cog, guild_id):
+    return firestore_cog.db.collection(STATS_COLLECTION).document(str(guild_id))
+
+
+async def load_usage(firestore_cog, guild_id) -> GuildUsage:
+    """Merge a guild's stored counters into memory once; later calls cost no reads."""
+    guild_id = int(guild_id)
+    if guild_id in _loaded:
+        return _usage[guild_id]
+    async with _lock_for(guild_id):
+        if guild_id not in _loaded:
+            stored = await firestore_cog.run_blocking(
+                "load_guild_stats", lambda gid: _stats_document(firestore_cog, gid).get().to_dict(), guild_id
+            )
+            usage = GuildUsage.from_document(stored)
+            # Increments recorded before (and during) the read are added on top
+            if guild_id in _usage:
+                usage.merge(_usage[guild_id])
+            _usage[guild_id] = usage
+            _loaded.add(guild_id)
+    return _usage[guild_id]
+
+
+async def flush_usage(firestore_cog) -> int:
+    """Write every guild with pending increments, one document each."""
+    written = 0
+    for guild_id in list(_dirty):
+        try:
+            with tag_operations("usage stats flush", guild_id):
+                usage = await load_usage(firestore_cog, guild_id)
+                _dirty.discard(guild_id)
+                await firestore_cog.run_blocking(
+                    "save_guild_stats",
+                    lambda gid, document: _stats_document(firestore_cog, gid).set(document),
+                    guild_id, usage.to_document()
+                )
+            written += 1
+        except Exception as e:
+            _dirty.add(guild_id)
+            print(f"Error writing usage stats for guild {guild_id}: {e}")
+    return written
+
+
+def flush_usage_now(firestore_cog) -> int:
+    """Write every guild with pending increments straight away (blocking).
+
+    For shutdown, once bot.run has returned and the loop can't run flush_usage.
+    Guilds never loaded are merged with their stored document first.
+    """
+    written = 0
+    for guild_id in list(_dirty):
+        try:
+            document = _stats_document(firestore_cog, guild_id)
+            usage = _usage[guild_id]
+            if guild_id not in _loaded:
+                stored = GuildUsage.from_document(document.get().to_dict())
+                stored.merge(usage)
+                usage = _usage[guild_id] = stored
+                _loaded.add(guild_id)
+            document.set(usage.to_document())
+            _dirty.discard(guild_id)
+            written += 1
+        except Exception as e:
+            print(f"Error writing usage stats for guild {guild_id}: {e}")
+    return written
+
+
+class UsageStats(commands.Cog):
+    """Cog that writes guild usage counters behind and serves /scout_stats from memory."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.flush_task = None
+        print("UsageStats cog initialized.")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush_periodically())
+
+    async def flush_periodically(self):
+        while True:
+            await asyncio.sleep(STATS_FLUSH_SECONDS)
+            firestore_cog = get_storage(self.bot)
+            if firestore_cog:
+                await flush_usage(firestore_cog)
+
+    def cog_unload(self):
+        if self.flush_task:
+            self.flush_task.cancel()
+        # Write counters since the last flush without blocking the loop; on /reload the new
+        # instance also receives them through export_state. main() flushes after bot.run returns.
+        firestore_cog = get_storage(self.bot)
+        if firestore_cog and _dirty:
+            try:
+                asyncio.get_running_loop().create_task(flush_usage(firestore_cog))
+            except RuntimeError:
+                pass  # Loop already stopped
+
+    def export_state(self) -> dict:
+        return {"usage": _usage, "loaded": _loaded, "dirty": _dirty, "locks": _locks}
+
+    def import_state(self, state: dict):
+        # Modules that imported the record_* helpers before the reload still update the old dicts
+        global _usage, _loaded, _dirty, _locks
+        _usage, _loaded, _dirty, _locks = state["usage"], state["loaded"], state["dirty"], state["locks"]
+        if self.bot.is_ready() and self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush_periodically())
+
+    @commands.slash_command(
+        name="scout_stats",
+        description="Show this server's session activity: popular games, peak hours and fill rates."
+    )
+    @commands.has_permissions(administrator=True)
+    async def scout_stats(
+        self,
+        interaction: discord.Interaction,
+        days: discord.Option(int, "How many days to cover (1-30)", min_value=1, max_value=STATS_DAYS, default=7),
+    ):
+        """Renders the guild's rolling usage aggregates."""
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
+
+        guild_id = interaction.guild.id
+        await load_usage(firestore_cog, guild_id)
+        totals = usage_totals(guild_id, days)
+        session_limit = await cached_session_limit(guild_id, firestore_cog)
+        today = usage_totals(guild_id, 1)
+
+        embed = discord.Embed(title=f"📊 Session stats for the last {days} day(s)", color=discord.Color.blue())
+        embed.add_field(
+            name="Sessions",
+            value=(
+                f"**{totals['sessions']}** started ({totals['sessions'] / days:.1f}/day)\n"
+                f"{totals['completed']} completed, {totals['canceled']} canceled"
+            ),
+            inline=False
+        )
+        if totals["games"]:
+            embed.add_field(
+                name="Popular games",
+                value="\n".join(f"{name}: {count}" for name, count in totals["games"].most_common(5)),
+                inline=True
+            )
+        if totals["hours"]:
+            embed.add_field(
+                name="Peak hours",
+                value="\n".join(
+                    f"{hour:02d}:00 – {count} session(s)" for hour, count in totals["hours"].most_common(3)
+                ),
+                inline=True
+            )
+        fill = f"{totals['fill_total'] / totals['fill_count']:.0%}" if totals["fill_count"] else "n/a"
+        embed.add_field(
+            name="Players",
+            value=(
+                f"Average fill: **{fill}**\n"
+                f"{totals['joins']} joins, {totals['withdrawals']} withdrawals, {totals['waitlisted']} waitlisted"
+            ),
+            inline=False
+        )
+        plan_text = f"Started today: **{today['sessions']}** of {session_limit} allowed per day"
+        if totals["days_at_limit"]:
+            plan_text += f"\nLimit reached on {totals['days_at_limit']} of {days} day(s)"
+        embed.add_field(name="Plan limit", value=plan_text, inline=False)
+        embed.set_footer(text=f"Hours are in {_local_time(guild_id).tzinfo.zone}.")
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @scout_stats.error
+    async def scout_stats_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the scout_stats command."""
+        if isinstance(error, commands.MissingPermissions):
+            await interaction.response.send_message(
+                "You need Administrator permissions to run this command.",
+                ephemeral=True
+            )
+        elif is_storage_unavailable(error):
+            await interaction.response.send_message(STORAGE_UNAVAILABLE_MESSAGE, ephemeral=True)
+        else:
+            await interaction.response.send_message(
+                "An unexpected error occurred while executing the command. Please try again later.",
+                ephemeral=True
+            )
+            print(f"Unexpected error in /scout_stats: {error}")
+
+
+def setup(bot):
+    bot.add_cog(UsageStats(bot))
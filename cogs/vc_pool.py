@@ -0,0 +1,297 @@
+# cogs/vc_pool.py
+import asyncio
+import math
+import time
+from collections import deque
+import discord
+from discord.ext import commands
+from cogs.config_store import cached_config, load_config, update_config
+from cogs.storage import get_storage
+
+POOL_CHANNEL_NAME = "scout-master-standby"  # Name of idle, hidden pool channels
+MAX_POOL_SIZE = 10                          # Upper bound for the per-guild setting
+RATE_WINDOW_SECONDS = 3600                  # Window used to measure the recruit rate
+POOL_LEAD_SECONDS = 900                     # Keep enough channels for this much demand
+REFILL_DELAY_SECONDS = 2                    # Pause between creations (and deletions) of pool channels
+SCRUB_MESSAGE_LIMIT = 100                   # More messages than one bulk delete: delete the channel instead
+
+
+def hidden_overwrites(guild: discord.Guild) -> dict:
+    """Overwrites for an idle pool channel: invisible to everyone but the bot."""
+    return {
+        guild.default_role: discord.PermissionOverwrite(view_channel=False, connect=False),
+        guild.me: discord.PermissionOverwrite(view_channel=True, connect=True, manage_channels=True),
+    }
+
+
+class VoiceChannelPool(commands.Cog):
+    """Cog that keeps a per-guild pool of pre-created, hidden voice channels."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.pools = {}          # guild_id -> deque of idle voice channel IDs
+        self.recruit_times = {}  # guild_id -> deque of recent recruit timestamps
+        self.refill_tasks = {}   # guild_id -> running refill task
+        print("VoiceChannelPool cog initialized.")
+
+    def _pool(self, guild_id: int) -> deque:
+        pool = self.pools.get(guild_id)
+        if pool is None:
+            pool = self.pools[guild_id] = deque()
+        return pool
+
+    def _record_recruit(self, guild_id: int):
+        times = self.recruit_times.get(guild_id)
+        if times is None:
+            times = self.recruit_times[guild_id] = deque()
+        now = time.time()
+        times.append(now)
+        while times and times[0] < now - RATE_WINDOW_SECONDS:
+            times.popleft()
+
+    def target_size(self, guild_id: int, configured_size: int) -> int:
+        """Pool size tuned from the recent recruit rate, capped by the guild setting."""
+        if configured_size <= 0:
+            return 0
+        times = self.recruit_times.get(guild_id, ())
+        cutoff = time.time() - RATE_WINDOW_SECONDS
+        recent = sum(1 for t in times if t >= cutoff)
+        expected = math.ceil(recent * POOL_LEAD_SECONDS / RATE_WINDOW_SECONDS)
+        return max(1, min(configured_size, expected))
+
+    async def acquire(self, guild: discord.Guild, category: discord.CategoryChannel,
+                      name: str, overwrites: dict, configured_size: int):
+        """Take a pooled channel, rename and re-permission it for a session.
+
+        Returns None when the pool is disabled or empty, in which case the
+        caller creates a channel as usual.
+        """
+        if configured_size <= 0:
+            if self.pools.get(guild.id):
+                # Pooling was turned off; don't leave the idle channels behind
+                self._schedule_drain(guild)
+            return None
+        self._record_recruit(guild.id)
+
+        pool = self._pool(guild.id)
+        vc = None
+        while pool and vc is None:
+            candidate = guild.get_channel(pool.popleft())
+            if isinstance(candidate, discord.VoiceChannel) and candidate.category_id == category.id:
+                vc = candidate
+
+        self._schedule_refill(guild, category, configured_size)
+        if vc is None:
+            print(f"Voice channel pool empty for guild {guild.id}.")
+            return None
+
+        try:
+            await vc.edit(name=name, overwrites=overwrites, reason="Scout Master session started.")
+            print(f"Reused pooled voice channel {vc.id} for '{name}'.")
+            return vc
+        except discord.HTTPException as e:
+            print(f"Failed to prepare pooled voice channel {vc.id}: {e}")
+            # Already out of the pool; delete it rather than leak a hidden channel
+            await self._delete_channel(vc, "Scout Master: pooled voice channel could not be prepared.")
+            return None
+
+    async def release(self, vc: discord.VoiceChannel, reason: str) -> bool:
+        """Scrub a finished session's channel back into the pool.
+
+        Returns False when the channel should be deleted instead (pooling
+        disabled, pool already full, or the scrub failed).
+        """
+        guild = vc.guild
+        config = cached_config(guild.id) or {}
+        configured_size = config.get("vc_pool_size", 0)
+        pool = self._pool(guild.id)
+        if (
+            len(pool) >= self.target_size(guild.id, configured_size)
+            or vc.category_id != config.get("category_id")
+        ):
+            return False
+
+        try:
+            # One bulk delete at most; a busier chat is cheaper to replace than to scrub
+            messages = await vc.history(limit=SCRUB_MESSAGE_LIMIT + 1).flatten()
+            if len(messages) > SCRUB_MESSAGE_LIMIT:
+                return False
+            for member in list(vc.members):
+                await member.move_to(None, reason=reason)
+            if messages:
+                await vc.delete_messages(messages)
+            await vc.edit(name=POOL_CHANNEL_NAME, overwrites=hidden_overwrites(guild), reason=reason)
+        except discord.HTTPException as e:
+            print(f"Failed to scrub voice channel {vc.id} for the pool: {e}")
+            return False
+
+        pool.append(vc.id)
+        print(f"Returned voice channel {vc.id} to the pool for guild {guild.id} ({len(pool)} idle).")
+        return True
+
+    def adopt(self, vc: discord.VoiceChannel) -> bool:
+        """Take a stray standby channel (e.g. one created before a restart) into the pool.
+
+        Returns False when there is no room for it and it should be deleted.
+        """
+        config = cached_config(vc.guild.id) or {}
+        pool = self._pool(vc.guild.id)
+        if vc.id in pool:
+            return True
+        if (
+            vc.category_id != config.get("category_id")
+            or len(pool) >= self.target_size(vc.guild.id, config.get("vc_pool_size", 0))
+        ):
+            return False
+        pool.append(vc.id)
+        print(f"Adopted standby voice channel {vc.id} into the pool for guild {vc.guild.id}.")
+        return True
+
+    async def _delete_channel(self, vc: discord.VoiceChannel, reason: str):
+        try:
+            await vc.delete(reason=reason)
+        except discord.NotFound:
+            pass
+        except discord.HTTPException as e:
+            print(f"Failed to delete pooled voice channel {vc.id}: {e}")
+
+    def _schedule_drain(self, guild):
+        task = self.refill_tasks.get(guild.id)
+        if task and not task.done():
+            # A refill still running with the old size would undo the drain
+            task.cancel()
+        self.refill_tasks[guild.id] = asyncio.create_task(self._drain(guild))
+
+    async def _drain(self, guild):
+        """Delete every idle channel of a guild whose pool has been disabled."""
+        pool = self._pool(guild.id)
+        while pool:
+            vc = guild.get_channel(pool.popleft())
+            if isinstance(vc, discord.VoiceChannel):
+                await self._delete_channel(vc, "Scout Master: voice channel pool disabled.")
+                await asyncio.sleep(REFILL_DELAY_SECONDS)
+
+    def _schedule_refill(self, guild, category, configured_size: int):
+        task = self.refill_tasks.get(guild.id)
+        if task and not task.done():
+            return
+        self.refill_tasks[guild.id] = asyncio.create_task(
+            self._refill(guild, category, configured_size)
+        )
+
+    async def _refill(self, guild, category, configured_size: int):
+        pool = self._pool(guild.id)
+        while len(pool) < self.target_size(guild.id, configured_size):
+            try:
+                vc = await guild.create_voice_channel(
+                    name=POOL_CHANNEL_NAME,
+                    category=category,
+                    overwrites=hidden_overwrites(guild),
+                    reason="Scout Master voice channel pool.",
+                )
+            except discord.HTTPException as e:
+                print(f"Failed to create pooled voice channel in guild {guild.id}: {e}")
+                return
+            pool.append(vc.id)
+            print(f"Added voice channel {vc.id} to the pool for guild {guild.id} ({len(pool)} idle).")
+            await asyncio.sleep(REFILL_DELAY_SECONDS)
+
+    def export_state(self) -> dict:
+        # Refill tasks keep running against these same deques
+        return {"pools": self.pools, "recruit_times": self.recruit_times, "refill_tasks": self.refill_tasks}
+
+    def import_state(self, state: dict):
+        self.pools = state["pools"]
+        self.recruit_times = state["recruit_times"]
+        self.refill_tasks = state["refill_tasks"]
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Adopt idle pool channels left over from the previous run, within the
+        # guild's current pool size; surplus and disabled-pool channels are deleted
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            print("FirestoreCog not found. Leftover pool channels not adopted.")
+            return
+        standby = {}
+        for guild in self.bot.guilds:
+            channels = [vc for vc in guild.voice_channels if vc.name == POOL_CHANNEL_NAME]
+            if channels:
+                standby[guild] = channels
+        # Read every affected guild's config at once rather than one guild after another
+        configs = await asyncio.gather(
+            *(load_config(firestore_cog, guild.id) for guild in standby), return_exceptions=True
+        )
+        adopted = deleted = 0
+        for (guild, channels), config in zip(standby.items(), configs):
+            if isinstance(config, Exception):
+                # Without the config we can't tell surplus from wanted; leave them for the reaper
+                print(f"Error loading config for guild {guild.id}; pool channels left as they are: {config}")
+                continue
+            for vc in channels:
+                if vc.id in self.pools.get(guild.id, ()):
+                    continue
+                if self.adopt(vc):
+                    adopted += 1
+                elif not vc.members:
+                    await self._delete_channel(vc, "Scout Master: surplus voice channel pool channel.")
+                    deleted += 1
+                    await asyncio.sleep(REFILL_DELAY_SECONDS)
+        print(f"Adopted {adopted} pooled voice channels and deleted {deleted} surplus ones.")
+
+    @commands.slash_command(
+        name="set_voice_pool_size",
+        description="Keep up to this many hidden voice channels ready for new sessions (0 to disable)."
+    )
+    @commands.has_permissions(administrator=True)
+    async def set_voice_pool_size(self, interaction: discord.Interaction, size: int):
+        """Configures the maximum size of the guild's voice channel pool."""
+        if size < 0 or size > MAX_POOL_SIZE:
+            await interaction.response.send_message(
+                f"Please choose a pool size between 0 and {MAX_POOL_SIZE}.",
+                ephemeral=True
+            )
+            return
+
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
+
+        await update_config(firestore_cog, interaction.guild.id, {"vc_pool_size": size})
+        if size == 0:
+            message = "Voice channel pool disabled. Idle pool channels are being removed."
+            self._schedule_drain(interaction.guild)
+        else:
+            message = (
+                f"Scout Master will keep up to **{size}** hidden voice channel(s) ready, "
+                "scaled to how often your members start sessions."
+            )
+        await interaction.response.send_message(message, ephemeral=True)
+
+    @set_voice_pool_size.error
+    async def set_voice_pool_size_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the set_voice_pool_size command."""
+        if isinstance(error, commands.MissingPermissions):
+            await interaction.response.send_message(
+                "You need Administrator permissions to run this command.",
+                ephemeral=True
+            )
+        else:
+            await interaction.response.send_message(
+                "An unexpected error occurred while executing the command. Please try again later.",
+                ephemeral=True
+            )
+            print(f"Unexpected error in /set_voice_pool_size: {error}")
+
+
+async def release_voice_channel(bot, vc: discord.VoiceChannel, reason: str):
+    """Return a session's voice channel to the pool, or delete it."""
+    pool = bot.get_cog('VoiceChannelPool')
+    if pool and await pool.release(vc, reason):
+        return
+    await vc.delete(reason=reason)
+
+
+def setup(bot):
+    bot.add_cog(VoiceChannelPool(bot))
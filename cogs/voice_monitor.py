@@ -0,0 +1,157 @@
+# cogs/voice_monitor.py
+import asyncio
+import time
+import discord
+from discord.ext import commands
+from cogs.config_store import cached_config, update_config
+from cogs.storage import get_storage
+from cogs.session_index import active_sessions
+
+DEFAULT_EMPTY_GRACE_MINUTES = 15  # Used when a guild hasn't configured its own
+MAX_EMPTY_GRACE_MINUTES = 240
+
+
+def is_empty(vc: discord.VoiceChannel) -> bool:
+    """A session channel counts as empty when no human member is connected."""
+    return not any(not member.bot for member in vc.members)
+
+
+class VoiceMonitor(commands.Cog):
+    """Cog that ends sessions whose voice channel stays empty for a grace period."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.empty_timers = {}  # session_id -> pending auto-end task
+        self.deadlines = {}     # session_id -> time the pending auto-end fires
+        print("VoiceMonitor cog initialized.")
+
+    def grace_seconds(self, guild_id: int) -> int:
+        config = cached_config(guild_id) or {}
+        return int(config.get("empty_session_grace_minutes", DEFAULT_EMPTY_GRACE_MINUTES)) * 60
+
+    def watch(self, session_id: str):
+        """Start the empty-channel clock for a session whose voice channel just opened.
+
+        Only sessions with a parsed start time are watched, and the clock
+        counts from that start. An unparsed game_time ("Saturday 9pm") may
+        be an announced future session; those are only armed once someone
+        has used the channel and left it (see on_voice_state_update).
+        """
+        entry = active_sessions.get(session_id)
+        if not entry or not entry.vc_id or entry.scheduled_start is None:
+            return
+        vc = self.bot.get_channel(entry.vc_id)
+        if vc and is_empty(vc):
+            grace = self.grace_seconds(entry.guild_id)
+            if grace > 0:
+                grace += max(0, entry.scheduled_start - time.time())
+            self._arm(session_id, entry.guild_id, grace=grace)
+
+    def _arm(self, session_id: str, guild_id: int, grace: float = None):
+        if grace is None:
+            grace = self.grace_seconds(guild_id)
+        if grace <= 0 or session_id in self.empty_timers:
+            return
+        self.deadlines[session_id] = time.time() + grace
+        self.empty_timers[session_id] = asyncio.create_task(self._end_if_still_empty(session_id, grace))
+
+    def _disarm(self, session_id: str):
+        self.deadlines.pop(session_id, None)
+        task = self.empty_timers.pop(session_id, None)
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _end_if_still_empty(self, session_id: str, grace: int):
+        try:
+            await asyncio.sleep(grace)
+        except asyncio.CancelledError:
+            return
+        self.empty_timers.pop(session_id, None)
+        self.deadlines.pop(session_id, None)
+
+        entry = active_sessions.get(session_id)
+        if not entry or not entry.vc_id:
+            return
+        vc = self.bot.get_channel(entry.vc_id)
+        if vc and not is_empty(vc):
+            return
+
+        print(f"Voice channel for session {session_id} was empty for {grace} seconds. Ending session.")
+        recruitment_cog = self.bot.get_cog('Recruitment')
+        if recruitment_cog:
+            await recruitment_cog.end_session(session_id)
+
+    @commands.Cog.listener()
+    async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        if before.channel == after.channel or member.bot:
+            return
+
+        if after.channel:
+            entry = active_sessions.for_vc(after.channel.id)
+            if entry:
+                self._disarm(entry.session_id)
+
+        if before.channel and is_empty(before.channel):
+            entry = active_sessions.for_vc(before.channel.id)
+            if entry:
+                self._arm(entry.session_id, entry.guild_id)
+
+    def cog_unload(self):
+        for task in self.empty_timers.values():
+            task.cancel()
+        self.empty_timers.clear()
+
+    def export_state(self) -> dict:
+        return {"deadlines": dict(self.deadlines)}
+
+    def import_state(self, state: dict):
+        # Re-arm with the time that was left, so a reload doesn't extend the grace period
+        for session_id, deadline in state["deadlines"].items():
+            entry = active_sessions.get(session_id)
+            if entry:
+                self._arm(session_id, entry.guild_id, grace=max(1, deadline - time.time()))
+
+    @commands.slash_command(
+        name="set_empty_session_timeout",
+        description="End sessions whose voice channel stays empty this many minutes (0 to disable)."
+    )
+    @commands.has_permissions(administrator=True)
+    async def set_empty_session_timeout(self, interaction: discord.Interaction, minutes: int):
+        """Configures the grace period before empty sessions are ended."""
+        if minutes < 0 or minutes > MAX_EMPTY_GRACE_MINUTES:
+            await interaction.response.send_message(
+                f"Please choose a value between 0 and {MAX_EMPTY_GRACE_MINUTES} minutes.",
+                ephemeral=True
+            )
+            return
+
+        firestore_cog = get_storage(self.bot)
+        if not firestore_cog:
+            await interaction.response.send_message("Internal error: FirestoreCog not found.", ephemeral=True)
+            return
+
+        await update_config(firestore_cog, interaction.guild.id, {"empty_session_grace_minutes": minutes})
+        if minutes == 0:
+            message = "Empty sessions will no longer be ended early."
+        else:
+            message = f"Sessions will end automatically once their voice channel has been empty for **{minutes}** minute(s)."
+        await interaction.response.send_message(message, ephemeral=True)
+
+    @set_empty_session_timeout.error
+    async def set_empty_session_timeout_error(self, interaction: discord.Interaction, error: commands.CommandError):
+        """Error handler for the set_empty_session_timeout command."""
+        if isinstance(error, commands.MissingPermissions):
+            await interaction.response.send_message(
+                "You need Administrator permissions to run this command.",
+                ephemeral=True
+            )
+        else:
+            await interaction.response.send_message(
+                "An unexpected error occurred while executing the command. Please try again later.",
+                ephemeral=True
+            )
+            print(f"Unexpected error in /set_empty_session_timeout: {error}")
+
+
+def setup(bot):
+    bot.add_cog(VoiceMonitor(bot))
@@ -0,0 +1,165 @@
+# cogs/warm_start.py
+import asyncio
+import json
+import os
+import struct
+import time
+import zlib
+from discord.ext import commands
+from cogs.config_store import export_configs, import_configs
+from cogs.game_index import export_games, import_games
+from cogs.plan_cache import export_entries, import_entries
+from cogs.session_index import active_sessions
+from cogs.session_model import Session
+
+SNAPSHOT_PATH = os.getenv("SCOUT_SNAPSHOT_PATH", "cache/warm_start.bin")
+SNAPSHOT_INTERVAL_SECONDS = 300   # How often the caches are written out
+SNAPSHOT_MAX_AGE_SECONDS = 86400  # Older snapshots are ignored at boot
+SNAPSHOT_MAGIC = b"SCWS"
+SNAPSHOT_VERSION = 1
+
+_LENGTH = struct.Struct("<I")
+
+
+def build_snapshot() -> bytes:
+    """Serialize the config, plan, game name and live-session caches.
+
+    Layout: magic, version byte, then a zlib stream holding a length-prefixed
+    JSON header (configs, plan entries and game names) followed by a count and
+    length-prefixed Session.encode() records.
+    """
+    configs = {}
+    for guild_id, config in export_configs().items():
+        try:
+            json.dumps(config)
+        except (TypeError, ValueError):
+            continue  # Not plain data; it will be read from storage instead
+        configs[str(guild_id)] = config
+    header = json.dumps(
+        {"saved_at": time.time(), "configs": configs, "plans": export_entries(), "games": export_games()},
+        separators=(",", ":")
+    ).encode("utf-8")
+
+    sessions = [session.encode() for session in active_sessions.sessions.values()]
+    parts = [_LENGTH.pack(len(header)), header, _LENGTH.pack(len(sessions))]
+    for record in sessions:
+        parts += [_LENGTH.pack(len(record)), record]
+    return SNAPSHOT_MAGIC + bytes((SNAPSHOT_VERSION,)) + zlib.compress(b"".join(parts))
+
+
+def write_snapshot(data: bytes, path: str = SNAPSHOT_PATH):
+    """Write a snapshot atomically so a crash mid-write never leaves a torn file."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as snapshot_file:
+        snapshot_file.write(data)
+    os.replace(temp_path, path)
+
+
+def save_snapshot(path: str = SNAPSHOT_PATH):
+    try:
+        data = build_snapshot()
+        write_snapshot(data, path)
+        print(f"Saved warm-start snapshot ({len(data)} bytes).")
+    except Exception as e:
+        print(f"Error saving warm-start snapshot: {e}")
+
+
+def load_snapshot(path: str = SNAPSHOT_PATH) -> bool:
+    """Seed the caches from the last snapshot. Call before the gateway connects.
+
+    Configs and plan entries are revalidated lazily on first use; game
+    names are topped up from newer archive days on ready; sessions are
+    resumed on ready and reconciled with storage in the background.
+    """
+    try:
+        with open(path, "rb") as snapshot_file:
+            data = snapshot_file.read()
+    except FileNotFoundError:
+        print("No warm-start snapshot found. Starting cold.")
+        return False
+    except OSError as e:
+        print(f"Error reading warm-start snapshot: {e}")
+        return False
+
+    try:
+        if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC or data[len(SNAPSHOT_MAGIC)] != SNAPSHOT_VERSION:
+            print("Warm-start snapshot has an unknown format. Starting cold.")
+            return False
+        body = zlib.decompress(data[len(SNAPSHOT_MAGIC) + 1:])
+        (header_length,) = _LENGTH.unpack_from(body, 0)
+        offset = _LENGTH.size
+        header = json.loads(body[offset:offset + header_length])
+        offset += header_length
+
+        age = time.time() - header.get("saved_at", 0)
+        if age > SNAPSHOT_MAX_AGE_SECONDS:
+            print(f"Warm-start snapshot is {age / 3600:.0f} hours old. Starting cold.")
+            return False
+
+        (count,) = _LENGTH.unpack_from(body, offset)
+        offset += _LENGTH.size
+        sessions = []
+        for _ in range(count):
+            (length,) = _LENGTH.unpack_from(body, offset)
+            offset += _LENGTH.size
+            sessions.append(Session.decode(body[offset:offset + length]))
+            offset += length
+    except Exception as e:
+        print(f"Warm-start snapshot is unreadable ({e}). Starting cold.")
+        return False
+
+    import_configs(header.get("configs", {}))
+    import_entries(header.get("plans", {}))
+    if "games" in header:
+        # Snapshots from before game names were saved leave the index to a full archive read
+        import_games(header["games"], header["saved_at"])
+    for session in sessions:
+        active_sessions.add(session)
+    print(
+        f"Loaded warm-start snapshot from {age:.0f}s ago: {len(header.get('configs', {}))} configs, "
+        f"{len(sessions)} live sessions."
+    )
+    return True
+
+
+class WarmStart(commands.Cog):
+    """Cog that periodically snapshots the in-memory caches for the next boot."""
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.task = None
+        print("WarmStart cog initialized.")
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        if self.task is None:
+            self.task = asyncio.create_task(self.snapshot_periodically())
+
+    async def snapshot_periodically(self):
+        while True:
+            await asyncio.sleep(SNAPSHOT_INTERVAL_SECONDS)
+            try:
+                # Build on the event loop (the caches aren't thread-safe), write in a thread
+                data = build_snapshot()
+                await asyncio.to_thread(write_snapshot, data)
+            except Exception as e:
+                print(f"Error saving warm-start snapshot: {e}")
+
+    def cog_unload(self):
+        if self.task:
+            self.task.cancel()
+        save_snapshot()
+
+    def export_state(self) -> dict:
+        return {}
+
+    def import_state(self, state: dict):
+        if self.bot.is_ready() and self.task is None:
+            self.task = asyncio.create_task(self.snapshot_periodically())
+
+
+def setup(bot):
+    bot.add_cog(WarmStart(bot))
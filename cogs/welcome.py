@@ -1,5 +1,6 @@
 import discord
 from discord.ext import commands
+from cogs.command_sync import command_mention
 
 
 class Welcome(commands.Cog):
@@ -13,7 +14,7 @@ class Welcome(commands.Cog):
     async def on_guild_join(self, guild: discord.Guild):
         welcome_message = (
             "🎉 **Scout Master by Storytellers of the Apocalypse has joined your server! YAY!** 🎉\n\n"
-            "To get started, use </setup_scout_master:1330805308125347907> to configure your server. 🚀\n"
+            f"To get started, use {command_mention('setup_scout_master')} to configure your server. 🚀\n"
             "If you need help, check the documentation or contact support!"
             
         )